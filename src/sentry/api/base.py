@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import functools
 import logging
 import time
@@ -18,13 +19,13 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.authentication import BaseAuthentication, SessionAuthentication
 from rest_framework.exceptions import ParseError
-from rest_framework.permissions import BasePermission
+from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from sentry_sdk import Scope
 
-from sentry import analytics, options, tsdb
+from sentry import analytics, features, options, tsdb
 from sentry.api.api_owners import ApiOwner
 from sentry.api.api_publish_status import ApiPublishStatus
 from sentry.api.exceptions import StaffRequired, SuperuserRequired
@@ -449,7 +450,14 @@ class Endpoint(APIView):
                     getattr(part, "__name__", None) or str(part) for part in (type(self), handler)
                 ),
             ) as span:
-                response = handler(request, *args, **kwargs)
+                # Feature checks are memoized for the duration of read-only
+                # requests, writes may change what the features depend on.
+                if request.method in SAFE_METHODS:
+                    evaluation_scope = features.evaluation_scope()
+                else:
+                    evaluation_scope = contextlib.nullcontext()
+                with evaluation_scope:
+                    response = handler(request, *args, **kwargs)
 
         except Exception as exc:
             response = self.handle_exception(request, exc)
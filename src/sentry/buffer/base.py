@@ -32,6 +32,7 @@ class Buffer(Service):
         "validate",
         "push_to_sorted_set",
         "push_to_hash",
+        "push_to_hash_bulk",
         "get_sorted_set",
         "get_hash",
         "delete_hash",
@@ -69,6 +70,14 @@ class Buffer(Service):
     ) -> None:
         return None
 
+    def push_to_hash_bulk(
+        self,
+        model: type[models.Model],
+        filters: dict[str, models.Model | str | int],
+        data: dict[str, str],
+    ) -> None:
+        return None
+
     def delete_hash(
         self,
         model: type[models.Model],
@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import pickle
 import threading
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import date, datetime, timezone
 from enum import Enum
 from time import time
@@ -296,6 +297,19 @@ class RedisBuffer(Buffer):
         key = self._make_key(model, filters)
         self._execute_redis_operation(key, RedisOperation.HASH_ADD, field, value)
 
+    def push_to_hash_bulk(
+        self,
+        model: type[models.Model],
+        filters: dict[str, models.Model | str | int],
+        data: dict[str, str],
+    ) -> None:
+        key = self._make_key(model, filters)
+        metrics.incr(f"redis_buffer.{RedisOperation.HASH_ADD.value}")
+        pipe = self.get_redis_connection(self.pending_key)
+        pipe.hset(key, mapping=data)
+        pipe.expire(key, self.key_expire)
+        pipe.execute()
+
     def get_hash(
         self, model: type[models.Model], field: dict[str, models.Model | str | int]
     ) -> dict[str, str]:
@@ -428,9 +442,10 @@ class RedisBuffer(Buffer):
         if key is not None:
             batch_keys = [key]
 
-        if batch_keys is not None:
-            for key in batch_keys:
-                self._process_single_incr(key)
+        if batch_keys:
+            metrics.distribution("buffer.flush.batch-size", len(batch_keys))
+            with metrics.timer("buffer.flush.duration"):
+                self._process_batch_incr(batch_keys)
 
     def _process(
         self,
@@ -442,54 +457,111 @@ class RedisBuffer(Buffer):
     ) -> Any:
         return super().process(model, columns, filters, extra, signal_only)
 
-    def _process_single_incr(self, key: str) -> None:
-        client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
-        lock_key = self._lock_key(client, key, ex=10)
-        if not lock_key:
-            metrics.incr("buffer.revoked", tags={"reason": "locked"}, skip_internal=False)
-            logger.debug("buffer.revoked.locked", extra={"redis_key": key})
+    def _execute_many(
+        self,
+        keys: Sequence[str],
+        queue_commands: Callable[[Pipeline, str], object],
+        commands_per_key: int = 1,
+    ) -> dict[str, Any]:
+        """
+        Runs the commands queued by `queue_commands` for every key, using a
+        single pipeline per Redis node instead of one round trip per key.
+
+        Returns the result of the first command queued for each key.
+        """
+        keys_by_node: dict[Any, list[str]] = defaultdict(list)
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            # The cluster pipeline takes care of routing commands to the
+            # right nodes on its own.
+            keys_by_node[None] = list(keys)
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            router = self.cluster.get_router()
+            for key in keys:
+                keys_by_node[router.get_host_for_key(key)].append(key)
+        else:
+            raise AssertionError("unreachable")
+
+        results = {}
+        for node_keys in keys_by_node.values():
+            pipe = self.get_redis_connection(node_keys[0], transaction=False)
+            for key in node_keys:
+                queue_commands(pipe, key)
+            values = pipe.execute()
+            for i, key in enumerate(node_keys):
+                results[key] = values[i * commands_per_key]
+        return results
+
+    def _process_batch_incr(self, keys: list[str]) -> None:
+        lock_keys = {key: self._make_lock_key(key) for key in keys}
+        acquired = self._execute_many(
+            list(lock_keys.values()),
+            lambda pipe, lock_key: pipe.set(lock_key, "1", nx=True, ex=10),
+        )
+
+        locked_keys = []
+        for key in keys:
+            if acquired[lock_keys[key]]:
+                locked_keys.append(key)
+            else:
+                metrics.incr("buffer.revoked", tags={"reason": "locked"}, skip_internal=False)
+                logger.debug("buffer.revoked.locked", extra={"redis_key": key})
+
+        if not locked_keys:
             return
 
-        try:
-            pipe = self.get_redis_connection(key, transaction=False)
+        def queue_flush(pipe: Pipeline, key: str) -> None:
             pipe.hgetall(key)
             pipe.zrem(self.pending_key, key)
             pipe.delete(key)
-            values = pipe.execute()[0]
 
-            # XXX(python3): In python2 this isn't as important since redis will
-            # return string tyes (be it, byte strings), but in py3 we get bytes
-            # back, and really we just want to deal with keys as strings.
-            values = {force_str(k): v for k, v in values.items()}
+        try:
+            values_by_key = self._execute_many(locked_keys, queue_flush, commands_per_key=3)
+            for key in locked_keys:
+                # The buffered values are already gone from Redis at this
+                # point, so one bad key must not take the rest of the batch
+                # down with it.
+                try:
+                    self._process_values(key, values_by_key[key])
+                except Exception:
+                    logger.exception("buffer.process.error", extra={"redis_key": key})
+        finally:
+            self._execute_many(
+                [lock_keys[key] for key in locked_keys],
+                lambda pipe, lock_key: pipe.delete(lock_key),
+            )
+
+    def _process_values(self, key: str, values: dict[Any, Any]) -> None:
+        # XXX(python3): In python2 this isn't as important since redis will
+        # return string tyes (be it, byte strings), but in py3 we get bytes
+        # back, and really we just want to deal with keys as strings.
+        values = {force_str(k): v for k, v in values.items()}
+
+        if not values:
+            metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
+            logger.debug("buffer.revoked.empty", extra={"redis_key": key})
+            return
 
-            if not values:
-                metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
-                logger.debug("buffer.revoked.empty", extra={"redis_key": key})
-                return
+        model = import_string(force_str(values.pop("m")))
 
-            model = import_string(force_str(values.pop("m")))
+        if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
+            filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        else:
+            # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+            filters = pickle.loads(force_bytes(values.pop("f")))
 
-            if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
-                filters = self._load_values(json.loads(force_str(values.pop("f"))))
-            else:
-                # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                filters = pickle.loads(force_bytes(values.pop("f")))
-
-            incr_values = {}
-            extra_values = {}
-            signal_only = None
-            for k, v in values.items():
-                if k.startswith("i+"):
-                    incr_values[k[2:]] = int(v)
-                elif k.startswith("e+"):
-                    if v.startswith(b"[" if not self.is_redis_cluster else "["):
-                        extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
-                    else:
-                        # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                        extra_values[k[2:]] = pickle.loads(force_bytes(v))
-                elif k == "s":
-                    signal_only = bool(int(v))  # Should be 1 if set
-
-            self._process(model, incr_values, filters, extra_values, signal_only)
-        finally:
-            client.delete(lock_key)
+        incr_values = {}
+        extra_values = {}
+        signal_only = None
+        for k, v in values.items():
+            if k.startswith("i+"):
+                incr_values[k[2:]] = int(v)
+            elif k.startswith("e+"):
+                if v.startswith(b"[" if not self.is_redis_cluster else "["):
+                    extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
+                else:
+                    # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+                    extra_values[k[2:]] = pickle.loads(force_bytes(v))
+            elif k == "s":
+                signal_only = bool(int(v))  # Should be 1 if set
+
+        self._process(model, incr_values, filters, extra_values, signal_only)
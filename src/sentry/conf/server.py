@@ -1667,7 +1667,7 @@ SENTRY_QUOTA_OPTIONS: dict[str, str] = {}
 
 # Cache for Relay project configs
 SENTRY_RELAY_PROJECTCONFIG_CACHE = "sentry.relay.projectconfig_cache.redis.RedisProjectConfigCache"
-SENTRY_RELAY_PROJECTCONFIG_CACHE_OPTIONS: dict[str, str] = {}
+SENTRY_RELAY_PROJECTCONFIG_CACHE_OPTIONS: dict[str, Any] = {}
 
 # Which cache to use for debouncing cache updates to the projectconfig cache
 SENTRY_RELAY_PROJECTCONFIG_DEBOUNCE_CACHE = (
@@ -1698,6 +1698,11 @@ SENTRY_SNUBA_CACHE_TTL_SECONDS = 60
 # Node storage backend
 SENTRY_NODESTORE = "sentry.nodestore.django.DjangoNodeStorage"
 SENTRY_NODESTORE_OPTIONS: dict[str, Any] = {}
+# Paths of zstd dictionaries (see ``sentry.utils.codecs.ZstdDictCodec.train``)
+# used to compress node payloads, keyed by event platform. The "default"
+# dictionary is used for all other platforms. Payloads are not compressed by
+# the nodestore itself if this is empty.
+SENTRY_NODESTORE_COMPRESSION_DICTIONARIES: dict[str, str] = {}
 
 # Node storage backend used for ArtifactBundle indexing (aka FlatFileIndex aka BundleIndex)
 SENTRY_INDEXSTORE = "sentry.nodestore.django.DjangoNodeStorage"
@@ -1748,6 +1753,10 @@ SENTRY_METRICS_DISALLOW_BAD_TAGS = IS_DEV
 SENTRY_METRICS_INDEXER = "sentry.sentry_metrics.indexer.postgres.postgres_v2.PostgresIndexer"
 SENTRY_METRICS_INDEXER_OPTIONS: dict[str, Any] = {}
 SENTRY_METRICS_INDEXER_CACHE_TTL = 3600 * 2
+# Number of entries of the cache shared by all processes of an indexer consumer
+# on the same host, 0 disables it.
+SENTRY_METRICS_INDEXER_SHARED_CACHE_SLOTS = 0
+SENTRY_METRICS_INDEXER_SHARED_CACHE_TTL = 60 * 10
 SENTRY_METRICS_INDEXER_TRANSACTIONS_SAMPLE_RATE = 0.1
 
 SENTRY_METRICS_INDEXER_SPANNER_OPTIONS: dict[str, Any] = {}
@@ -2112,6 +2121,10 @@ SENTRY_OPTIONS: dict[str, Any] = {}
 SENTRY_DEFAULT_OPTIONS: dict[str, Any] = {}
 # Raise an error in dev on failed lookups
 SENTRY_OPTIONS_COMPLAIN_ON_ERRORS = True
+# Interval in seconds at which every process refreshes its snapshot of the
+# options store. Options are read from the snapshot instead of the local
+# cache, network cache and database. Disabled if None.
+SENTRY_OPTIONS_SNAPSHOT_INTERVAL: float | None = None
 
 # You should not change this setting after your database has been created
 # unless you have altered all schemas first
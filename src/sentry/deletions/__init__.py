@@ -119,7 +119,7 @@ def load_defaults():
     default_manager.register(models.GroupCommitResolution, BulkModelDeletionTask)
     default_manager.register(models.GroupEmailThread, BulkModelDeletionTask)
     default_manager.register(models.GroupEnvironment, BulkModelDeletionTask)
-    default_manager.register(models.GroupHash, BulkModelDeletionTask)
+    default_manager.register(models.GroupHash, defaults.GroupHashDeletionTask)
     default_manager.register(models.GroupHistory, BulkModelDeletionTask)
     default_manager.register(models.GroupLink, BulkModelDeletionTask)
     default_manager.register(models.GroupMeta, BulkModelDeletionTask)
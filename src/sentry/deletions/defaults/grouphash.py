@@ -0,0 +1,23 @@
+from ..base import BulkModelDeletionTask
+
+
+class GroupHashDeletionTask(BulkModelDeletionTask):
+    """
+    Deletes grouphashes in bulk, and drops the cached grouphashes of every affected project so that
+    ingest does not keep assigning events to the deleted rows' groups.
+    """
+
+    def delete_instance_bulk(self):
+        from sentry.grouping.ingest.hashing import invalidate_grouphash_cache
+
+        project_ids = set(
+            self.model.objects.filter(**self.query, **(self.partition_key or {}))
+            .values_list("project_id", flat=True)
+            .distinct()
+        )
+
+        try:
+            return super().delete_instance_bulk()
+        finally:
+            for project_id in project_ids:
+                invalidate_grouphash_cache(project_id)
@@ -1,5 +1,6 @@
 import logging
 from collections.abc import Iterable, Mapping
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 from sentry.utils.imports import import_string
@@ -59,7 +60,16 @@ class Backend(Service):
     be transitioned to "waiting" instead.)
     """
 
-    __all__ = ("add", "delete", "digest", "enabled", "maintenance", "schedule", "validate")
+    __all__ = (
+        "add",
+        "delete",
+        "digest",
+        "digest_stream",
+        "enabled",
+        "maintenance",
+        "schedule",
+        "validate",
+    )
 
     def __init__(self, **options: Any) -> None:
         # The ``minimum_delay`` option defines the default minimum amount of
@@ -169,6 +179,34 @@ class Backend(Service):
         """
         raise NotImplementedError
 
+    @contextmanager
+    def digest_stream(
+        self, key: str, minimum_delay: int | None = None, page_size: int = 1000
+    ) -> Any:
+        """
+        Extract records from a timeline for processing, in pages of up to
+        ``page_size`` records.
+
+        This method acts as a context manager like ``digest``, but the target
+        of the ``as`` clause is an iterator of pages (lists of records) that
+        are fetched from the backend as the iterator is consumed, so that only
+        a single page needs to be held in memory at a time.
+
+        If the context manager successfully exits, only the records that were
+        part of the consumed pages are removed from the timeline.
+
+        For example::
+
+            with timelines.digest_stream('project:1') as pages:
+                for records in pages:
+                    builder.add(records)
+
+        Backends that cannot fetch records in pages split the result of
+        ``digest`` instead.
+        """
+        with self.digest(key, minimum_delay=minimum_delay) as records:
+            yield (records[i : i + page_size] for i in range(0, len(records), page_size))
+
     def schedule(
         self, deadline: float, timestamp: float | None = None
     ) -> Iterable["ScheduleEntry"]:
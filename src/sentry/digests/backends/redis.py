@@ -1,6 +1,6 @@
 import logging
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from typing import Any
 
@@ -86,6 +86,14 @@ class RedisBackend(Backend):
         # too early.
         self.ttl = options.pop("ttl", 60 * 60)
 
+        # Sets the maximum number of timelines that are moved to the ready
+        # state by a single scheduling script call, so that scheduling a large
+        # backlog does not block a Redis node for the duration of a single
+        # long running script.
+        self.schedule_batch_size = options.pop("schedule_batch_size", 1000)
+        if self.schedule_batch_size < 1:
+            raise ValueError("Schedule batch size must be at least 1.")
+
         super().__init__(**options)
 
     def validate(self) -> None:
@@ -144,11 +152,24 @@ class RedisBackend(Backend):
     def __schedule_partition(
         self, host: int, deadline: float, timestamp: float
     ) -> Iterable[tuple[bytes, float]]:
-        return script(
-            ["-"],
-            ["SCHEDULE", self.namespace, self.ttl, timestamp, deadline],
-            self.cluster.get_local_client(host),
-        )
+        # Timelines are claimed in batches until the partition has no more
+        # timelines that are ready for processing.
+        while True:
+            response = script(
+                ["-"],
+                [
+                    "SCHEDULE",
+                    self.namespace,
+                    self.ttl,
+                    timestamp,
+                    deadline,
+                    self.schedule_batch_size,
+                ],
+                self.cluster.get_local_client(host),
+            )
+            yield from response
+            if len(response) < self.schedule_batch_size:
+                break
 
     def schedule(self, deadline: float, timestamp: float | None = None) -> Iterable[ScheduleEntry]:
         if timestamp is None:
@@ -156,8 +177,8 @@ class RedisBackend(Backend):
 
         for host in self.cluster.hosts:
             try:
-                for key, timestamp in self.__schedule_partition(host, deadline, timestamp):
-                    yield ScheduleEntry(key.decode("utf-8"), float(timestamp))
+                for key, score in self.__schedule_partition(host, deadline, timestamp):
+                    yield ScheduleEntry(key.decode("utf-8"), float(score))
             except Exception as error:
                 logger.exception(
                     "Failed to perform scheduling for partition %s due to error: %s",
@@ -186,6 +207,70 @@ class RedisBackend(Backend):
                     error,
                 )
 
+    def __open_digest(
+        self, connection: LocalClient, key: str, timestamp: float, limit: int | None = None
+    ) -> Sequence[tuple[bytes, bytes | None, bytes]]:
+        arguments = [
+            "DIGEST_OPEN",
+            self.namespace,
+            self.ttl,
+            timestamp,
+            key,
+            self.capacity if self.capacity else -1,
+        ]
+        if limit is not None:
+            arguments.append(limit)
+
+        try:
+            return script([key], arguments, connection)
+        except ResponseError as e:
+            if "err(invalid_state):" in str(e):
+                raise InvalidState("Timeline is not in the ready state.") from e
+            else:
+                raise
+
+    def __decode_records(
+        self, key: str, response: Sequence[tuple[bytes, bytes | None, bytes]]
+    ) -> tuple[list[Record], list[Record]]:
+        records = [
+            Record(
+                record_key.decode(),
+                self.codec.decode(value) if value is not None else None,
+                float(timestamp),
+            )
+            for record_key, value, timestamp in response
+        ]
+
+        # If the record value is `None`, this means the record data was
+        # missing (it was presumably evicted by Redis) so we don't need to
+        # return it here.
+        filtered_records = [record for record in records if record.value is not None]
+        if len(records) != len(filtered_records):
+            logger.warning(
+                "Filtered out missing records when fetching digest",
+                extra={
+                    "key": key,
+                    "record_count": len(records),
+                    "filtered_record_count": len(filtered_records),
+                },
+            )
+        return records, filtered_records
+
+    def __close_digest(
+        self,
+        connection: LocalClient,
+        key: str,
+        timestamp: float,
+        minimum_delay: int,
+        record_keys: Sequence[str],
+    ) -> None:
+        script(
+            [key],
+            ["DIGEST_CLOSE", self.namespace, self.ttl, timestamp, key, minimum_delay]
+            + list(record_keys),
+            connection,
+        )
+
     @contextmanager
     def digest(
         self, key: str, minimum_delay: int | None = None, timestamp: float | None = None
@@ -198,56 +283,73 @@ class RedisBackend(Backend):
 
         connection = self._get_connection(key)
         with self._get_timeline_lock(key, duration=30).acquire():
-            try:
-                response = script(
-                    [key],
-                    [
-                        "DIGEST_OPEN",
-                        self.namespace,
-                        self.ttl,
-                        timestamp,
-                        key,
-                        self.capacity if self.capacity else -1,
-                    ],
-                    connection,
-                )
-            except ResponseError as e:
-                if "err(invalid_state):" in str(e):
-                    raise InvalidState("Timeline is not in the ready state.") from e
-                else:
-                    raise
-
-            records = [
-                Record(
-                    key.decode(),
-                    self.codec.decode(value) if value is not None else None,
-                    float(timestamp),
-                )
-                for key, value, timestamp in response
-            ]
-
-            # If the record value is `None`, this means the record data was
-            # missing (it was presumably evicted by Redis) so we don't need to
-            # return it here.
-            filtered_records = [record for record in records if record.value is not None]
-            if len(records) != len(filtered_records):
-                logger.warning(
-                    "Filtered out missing records when fetching digest",
-                    extra={
-                        "key": key,
-                        "record_count": len(records),
-                        "filtered_record_count": len(filtered_records),
-                    },
-                )
+            response = self.__open_digest(connection, key, timestamp)
+            records, filtered_records = self.__decode_records(key, response)
+
             yield filtered_records
 
-            script(
-                [key],
-                ["DIGEST_CLOSE", self.namespace, self.ttl, timestamp, key, minimum_delay]
-                + [record.key for record in records],
-                connection,
+            self.__close_digest(
+                connection, key, timestamp, minimum_delay, [record.key for record in records]
             )
 
+    @contextmanager
+    def digest_stream(
+        self,
+        key: str,
+        minimum_delay: int | None = None,
+        page_size: int = 1000,
+        timestamp: float | None = None,
+    ) -> Any:
+        if minimum_delay is None:
+            minimum_delay = self.minimum_delay
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        connection = self._get_connection(key)
+        lock = self._get_timeline_lock(key, duration=30)
+        with lock.acquire():
+            response = self.__open_digest(connection, key, timestamp, page_size)
+
+            # Keys of all records that were fetched (including the missing
+            # ones), which are removed from the timeline when it is closed.
+            record_keys: list[str] = []
+
+            def pages() -> Iterator[list[Record]]:
+                page = response
+                offset = 0
+                while page:
+                    records, filtered_records = self.__decode_records(key, page)
+                    record_keys.extend(record.key for record in records)
+                    yield filtered_records
+
+                    if len(page) < page_size:
+                        break
+
+                    # Every page may take a while to be processed by the
+                    # caller, so the lock is held for another full duration
+                    # from here on rather than from when the digest was opened.
+                    lock.extend()
+
+                    offset += page_size
+                    page = script(
+                        [key],
+                        [
+                            "DIGEST_PAGE",
+                            self.namespace,
+                            self.ttl,
+                            timestamp,
+                            key,
+                            offset,
+                            page_size,
+                        ],
+                        connection,
+                    )
+
+            yield pages()
+
+            self.__close_digest(connection, key, timestamp, minimum_delay, record_keys)
+
     def delete(self, key: str, timestamp: float | None = None) -> None:
         if timestamp is None:
             timestamp = time.time()
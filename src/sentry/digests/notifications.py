@@ -4,7 +4,8 @@ import functools
 import itertools
 import logging
 from collections import defaultdict, namedtuple
-from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence, Sequence
+from datetime import datetime
 from typing import Any
 
 from sentry import tsdb
@@ -227,3 +228,91 @@ def build_digest(
 
     digest, logs = pipeline(records)
     return digest, logs
+
+
+class DigestBuilder:
+    """
+    Builds the same digest as ``build_digest``, but from records that are
+    added in pages (as returned by ``Backend.digest_stream``), so that the
+    undecoded timeline never needs to be held in memory at once. The state of
+    the groups and rules is fetched for the records of each page as they are
+    added, and the counts are fetched once for all groups of the digest.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self.project = project
+        self.groups: dict[int, Group] = {}
+        self.rules: dict[int, Rule] = {}
+        self.digest: MutableMapping[Any, Any] = defaultdict(lambda: defaultdict(list))
+        self.notification_uuid: str | None = None
+        self.start: datetime | None = None
+        self.end: datetime | None = None
+        self.record_count = 0
+        self.digested_count = 0
+
+    def add(self, records: Iterable[Record]) -> None:
+        records = list(records)
+        if not records:
+            return
+
+        group_ids = {record.value.event.group_id for record in records} - self.groups.keys()
+        for id, group in Group.objects.in_bulk(group_ids).items():
+            assert group.project_id == self.project.id, "Group must belong to Project"
+            group.project = self.project
+            group.event_count = 0
+            group.user_count = 0
+            self.groups[id] = group
+
+        rule_ids = {id for record in records for id in record.value.rules} - self.rules.keys()
+        for id, rule in Rule.objects.in_bulk(rule_ids).items():
+            assert rule.project_id == self.project.id, "Rule must belong to Project"
+            rule.project = self.project
+            self.rules[id] = rule
+
+        for record in records:
+            self.record_count += 1
+            if self.start is None or record.datetime < self.start:
+                self.start = record.datetime
+            if self.end is None or record.datetime > self.end:
+                self.end = record.datetime
+            if not self.notification_uuid:
+                self.notification_uuid = getattr(record.value, "notification_uuid", None)
+
+            rewritten = rewrite_record(record, self.project, self.groups, self.rules)
+            if rewritten is None or not check_group_state(rewritten):
+                continue
+
+            group_records(self.digest, rewritten)
+            self.digested_count += 1
+
+    def build(self) -> tuple[Digest | None, Sequence[str]]:
+        if not self.record_count:
+            return None, []
+
+        group_ids = list({group.id for groups in self.digest.values() for group in groups})
+        if group_ids:
+            tenant_ids = {"organization_id": self.project.organization_id}
+            event_counts = tsdb.backend.get_sums(
+                TSDBModel.group, group_ids, self.start, self.end, tenant_ids=tenant_ids
+            )
+            user_counts = tsdb.backend.get_distinct_counts_totals(
+                TSDBModel.users_affected_by_group,
+                group_ids,
+                self.start,
+                self.end,
+                tenant_ids=tenant_ids,
+            )
+            for id, event_count in event_counts.items():
+                self.groups[id].event_count = event_count
+            for id, user_count in user_counts.items():
+                self.groups[id].user_count = user_count
+
+        logs = [
+            f"{self.record_count} records added to the digest.",
+            f"{self.digested_count} records of unresolved groups grouped into "
+            f"{len(self.digest)} rules.",
+        ]
+        for message in logs:
+            logger.debug(message)
+
+        return sort_rule_groups(sort_group_contents(self.digest)), logs
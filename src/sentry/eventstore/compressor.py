@@ -3,7 +3,10 @@ Eventstore compressor is responsible for pulling out repeating data across
 events such that they can be stored only once. For example SDK modules list, or
 debug_meta.
 
-This is not used in production yet, we are still collecting metrics there.
+Nodestore deduplicates the payloads it writes for a sample of events (see the
+`nodestore.compressor.sample-rate` option): the pulled out data is stored once
+per project and checksum of its content, and events are reassembled when they
+are read.
 """
 from __future__ import annotations
 
@@ -12,6 +15,10 @@ from typing import Any
 
 import orjson
 
+from sentry.utils import metrics
+
+PATCHSETS_KEY = "__nodestore_patchsets"
+
 _INTERFACES = {}
 
 
@@ -33,11 +40,14 @@ class DebugMeta:
     def encode(data):
         dedup: dict[str, list[str | Any]] = {}
 
-        if data:
-            for image in data.get("images") or []:
-                image = image or {}
+        if data and data.get("images"):
+            images = []
+            for image in data["images"]:
+                inlined = dict(image or {})
                 for name in DebugMeta._DEDUP_FIELDS:
-                    dedup.setdefault(name, []).append(image.pop(name, None))
+                    dedup.setdefault(name, []).append(inlined.pop(name, None))
+                images.append(inlined if image else image)
+            data = {**data, "images": images}
 
         return dedup, data
 
@@ -53,7 +63,31 @@ class DebugMeta:
         return data
 
 
+@_deduplicate_interface("modules")
+class Modules:
+    """
+    The modules loaded by an SDK, which are the same for most events of a
+    release. Modules are sorted by name, as they are written with sorted keys
+    either way.
+    """
+
+    @staticmethod
+    def encode(data):
+        if not data or not isinstance(data, dict):
+            return {}, data
+
+        return dict(sorted(data.items())), None
+
+    @staticmethod
+    def decode(dedup, data):
+        return dedup or data
+
+
 def deduplicate(data):
+    """
+    Pulls out the repeating data of `data`, which is modified in place. Returns
+    `data` and the pulled out data by its checksum.
+    """
     patchsets = []
     extra_keys = {}
 
@@ -62,30 +96,44 @@ def deduplicate(data):
             continue
 
         to_deduplicate, to_inline = interface.encode(data.pop(key))
+        if not to_deduplicate:
+            # Nothing to store separately
+            data[key] = to_inline
+            continue
+
         to_deduplicate_serialized = orjson.dumps(to_deduplicate)
         checksum = hashlib.md5(to_deduplicate_serialized).hexdigest()
         extra_keys[checksum] = to_deduplicate
         patchsets.append([key, checksum, to_inline])
 
     if patchsets:
-        data["__nodestore_patchsets"] = patchsets
+        data[PATCHSETS_KEY] = patchsets
 
     return data, extra_keys
 
 
+def get_checksums(data):
+    """Returns the checksums of the data that has been pulled out of `data`."""
+    return [checksum for _, checksum, _ in data.get(PATCHSETS_KEY) or ()]
+
+
 def assemble(data, get_extra_keys):
-    if not data.get("__nodestore_patchsets"):
+    """
+    Puts the pulled out data back into `data`. Interfaces whose pulled out
+    data is missing are left out, as their inlined parts alone would be
+    incomplete, the rest of the event is kept.
+    """
+    if not data.get(PATCHSETS_KEY):
         return data
 
-    checksums = []
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
-        checksums.append(checksum)
+    deduplicated_interfaces = get_extra_keys(get_checksums(data))
 
-    deduplicated_interfaces = get_extra_keys(checksums)
+    for key, checksum, inlined in data.pop(PATCHSETS_KEY):
+        deduplicated = deduplicated_interfaces.get(checksum)
+        if deduplicated is None:
+            metrics.incr("eventstore.compressor.missing", tags={"key": key})
+            continue
 
-    for key, checksum, inlined in data["__nodestore_patchsets"]:
-        deduplicated = deduplicated_interfaces[checksum]
         data[key] = _INTERFACES[key].decode(deduplicated, inlined)
 
-    del data["__nodestore_patchsets"]
     return data
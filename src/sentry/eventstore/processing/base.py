@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -45,15 +45,45 @@ class EventProcessingStore(Service):
         self.inner.set(key, event, self.timeout)
         return key
 
+    def store_many(self, events: Sequence[Event], unprocessed: bool = False) -> list[str]:
+        """
+        Store multiple events at once, returning their keys in the same order.
+        """
+        keys = [cache_key_for_event(event) for event in events]
+        if unprocessed:
+            keys = [self.__get_unprocessed_key(key) for key in keys]
+        self.inner.set_many(list(zip(keys, events)), self.timeout)
+        return keys
+
     def get(self, key: str, unprocessed: bool = False) -> MutableMapping[str, Any] | None:
         if unprocessed:
             key = self.__get_unprocessed_key(key)
         return self.inner.get(key)
 
+    def get_many(
+        self, keys: Sequence[str], unprocessed: bool = False
+    ) -> dict[str, MutableMapping[str, Any]]:
+        """
+        Fetch multiple events at once. Returns a mapping of the given keys to
+        their events, keys of missing events are left out.
+        """
+        if unprocessed:
+            inner_keys = {self.__get_unprocessed_key(key): key for key in keys}
+        else:
+            inner_keys = {key: key for key in keys}
+        return {inner_keys[key]: event for key, event in self.inner.get_many(list(inner_keys))}
+
     def delete_by_key(self, key: str) -> None:
-        self.inner.delete(key)
-        self.inner.delete(self.__get_unprocessed_key(key))
+        self.delete_many_by_key([key])
+
+    def delete_many_by_key(self, keys: Sequence[str]) -> None:
+        self.inner.delete_many(
+            [inner_key for key in keys for inner_key in (key, self.__get_unprocessed_key(key))]
+        )
 
     def delete(self, event: Event) -> None:
         key = cache_key_for_event(event)
         self.delete_by_key(key)
+
+    def delete_many(self, events: Sequence[Event]) -> None:
+        self.delete_many_by_key([cache_key_for_event(event) for event in events])
@@ -1,4 +1,4 @@
-from sentry.utils.codecs import JSONCodec
+from sentry.utils.codecs import BytesCodec, JSONCodec, OptionalZstdCodec
 from sentry.utils.kvstore.encoding import KVStorageCodecWrapper
 from sentry.utils.kvstore.redis import RedisKVStorage
 from sentry.utils.redis import redis_clusters
@@ -10,11 +10,25 @@ class RedisClusterEventProcessingStore(EventProcessingStore):
     """
     Creates an instance of the processing store which uses a Redis Cluster
     client as its backend.
+
+    Payloads are compressed with zstd if the ``compression`` option is set to
+    ``"zstd"``. Uncompressed payloads that were written before compression was
+    enabled can still be read, but compressed payloads can not be read once it
+    is disabled again.
     """
 
     def __init__(self, **options):
-        super().__init__(
-            KVStorageCodecWrapper(
-                RedisKVStorage(redis_clusters.get(options.pop("cluster", "default"))), JSONCodec()
+        cluster = options.pop("cluster", "default")
+        compression = options.pop("compression", None)
+
+        if compression is None:
+            inner = KVStorageCodecWrapper(RedisKVStorage(redis_clusters.get(cluster)), JSONCodec())
+        elif compression == "zstd":
+            inner = KVStorageCodecWrapper(
+                RedisKVStorage(redis_clusters.get_binary(cluster)),
+                JSONCodec() | BytesCodec() | OptionalZstdCodec(),
             )
-        )
+        else:
+            raise ValueError('"compression" must be one of None, "zstd"')
+
+        super().__init__(inner)
@@ -74,3 +74,6 @@ all = default_manager.all
 add_handler = default_manager.add_handler
 add_entity_handler = default_manager.add_entity_handler
 has_for_batch = default_manager.has_for_batch
+evaluation_scope = default_manager.evaluation_scope
+invalidate = default_manager.invalidate
+prefetch = default_manager.prefetch
@@ -5,8 +5,18 @@ import logging
 __all__ = ["FeatureManager"]
 
 import abc
+import threading
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, MutableMapping, MutableSet, Sequence
+from collections.abc import (
+    Generator,
+    Hashable,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+    Sequence,
+)
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
@@ -131,6 +141,39 @@ class RegisteredFeatureManager:
 FLAGPOLE_OPTION_PREFIX = "feature"
 
 
+def _get_entity_key(entity: Any) -> Hashable | None:
+    if entity is None or isinstance(entity, (str, int)):
+        return entity
+
+    entity_id = getattr(entity, "id", None)
+    if entity_id is None:
+        return None
+    return (type(entity).__name__, entity_id)
+
+
+def _get_evaluation_key(
+    name: str, args: Sequence[Any], kwargs: Mapping[str, Any], skip_entity: bool | None
+) -> Hashable | None:
+    """
+    Returns the key of a feature check in the evaluation cache, or `None` if
+    the check cannot be memoized (such as checks for unsaved entities).
+    """
+    if set(kwargs) - {"actor"}:
+        return None
+
+    entity_keys = []
+    for entity in args:
+        entity_key = _get_entity_key(entity)
+        if entity_key is None:
+            return None
+        entity_keys.append(entity_key)
+
+    actor = kwargs.get("actor")
+    actor_key = None if actor is None else (type(actor).__name__, getattr(actor, "id", None))
+
+    return (name, tuple(entity_keys), actor_key, bool(skip_entity))
+
+
 # TODO: Change RegisteredFeatureManager back to object once it can be removed
 class FeatureManager(RegisteredFeatureManager):
     def __init__(self) -> None:
@@ -140,6 +183,7 @@ class FeatureManager(RegisteredFeatureManager):
         self.option_features: MutableSet[str] = set()
         self.flagpole_features: MutableSet[str] = set()
         self._entity_handler: FeatureHandler | None = None
+        self._evaluation_cache = threading.local()
 
     def all(self, feature_type: type[Feature] = Feature) -> Mapping[str, type[Feature]]:
         """
@@ -248,34 +292,43 @@ class FeatureManager(RegisteredFeatureManager):
 
         >>> FeatureManager.has('organizations:feature', organization, actor=request.user)
 
+        Within an ``evaluation_scope``, the results are memoized.
         """
-        sample_rate = 0.01
+        results = self._get_evaluation_results()
+        key = None
+        if results is not None:
+            key = _get_evaluation_key(name, args, kwargs, skip_entity)
+            if key is not None and key in results:
+                return results[key]
+
         try:
-            with metrics.timer("features.has", tags={"feature": name}, sample_rate=sample_rate):
-                actor = kwargs.pop("actor", None)
-                feature = self.get(name, *args, **kwargs)
+            rv = self._evaluate(name, *args, skip_entity=skip_entity, **kwargs)
+        except Exception:
+            logger.exception("Failed to run feature check")
+            return False
 
-                # Check registered feature handlers
-                rv = self._get_handler(feature, actor)
-                if rv is not None:
-                    metrics.incr(
-                        "feature.has.result",
-                        tags={"feature": name, "result": rv},
-                        sample_rate=sample_rate,
-                    )
-                    return rv
+        if key is not None and results is not None:
+            results[key] = rv
+        return rv
+
+    def _evaluate(self, name: str, *args: Any, skip_entity: bool | None, **kwargs: Any) -> bool:
+        sample_rate = 0.01
+        with metrics.timer("features.has", tags={"feature": name}, sample_rate=sample_rate):
+            actor = kwargs.pop("actor", None)
+            feature = self.get(name, *args, **kwargs)
 
-                if self._entity_handler and not skip_entity:
-                    rv = self._entity_handler.has(feature, actor)
-                    if rv is not None:
-                        metrics.incr(
-                            "feature.has.result",
-                            tags={"feature": name, "result": rv},
-                            sample_rate=sample_rate,
-                        )
-                        return rv
-
-                rv = settings.SENTRY_FEATURES.get(feature.name, False)
+            # Check registered feature handlers
+            rv = self._get_handler(feature, actor)
+            if rv is not None:
+                metrics.incr(
+                    "feature.has.result",
+                    tags={"feature": name, "result": rv},
+                    sample_rate=sample_rate,
+                )
+                return rv
+
+            if self._entity_handler and not skip_entity:
+                rv = self._entity_handler.has(feature, actor)
                 if rv is not None:
                     metrics.incr(
                         "feature.has.result",
@@ -284,16 +337,22 @@ class FeatureManager(RegisteredFeatureManager):
                     )
                     return rv
 
-                # Features are by default disabled if no plugin or default enables them
+            rv = settings.SENTRY_FEATURES.get(feature.name, False)
+            if rv is not None:
                 metrics.incr(
                     "feature.has.result",
-                    tags={"feature": name, "result": False},
+                    tags={"feature": name, "result": rv},
                     sample_rate=sample_rate,
                 )
+                return rv
+
+            # Features are by default disabled if no plugin or default enables them
+            metrics.incr(
+                "feature.has.result",
+                tags={"feature": name, "result": False},
+                sample_rate=sample_rate,
+            )
 
-                return False
-        except Exception:
-            logger.exception("Failed to run feature check")
             return False
 
     def batch_has(
@@ -344,6 +403,111 @@ class FeatureManager(RegisteredFeatureManager):
                 return {"unscoped": unscoped_results}
             return None
 
+    def _get_evaluation_results(self) -> MutableMapping[Hashable, bool] | None:
+        return getattr(self._evaluation_cache, "results", None)
+
+    @contextmanager
+    def evaluation_scope(self) -> Generator[None, None, None]:
+        """
+        Memoize the results of ``has`` within the block, which should span a
+        single request or task. Results are keyed by the feature name, the
+        ids of the entities and the actor, and can be discarded with
+        ``invalidate`` after changing what a feature depends on.
+
+        Nested scopes share the results of the outermost scope.
+
+        >>> with FeatureManager.evaluation_scope():
+        ...     FeatureManager.has('organizations:feature', organization)
+        """
+        if self._get_evaluation_results() is not None:
+            yield
+            return
+
+        self._evaluation_cache.results = {}
+        try:
+            yield
+        finally:
+            self._evaluation_cache.results = None
+
+    def invalidate(self, name: str | None = None) -> None:
+        """
+        Discard the memoized results of the current evaluation scope, for a
+        single feature or for all features.
+        """
+        results = self._get_evaluation_results()
+        if results is None:
+            return
+
+        if name is None:
+            results.clear()
+        else:
+            for key in [key for key in results if key[0] == name]:  # type: ignore[index]
+                del results[key]
+
+    def prefetch(
+        self,
+        feature_names: Iterable[str],
+        organization: Organization,
+        projects: Sequence[Project] = (),
+        actor: User | None = None,
+    ) -> None:
+        """
+        Evaluate a declared list of features for an organization and its
+        projects in one pass, so that the following ``has`` checks within the
+        current evaluation scope are served from memory. Project features are
+        evaluated for all projects at once with ``has_for_batch``, or with the
+        entity handler's ``batch_has`` if there is one.
+
+        Does nothing outside of an evaluation scope.
+
+        >>> with FeatureManager.evaluation_scope():
+        ...     FeatureManager.prefetch(['projects:feature'], organization, projects)
+        """
+        results = self._get_evaluation_results()
+        if results is None:
+            return
+
+        kwargs = {"actor": actor} if actor is not None else {}
+        project_features = []
+        for name in feature_names:
+            if name.startswith("projects:"):
+                project_features.append(name)
+            elif name.startswith("organizations:"):
+                self.has(name, organization, **kwargs)
+            else:
+                self.has(name, **kwargs)
+
+        if not projects or not project_features:
+            return
+
+        def memoize(name: str, project: Project, rv: bool) -> None:
+            key = _get_evaluation_key(name, (project,), kwargs, False)
+            if key is not None:
+                results[key] = rv
+
+        if self._entity_handler is None:
+            # Without an entity handler, ``has_for_batch`` follows the same
+            # procedure as ``has``.
+            for name in project_features:
+                for project, rv in self.has_for_batch(name, organization, projects, actor).items():
+                    memoize(name, project, rv)
+            return
+
+        batch_results = self._entity_handler.batch_has(
+            project_features, actor, projects=projects, organization=organization
+        )
+        for name in project_features:
+            for project in projects:
+                # Registered handlers take precedence over the entity handler
+                rv = None
+                if not self._handler_registry[name] and batch_results:
+                    rv = batch_results.get(f"project:{project.id}", {}).get(name)
+
+                if rv is None:
+                    self.has(name, project, **kwargs)
+                else:
+                    memoize(name, project, rv)
+
     @staticmethod
     def _shim_feature_strategy(
         entity_feature_strategy: bool | FeatureHandlerStrategy,
@@ -5,6 +5,7 @@ import logging
 import os
 import zlib
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any, Literal
 
 import msgpack
@@ -30,6 +31,10 @@ logger = logging.getLogger(__name__)
 # So this leaves quite a bit of headroom for custom enhancement rules as well.
 RUST_CACHE = RustCache(1_000)
 
+# Number of distinct serialized enhancements whose parsed form is kept around per process. The
+# grouping config is loaded for every event, but almost all events share one of only a few configs.
+ENHANCEMENTS_CACHE_SIZE = 1_000
+
 VERSIONS = [2]
 LATEST_VERSION = VERSIONS[-1]
 
@@ -207,8 +212,20 @@ class Enhancements:
 
     @classmethod
     def loads(cls, data) -> Enhancements:
+        """
+        Loads serialized enhancements.
+
+        Parsing and merging the rules with their bases is costly, so the loaded instances are shared
+        between all callers loading the same serialized enhancements. They must not be mutated.
+        """
         if isinstance(data, str):
             data = data.encode("ascii", "ignore")
+        if cls is Enhancements:
+            return _loads_cached(data)
+        return cls._loads(data)
+
+    @classmethod
+    def _loads(cls, data: bytes) -> Enhancements:
         padded = data + b"=" * (4 - (len(data) % 4))
         try:
             compressed = base64.urlsafe_b64decode(padded)
@@ -239,6 +256,11 @@ class Enhancements:
         )
 
 
+@lru_cache(maxsize=ENHANCEMENTS_CACHE_SIZE)
+def _loads_cached(data: bytes) -> Enhancements:
+    return Enhancements._loads(data)
+
+
 def _load_configs() -> dict[str, Enhancements]:
     rv = {}
     base = os.path.join(os.path.abspath(os.path.dirname(__file__)), "enhancement-configs")
@@ -76,32 +76,43 @@ def _get_function_name(frame_data: dict, platform: str | None):
     return function_name or "<unknown>"
 
 
+def _encode_match_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return value
+
+
+def _encode_path_like_match_value(value: Any) -> Any:
+    # NOTE: path-like matchers are case insensitive, and normalize
+    # file-system separators to `/`.
+    # We do this here in a central place instead of in each matcher separately.
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    if isinstance(value, bytes):
+        return value.lower().replace(b"\\", b"/")
+    return value
+
+
 def create_match_frame(frame_data: dict, platform: str | None) -> dict:
     """Create flat dict of values relevant to matchers"""
-    match_frame = dict(
-        category=get_path(frame_data, "data", "category"),
-        family=get_behavior_family_for_platform(frame_data.get("platform") or platform),
-        function=_get_function_name(frame_data, platform),
-        in_app=frame_data.get("in_app"),
-        orig_in_app=get_path(frame_data, "data", "orig_in_app"),
-        module=get_path(frame_data, "module"),
-        package=frame_data.get("package"),
-        path=frame_data.get("abs_path") or frame_data.get("filename"),
-    )
-
-    for key in list(match_frame.keys()):
-        value = match_frame[key]
-        if isinstance(value, (bytes, str)):
-            if isinstance(value, str):
-                value = match_frame[key] = value.encode("utf-8")
-
-            if key in ("package", "path"):
-                # NOTE: path-like matchers are case insensitive, and normalize
-                # file-system separators to `/`.
-                # We do this here in a central place instead of in each matcher separately.
-                value = match_frame[key] = value.lower().replace(b"\\", b"/")
-
-    return match_frame
+    data = frame_data.get("data")
+    if not isinstance(data, dict):
+        data = {}
+
+    return {
+        "category": _encode_match_value(data.get("category")),
+        "family": _encode_match_value(
+            get_behavior_family_for_platform(frame_data.get("platform") or platform)
+        ),
+        "function": _encode_match_value(_get_function_name(frame_data, platform)),
+        "in_app": _encode_match_value(frame_data.get("in_app")),
+        "orig_in_app": _encode_match_value(data.get("orig_in_app")),
+        "module": _encode_match_value(frame_data.get("module")),
+        "package": _encode_path_like_match_value(frame_data.get("package")),
+        "path": _encode_path_like_match_value(
+            frame_data.get("abs_path") or frame_data.get("filename")
+        ),
+    }
 
 
 class Match:
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import copy
 import logging
-from collections.abc import Sequence
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
 
 import sentry_sdk
+from django.core.cache import cache
 
+from sentry import options
 from sentry.exceptions import HashDiscarded
 from sentry.features.rollout import in_random_rollout
 from sentry.grouping.api import (
@@ -40,6 +44,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("sentry.events.grouping")
 
+# The generation is part of every cached grouphash key. Bumping it invalidates
+# all cached grouphashes of a project at once.
+GROUPHASH_CACHE_GENERATION_KEY = "grouphash-cache-generation:{project_id}"
+GROUPHASH_CACHE_GENERATION_TTL = 24 * 60 * 60
+GROUPHASH_CACHE_KEY = "grouphash:{project_id}:{generation}:{hash}"
+
 
 def _calculate_event_grouping(
     project: Project, event: Event, grouping_config: GroupingConfig
@@ -378,3 +388,105 @@ def get_hash_values(
         job["finest_tree_label"] = all_hashes.finest_tree_label
 
     return (primary_hashes, secondary_hashes, all_hashes)
+
+
+def _get_grouphash_cache_keys(project_id: int, hashes: Iterable[str]) -> dict[str, str]:
+    generation = cache.get(GROUPHASH_CACHE_GENERATION_KEY.format(project_id=project_id)) or 0
+    return {
+        hash: GROUPHASH_CACHE_KEY.format(project_id=project_id, generation=generation, hash=hash)
+        for hash in hashes
+    }
+
+
+def invalidate_grouphash_cache(project_id: int) -> None:
+    """
+    Drop all cached grouphashes of the project. This needs to be called whenever grouphashes are
+    moved to another group or detached from theirs, e.g. when merging, unmerging or deleting
+    groups. Grouphashes deleted through the deletions framework (group and project deletion, and
+    retention cleanup) are taken care of by `GroupHashDeletionTask`.
+    """
+    cache.set(
+        GROUPHASH_CACHE_GENERATION_KEY.format(project_id=project_id),
+        uuid.uuid4().hex,
+        GROUPHASH_CACHE_GENERATION_TTL,
+    )
+
+
+@sentry_sdk.tracing.trace
+def get_or_create_grouphashes_many(
+    hashes_by_project: Sequence[tuple[Project, Sequence[str]]],
+) -> dict[tuple[int, str], GroupHash]:
+    """
+    Resolve the `GroupHash` rows for hashes of one or more projects, creating the ones which don't
+    exist yet. Returns the grouphashes keyed by `(project_id, hash)`.
+
+    Existing grouphashes are fetched with a single query. Grouphashes which are already assigned to
+    a group are additionally cached for `grouping.grouphash-cache-ttl` seconds, so that later events
+    hitting the same hashes don't go to the database at all.
+
+    Ingest currently resolves the hashes of one event at a time through `get_or_create_grouphashes`,
+    as hashes are only calculated while the event is being assigned to a group.
+    """
+    cache_ttl = options.get("grouping.grouphash-cache-ttl")
+    projects = {}
+    hashes_to_resolve: dict[int, set[str]] = defaultdict(set)
+    for project, hashes in hashes_by_project:
+        projects[project.id] = project
+        hashes_to_resolve[project.id].update(hashes)
+
+    result: dict[tuple[int, str], GroupHash] = {}
+
+    cache_keys: dict[int, dict[str, str]] = {}
+    if cache_ttl > 0:
+        for project_id, hashes in hashes_to_resolve.items():
+            cache_keys[project_id] = _get_grouphash_cache_keys(project_id, hashes)
+
+        cached = cache.get_many(
+            [key for project_keys in cache_keys.values() for key in project_keys.values()]
+        )
+        for project_id, project_keys in cache_keys.items():
+            for hash, key in project_keys.items():
+                if key in cached:
+                    result[(project_id, hash)] = cached[key]
+                    hashes_to_resolve[project_id].discard(hash)
+
+        metrics.incr("grouping.grouphash_cache.hit", amount=len(result))
+
+    uncached_hashes = {hash for hashes in hashes_to_resolve.values() for hash in hashes}
+    if uncached_hashes:
+        for grouphash in GroupHash.objects.filter(
+            project_id__in=list(hashes_to_resolve), hash__in=uncached_hashes
+        ):
+            if grouphash.hash in hashes_to_resolve[grouphash.project_id]:
+                result[(grouphash.project_id, grouphash.hash)] = grouphash
+
+    to_cache = {}
+    for project_id, hashes in hashes_to_resolve.items():
+        for hash in hashes:
+            grouphash = result.get((project_id, hash))
+            if grouphash is None:
+                # Another process may be creating the same grouphash concurrently, which
+                # `get_or_create` handles for us.
+                grouphash = GroupHash.objects.get_or_create(project=projects[project_id], hash=hash)[
+                    0
+                ]
+                result[(project_id, hash)] = grouphash
+
+            # Only grouphashes which are already assigned to a group are cached, as unassigned ones
+            # are about to be changed by whoever is creating the group.
+            if cache_ttl > 0 and grouphash.group_id is not None:
+                to_cache[cache_keys[project_id][hash]] = grouphash
+
+    if to_cache:
+        cache.set_many(to_cache, cache_ttl)
+
+    return result
+
+
+def get_or_create_grouphashes(project: Project, hashes: Sequence[str]) -> list[GroupHash]:
+    """
+    Resolve the `GroupHash` rows for the given hashes of a single project, in the order of the
+    hashes. See `get_or_create_grouphashes_many`.
+    """
+    grouphashes = get_or_create_grouphashes_many([(project, hashes)])
+    return [grouphashes[(project.id, hash)] for hash in hashes]
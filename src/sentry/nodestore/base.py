@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import hashlib
+import random
 from collections.abc import Mapping
+from copy import deepcopy
 from datetime import datetime, timedelta
-from threading import local
+from threading import Lock, local
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import sentry_sdk
+import zstandard
+from django.conf import settings
 from django.core.cache import BaseCache, InvalidCacheBackendError, caches
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.nodestore.lru import LocalNodeCache
 from sentry.utils import json, metrics
+from sentry.utils.codecs import ZSTD_FRAME_MAGIC, ZstdDictCodec
 from sentry.utils.services import Service
 
 # Cache an instance of the encoder we want to use
@@ -28,6 +36,11 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+# NodeStorage instances are thread-local, so their process-local caches are
+# kept here, keyed by the backend instance.
+_local_caches: WeakKeyDictionary[NodeStorage, LocalNodeCache] = WeakKeyDictionary()
+_local_caches_lock = Lock()
+
 
 class NodeStorage(local, Service):
     """
@@ -100,6 +113,8 @@ class NodeStorage(local, Service):
         if value is None:
             return None
 
+        value = self._decompress(value)
+
         lines_iter = iter(value.splitlines())
         try:
             if subkey is not None:
@@ -146,9 +161,10 @@ class NodeStorage(local, Service):
                     return item_from_cache
 
             span.set_tag("subkey", str(subkey))
-            bytes_data = self._get_bytes(id)
+            bytes_data = self._get_bytes_with_local_cache(id)
             rv = self._decode(bytes_data, subkey=subkey)
             if subkey is None:
+                rv = self._assemble({id: rv})[id]
                 # set cache item only after we know decoding did not fail
                 self._set_cache_item(id, rv)
 
@@ -195,9 +211,10 @@ class NodeStorage(local, Service):
             with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode") as span:
                 items = {
                     id: self._decode(value, subkey=subkey)
-                    for id, value in self._get_bytes_multi(uncached_ids).items()
+                    for id, value in self._get_bytes_multi_with_local_cache(uncached_ids).items()
                 }
             if subkey is None:
+                items = self._assemble(items)
                 self._set_cache_items(items)
                 items.update(cache_items)
 
@@ -206,6 +223,73 @@ class NodeStorage(local, Service):
 
             return items
 
+    def _get_deduplicated_id(self, project_id: int, checksum: str) -> str:
+        # Node ids are limited to 40 characters by some backends, so the
+        # project and checksum are hashed into one id of exactly that length.
+        return hashlib.sha1(f"dedup:{project_id}:{checksum}".encode()).hexdigest()
+
+    def _assemble(self, items: dict[str, Any]) -> dict[str, Any]:
+        """
+        Reassembles the nodes whose repeating data has been stored separately
+        by `set_subkeys`, fetching the separate data of all nodes at once.
+        Interfaces whose separate data is missing are left out of their node.
+        """
+        from sentry.eventstore.compressor import assemble, get_checksums
+
+        deduplicated_ids = {
+            self._get_deduplicated_id(item.get("project"), checksum)
+            for item in items.values()
+            if isinstance(item, dict)
+            for checksum in get_checksums(item)
+        }
+        if not deduplicated_ids:
+            return items
+
+        nodes = self.get_multi(list(deduplicated_ids))
+
+        def assemble_item(item: dict[str, Any]) -> dict[str, Any]:
+            def get_deduplicated(checksums: list[str]) -> dict[str, Any]:
+                # Nodes sharing data must not share the objects holding it
+                return {
+                    checksum: deepcopy(
+                        nodes.get(self._get_deduplicated_id(item.get("project"), checksum))
+                    )
+                    for checksum in checksums
+                }
+
+            return assemble(item, get_deduplicated)
+
+        return {
+            id: assemble_item(item) if isinstance(item, dict) else item
+            for id, item in items.items()
+        }
+
+    def _deduplicate(self, data: Mapping[str, Any], ttl: timedelta | None) -> Mapping[str, Any]:
+        """
+        Writes the data repeating across the events of a project, such as the
+        modules loaded by an SDK, once per checksum of its content and returns
+        the node data without it.
+
+        Separate data is rewritten by every node that refers to it. Only nodes
+        written with the default TTL of the backend are deduplicated, and their
+        separate data is written with it as well, so that every rewrite extends
+        how long the data lives and it outlives all nodes referring to it.
+        """
+        from sentry.eventstore.compressor import deduplicate
+
+        project_id = data.get("project")
+        if ttl is not None or not isinstance(project_id, int):
+            return data
+
+        data, deduplicated = deduplicate(dict(data))
+        for checksum, value in deduplicated.items():
+            self.set_bytes(
+                self._get_deduplicated_id(project_id, checksum), self._encode({None: value})
+            )
+
+        metrics.incr("nodestore.deduplicated", amount=len(deduplicated))
+        return data
+
     def _encode(self, data: dict[str | None, Mapping[str, Any]]) -> bytes:
         """
         Encode data dict in a way where its keys can be deserialized
@@ -215,20 +299,71 @@ class NodeStorage(local, Service):
         >>> _encode({"unprocessed": {}, None: {"stacktrace": {}}})
         b'{"stacktrace": {}}\nunprocessed\n{}'
         """
-        lines = [json_dumps(data.pop(None)).encode("utf8")]
+        default = data.pop(None)
+        lines = [json_dumps(default).encode("utf8")]
         for key, value in data.items():
             if key is not None:
                 lines.append(key.encode("ascii"))
                 lines.append(json_dumps(value).encode("utf8"))
 
-        return b"\n".join(lines)
+        platform = default.get("platform") if isinstance(default, Mapping) else None
+        return self._compress(b"\n".join(lines), platform)
+
+    @cached_property
+    def _compression_codecs(self) -> dict[str, ZstdDictCodec]:
+        """
+        Returns the dictionary compression codec for every platform configured
+        in `SENTRY_NODESTORE_COMPRESSION_DICTIONARIES`.
+        """
+        dictionaries = {}
+        for platform, path in settings.SENTRY_NODESTORE_COMPRESSION_DICTIONARIES.items():
+            with open(path, "rb") as f:
+                dictionaries[platform] = zstandard.ZstdCompressionDict(f.read())
+
+        return {
+            platform: ZstdDictCodec(dictionary, dictionaries=dictionaries.values())
+            for platform, dictionary in dictionaries.items()
+        }
+
+    @cached_property
+    def _decompression_codec(self) -> ZstdDictCodec:
+        return ZstdDictCodec(
+            dictionaries=[codec.dictionary for codec in self._compression_codecs.values()]
+        )
+
+    def _compress(self, value: bytes, platform: str | None) -> bytes:
+        codecs = self._compression_codecs
+        codec = codecs.get(platform or "default") or codecs.get("default")
+        if codec is None:
+            return value
+
+        rv = codec.encode(value)
+        metrics.distribution(
+            "nodestore.compression_ratio",
+            len(rv) / len(value),
+            tags={"platform": platform or "unknown"},
+        )
+        return rv
+
+    def _decompress(self, value: bytes) -> bytes:
+        """
+        Undo `_compress` on values compressed with one of the configured
+        dictionaries. Any other value is returned as-is.
+        """
+        if not value.startswith(ZSTD_FRAME_MAGIC):
+            return value
+
+        return self._decompression_codec.decode(value)
 
     def set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         """
         >>> nodestore.set_bytes('key1', b"{'foo': 'bar'}")
         """
         metrics.distribution("nodestore.set_bytes", len(data))
-        return self._set_bytes(item_id, data, ttl)
+        self._set_bytes(item_id, data, ttl)
+        local_cache = self._get_local_cache()
+        if local_cache is not None:
+            local_cache.set(item_id, data)
 
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
@@ -260,6 +395,10 @@ class NodeStorage(local, Service):
         {'foo': 'bam'}
         """
         cache_item = data.get(None)
+        if isinstance(cache_item, Mapping) and random.random() < options.get(
+            "nodestore.compressor.sample-rate"
+        ):
+            data = {**data, None: self._deduplicate(cache_item, ttl)}
         bytes_data = self._encode(data)
         self.set_bytes(item_id, bytes_data, ttl=ttl)
         # set cache only after encoding and write to nodestore has succeeded
@@ -295,10 +434,92 @@ class NodeStorage(local, Service):
     def _delete_cache_item(self, item_id: str) -> None:
         if self.cache:
             self.cache.delete(item_id)
+        local_cache = _local_caches.get(self)
+        if local_cache is not None:
+            local_cache.delete_many([item_id])
 
     def _delete_cache_items(self, id_list: list[str]) -> None:
         if self.cache:
             self.cache.delete_many([item_id for item_id in id_list])
+        local_cache = _local_caches.get(self)
+        if local_cache is not None:
+            local_cache.delete_many(id_list)
+
+    def _clear_cache(self) -> None:
+        if self.cache:
+            self.cache.clear()
+        local_cache = _local_caches.get(self)
+        if local_cache is not None:
+            local_cache.clear()
+
+    def _get_local_cache(self) -> LocalNodeCache | None:
+        """
+        Returns the process-local LRU cache of raw node blobs of this backend,
+        or `None` if it is disabled.
+        """
+        max_bytes = options.get("nodestore.local-cache.max-bytes")
+        if max_bytes <= 0:
+            return None
+
+        negative_ttl = options.get("nodestore.local-cache.negative-ttl")
+        local_cache = _local_caches.get(self)
+        if local_cache is None:
+            with _local_caches_lock:
+                local_cache = _local_caches.setdefault(
+                    self, LocalNodeCache(max_bytes, negative_ttl)
+                )
+        if local_cache.max_bytes != max_bytes or local_cache.negative_ttl != negative_ttl:
+            local_cache.resize(max_bytes, negative_ttl)
+        return local_cache
+
+    def _get_bytes_with_local_cache(self, id: str) -> bytes | None:
+        local_cache = self._get_local_cache()
+        if local_cache is None:
+            return self._get_bytes(id)
+
+        return self._get_bytes_multi_with_local_cache([id])[id]
+
+    def _get_bytes_multi_with_local_cache(self, id_list: list[str]) -> dict[str, bytes | None]:
+        local_cache = self._get_local_cache()
+        if local_cache is None:
+            return self._get_bytes_multi(id_list)
+
+        backend = type(self).__name__
+        items = local_cache.get_many(id_list)
+        negative_hits = sum(1 for value in items.values() if value is None)
+        hits = len(items) - negative_hits
+        if hits:
+            metrics.incr(
+                "nodestore.local_cache.get",
+                amount=hits,
+                tags={"backend": backend, "result": "hit"},
+            )
+        if negative_hits:
+            metrics.incr(
+                "nodestore.local_cache.get",
+                amount=negative_hits,
+                tags={"backend": backend, "result": "negative_hit"},
+            )
+
+        missing_ids = [id for id in id_list if id not in items]
+        if missing_ids:
+            metrics.incr(
+                "nodestore.local_cache.get",
+                amount=len(missing_ids),
+                tags={"backend": backend, "result": "miss"},
+            )
+            if len(missing_ids) == 1:
+                fetched = {missing_ids[0]: self._get_bytes(missing_ids[0])}
+            else:
+                fetched = self._get_bytes_multi(missing_ids)
+            # Backends may leave out ids they did not find
+            for id in missing_ids:
+                fetched.setdefault(id, None)
+            local_cache.set_many(fetched)
+            items.update(fetched)
+
+        metrics.gauge("nodestore.local_cache.size", local_cache.size, tags={"backend": backend})
+        return items
 
     @cached_property
     def cache(self) -> BaseCache | None:
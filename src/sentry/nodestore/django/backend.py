@@ -27,6 +27,7 @@ class DjangoNodeStorage(NodeStorage):
             return None
 
         try:
+            value = self._decompress(value)
             if value.startswith(b"{"):
                 return NodeStorage._decode(self, value, subkey=subkey)
 
@@ -62,8 +63,7 @@ class DjangoNodeStorage(NodeStorage):
         days = math.floor(total_seconds / 86400)
 
         BulkDeleteQuery(model=Node, dtfield="timestamp", days=days).execute()
-        if self.cache:
-            self.cache.clear()
+        self._clear_cache()
 
     def bootstrap(self) -> None:
         # Nothing for Django backend to do during bootstrap
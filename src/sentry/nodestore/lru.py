@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from time import monotonic
+
+
+class LocalNodeCache:
+    """
+    Process-local LRU cache of raw nodestore blobs.
+
+    The cache is bounded by the total size of the cached blobs rather than by
+    the number of entries, since event payloads vary wildly in size. Blobs are
+    cached as the bytes returned by the backend (and decoded on every read) so
+    that callers never share, and accidentally mutate, the same decoded
+    payload.
+
+    Lookups that found nothing are cached as well, but only for
+    ``negative_ttl`` seconds, as the node might just not have been written
+    yet. They are accounted for with the size of their id.
+    """
+
+    def __init__(self, max_bytes: int, negative_ttl: float) -> None:
+        self.max_bytes = max_bytes
+        self.negative_ttl = negative_ttl
+        self.size = 0
+        # id => (blob or None, expiry of negative entries, accounted size)
+        self._items: OrderedDict[str, tuple[bytes | None, float | None, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, id_list: Iterable[str]) -> dict[str, bytes | None]:
+        """
+        Return the cached entries for the given ids. A cached miss is returned
+        as ``None``, ids that are not cached at all are left out.
+        """
+        now = monotonic()
+        rv = {}
+        with self._lock:
+            for id in id_list:
+                item = self._items.get(id)
+                if item is None:
+                    continue
+
+                value, expires_at, _ = item
+                if expires_at is not None and expires_at <= now:
+                    self._pop(id)
+                    continue
+
+                self._items.move_to_end(id)
+                rv[id] = value
+        return rv
+
+    def set(self, id: str, value: bytes | None) -> None:
+        if value is not None and len(value) > self.max_bytes:
+            # Never let a single huge node flush the whole cache.
+            self.delete_many([id])
+            return
+
+        if value is not None:
+            expires_at = None
+            size = len(value)
+        else:
+            expires_at = monotonic() + self.negative_ttl
+            size = len(id)
+
+        with self._lock:
+            self._pop(id)
+            self._items[id] = (value, expires_at, size)
+            self.size += size
+            self._evict()
+
+    def set_many(self, items: dict[str, bytes | None]) -> None:
+        for id, value in items.items():
+            self.set(id, value)
+
+    def delete_many(self, id_list: Iterable[str]) -> None:
+        with self._lock:
+            for id in id_list:
+                self._pop(id)
+
+    def resize(self, max_bytes: int, negative_ttl: float) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self.negative_ttl = negative_ttl
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def _pop(self, id: str) -> None:
+        item = self._items.pop(id, None)
+        if item is not None:
+            self.size -= item[2]
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes and self._items:
+            _, (_, _, size) = self._items.popitem(last=False)
+            self.size -= size
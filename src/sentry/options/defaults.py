@@ -1096,6 +1096,19 @@ register("relay.force_full_normalization", default=False, flags=FLAG_AUTOMATOR_M
 # Controls whether processing relays should skip normalization.
 register("relay.disable_normalization.processing", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Sections of project configs that serialize to at least this many bytes are
+# stored once per organization and content in the project config cache, and
+# referenced from the configs of all keys sharing them. `0` disables this.
+# Only applies when the `shared_sections` option of the cache is set in
+# SENTRY_RELAY_PROJECTCONFIG_CACHE_OPTIONS, which requires Relay to resolve the
+# references, as Relay reads the configs from the cache directly.
+register(
+    "relay.projectconfig-cache.shared-sections-min-size",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Write new kafka headers in eventstream
 register("eventstream:kafka-headers", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
@@ -1877,6 +1890,17 @@ register("span_descs.bump-lifetime-sample-rate", default=0.25, flags=FLAG_AUTOMA
 register(
     "nodestore.set-subkeys.enable-set-cache-item", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
+# Size in bytes of the process-local LRU cache of node blobs kept by each
+# nodestore backend. Disabled when set to 0.
+register("nodestore.local-cache.max-bytes", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# How long (in seconds) a node that could not be found is remembered as missing
+# by the process-local cache.
+register("nodestore.local-cache.negative-ttl", default=5.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Fraction of nodes whose data repeating across events (such as debug images and
+# SDK modules) is stored once per project and checksum of its content, see
+# `sentry.eventstore.compressor`. Only applies to nodes written with the default
+# TTL of the nodestore backend.
+register("nodestore.compressor.sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # === Backpressure related runtime options ===
 
@@ -2370,6 +2394,10 @@ register(
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# How long (in seconds) grouphashes which are assigned to a group are cached
+# during ingest. Disabled when set to 0.
+register("grouping.grouphash-cache-ttl", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # Rates controlling the rollout of grouping parameterization experiments
 register(
     "grouping.experiments.parameterization.uniq_id",
@@ -2452,6 +2480,12 @@ register(
     default=120,  # 2 minutes
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+register(
+    "standalone-spans.buffer-max-segments-per-poll",
+    type=Int,
+    default=10_000,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "standalone-spans.buffer-ttl.seconds",
     type=Int,
@@ -2637,3 +2671,11 @@ register(
     default=20,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Number of records fetched from a digest timeline at once when building a
+# digest, 0 fetches and builds the whole digest at once.
+register(
+    "digests.stream-page-size",
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
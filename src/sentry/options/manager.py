@@ -319,8 +319,10 @@ class OptionsManager:
                 except KeyError:
                     optval = opt.default()
         # options already present in store are cached by store
-        # caching here to avoid database queries
-        self.store.set_cache(opt, optval)
+        # caching here to avoid database queries, unless the store reads
+        # from a snapshot which already knows the option is not stored
+        if self.store.get_snapshot() is None:
+            self.store.set_cache(opt, optval)
         return optval
 
     def delete(self, key: str):
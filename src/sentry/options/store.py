@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import os
+import threading
+from collections.abc import Mapping
 from random import random
 from time import time
+from types import MappingProxyType
 from typing import Any
+from uuid import uuid4
 
 from django.conf import settings
 from django.db.utils import OperationalError, ProgrammingError
@@ -16,6 +21,11 @@ from sentry.options.manager import UpdateChannel
 CACHE_FETCH_ERR = "Unable to fetch option cache for %s"
 CACHE_UPDATE_ERR = "Unable to update option cache for %s"
 
+# Network cache key holding the version of the stored options. It changes
+# whenever an option is set or deleted, which tells every process holding a
+# snapshot to fetch a new one.
+SNAPSHOT_VERSION_CACHE_KEY = "o:snapshot-version"
+
 logger = logging.getLogger("sentry")
 
 
@@ -51,6 +61,16 @@ class Key:
         return False
 
 
+@dataclasses.dataclass(frozen=True)
+class OptionsSnapshot:
+    """
+    Immutable copy of all options in the store at the given version.
+    """
+
+    version: str | None
+    values: Mapping[str, Any]
+
+
 def _make_cache_value(key, value):
     now = int(time())
     return (value, now + key.ttl, now + key.ttl + key.grace)
@@ -72,6 +92,11 @@ class OptionsStore:
         self.cache = cache
         self.ttl = ttl
         self.flush_local_cache()
+        self._snapshot: OptionsSnapshot | None = None
+        self._snapshot_interval: float | None = None
+        self._snapshot_thread: threading.Thread | None = None
+        self._snapshot_stop = threading.Event()
+        self._snapshot_fork_hook = False
 
     @property
     def model(self):
@@ -89,7 +114,14 @@ class OptionsStore:
     def get(self, key, silent=False):
         """
         Fetches a value from the options store.
+
+        Once a snapshot of the store has been loaded, values are read from
+        the snapshot only.
         """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot.values.get(key.name)
+
         result = self.get_cache(key, silent=silent)
         if result is not None:
             return result
@@ -234,6 +266,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.set_store(key, value, channel)
+        self._update_snapshot(key, value)
         return self.set_cache(key, value)
 
     def set_store(self, key, value, channel: UpdateChannel):
@@ -275,6 +308,7 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.delete_store(key)
+        self._update_snapshot(key, None)
         return self.delete_cache(key)
 
     def delete_store(self, key):
@@ -340,6 +374,90 @@ class OptionsStore:
         if random() < 0.25:
             self.clean_local_cache()
 
+    def get_snapshot(self) -> OptionsSnapshot | None:
+        return self._snapshot
+
+    def refresh_snapshot(self) -> None:
+        """
+        Replace the snapshot with the current contents of the store, unless
+        the version of the store has not changed since the snapshot was
+        taken. All options are fetched with a single query.
+        """
+        version = None
+        if self.cache is not None:
+            try:
+                version = self.cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+            except Exception:
+                logger.warning(CACHE_FETCH_ERR, SNAPSHOT_VERSION_CACHE_KEY, exc_info=True)
+
+        snapshot = self._snapshot
+        if snapshot is not None and version is not None and snapshot.version == version:
+            return
+
+        with in_test_hide_transaction_boundary():
+            values = dict(self.model.objects.values_list("key", "value"))
+        self._snapshot = OptionsSnapshot(version=version, values=MappingProxyType(values))
+
+    def _update_snapshot(self, key, value) -> None:
+        # Apply the change to the snapshot of this process right away, if it
+        # has one, and notify all other processes by changing the version of
+        # the store. The version is changed even without a local snapshot, as
+        # processes like ``sentry configoptions`` never take one.
+        snapshot = self._snapshot
+        if snapshot is not None:
+            values = {k: v for k, v in snapshot.values.items() if k != key.name}
+            if value is not None:
+                values[key.name] = value
+            self._snapshot = OptionsSnapshot(version=None, values=MappingProxyType(values))
+
+        try:
+            self.cache.set(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
+        except Exception:
+            logger.warning(CACHE_UPDATE_ERR, SNAPSHOT_VERSION_CACHE_KEY, exc_info=True)
+
+    def start_snapshot_refresh(self, interval: float) -> None:
+        """
+        Read options from a snapshot of the store that is refreshed in the
+        background every ``interval`` seconds, instead of checking the local
+        cache, network cache and database for every option that is read.
+
+        The snapshot is refreshed in forked processes as well.
+        """
+        self._snapshot_interval = interval
+        if not self._snapshot_fork_hook:
+            os.register_at_fork(after_in_child=self._start_snapshot_thread)
+            self._snapshot_fork_hook = True
+        self._start_snapshot_thread()
+
+    def _start_snapshot_thread(self) -> None:
+        if self._snapshot_interval is None:
+            return
+
+        # Threads do not survive a fork, the stop event of the parent's thread
+        # is replaced along with it.
+        self._snapshot_stop = threading.Event()
+        self._snapshot_thread = threading.Thread(
+            target=self._run_snapshot_refresh,
+            args=(self._snapshot_interval, self._snapshot_stop),
+            name="options-snapshot",
+            daemon=True,
+        )
+        self._snapshot_thread.start()
+
+    def _run_snapshot_refresh(self, interval: float, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                self.refresh_snapshot()
+            except Exception:
+                logger.warning("options.snapshot-refresh-failed", exc_info=True)
+            stop.wait(interval)
+
+    def stop_snapshot_refresh(self) -> None:
+        self._snapshot_interval = None
+        self._snapshot_stop.set()
+        self._snapshot_thread = None
+        self._snapshot = None
+
     def close(self) -> None:
         self.clean_local_cache()
 
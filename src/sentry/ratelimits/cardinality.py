@@ -1,4 +1,7 @@
-from collections.abc import Mapping, Sequence
+import hashlib
+import math
+import time
+from collections.abc import Iterable, Mapping, Sequence
 
 from sentry_redis_tools.cardinality_limiter import CardinalityLimiter as CardinalityLimiterBase
 from sentry_redis_tools.cardinality_limiter import GrantedQuota, Quota
@@ -6,7 +9,7 @@ from sentry_redis_tools.cardinality_limiter import (
     RedisCardinalityLimiter as RedisCardinalityLimiterImpl,
 )
 from sentry_redis_tools.cardinality_limiter import RequestedQuota
-from sentry_redis_tools.clients import BlasterClient, RedisCluster
+from sentry_redis_tools.clients import BlasterClient, RedisCluster, StrictRedis
 
 from sentry.utils import metrics, redis
 from sentry.utils.redis_metrics import RedisToolsMetricsBackend
@@ -71,3 +74,182 @@ class RedisCardinalityLimiter(CardinalityLimiter):
         timestamp: Timestamp,
     ) -> None:
         return self.impl.use_quotas(grants, timestamp)
+
+
+class RedisSketchCardinalityLimiter(CardinalityLimiter):
+    """
+    A cardinality limiter that stores a fixed amount of data per prefix in
+    Redis, no matter how many distinct hashes are seen, at the cost of
+    approximate accounting.
+
+    * The number of hashes admitted in the sliding window is counted with one
+      HyperLogLog per granule (at most 12kB each, with a standard error of
+      0.81%).
+    * Whether a hash has been admitted before, and therefore does not count
+      against the quota, is looked up in a Bloom filter stored as a Redis
+      bitmap. There is one filter per window-sized generation and both the
+      current and the previous generation are checked, so a hash is
+      remembered for at least one and at most two windows.
+
+    A false positive of the Bloom filter admits a new hash for free, so
+    `false_positive_rate` bounds the fraction of hashes that are admitted
+    beyond the limit.
+    """
+
+    def __init__(
+        self,
+        cluster: str = "default",
+        false_positive_rate: float = 0.001,
+    ) -> None:
+        """
+        :param cluster: Name of the redis cluster to use, to be configured with
+            the `redis.clusters` Sentry option (like any other redis cluster in
+            Sentry).
+        :param false_positive_rate: The probability that a hash that has never
+            been admitted is mistaken for one that has, when no more hashes
+            than the quota's limit have been admitted. Determines the size of
+            the Bloom filters.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.client = redis.redis_clusters.get(cluster)
+        assert isinstance(self.client, (StrictRedis, RedisCluster)), self.client
+        self.false_positive_rate = false_positive_rate
+
+        super().__init__()
+
+    def _get_filter_size(self, quota: Quota) -> tuple[int, int]:
+        """
+        Returns the number of bits and the number of hash functions of the
+        Bloom filter for the given quota.
+        """
+        # A generation can hold up to two windows' worth of admitted hashes,
+        # as seen hashes of the previous generation are added to the current one.
+        capacity = max(1, 2 * quota.limit)
+        num_bits = math.ceil(-capacity * math.log(self.false_positive_rate) / math.log(2) ** 2)
+        # Redis bitmaps are limited to 512MB
+        num_bits = min(num_bits, 2**32)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return num_bits, num_hashes
+
+    def _get_bit_offsets(self, unit_hash: Hash, num_bits: int, num_hashes: int) -> Iterable[int]:
+        digest = hashlib.blake2b(str(unit_hash).encode("ascii"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % num_bits for i in range(num_hashes))
+
+    def _get_filter_key(self, prefix: str, quota: Quota, generation: int) -> str:
+        # All keys of a prefix share a hash tag, so that the HyperLogLogs of a
+        # window can be counted with a single command on Redis Cluster.
+        return f"cardinality:bloom:{{{prefix}}}:{quota.window_seconds}:{generation}"
+
+    def _get_counter_key(self, prefix: str, quota: Quota, granule: int) -> str:
+        window = f"{quota.window_seconds}-{quota.granularity_seconds}"
+        return f"cardinality:hll:{{{prefix}}}:{window}:{granule}"
+
+    def check_within_quotas(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
+    ) -> tuple[Timestamp, Sequence[GrantedQuota]]:
+        if timestamp is None:
+            timestamp = int(time.time())
+        else:
+            timestamp = int(timestamp)
+
+        # request => bit offsets of every unit hash
+        request_offsets = []
+
+        with self.client.pipeline(transaction=False) as pipeline:
+            for request in requests:
+                quota = request.quota
+                pipeline.pfcount(
+                    *(
+                        self._get_counter_key(request.prefix, quota, granule)
+                        for granule in quota.iter_window(timestamp)
+                    )
+                )
+
+                num_bits, num_hashes = self._get_filter_size(quota)
+                offsets = [
+                    list(self._get_bit_offsets(unit_hash, num_bits, num_hashes))
+                    for unit_hash in request.unit_hashes
+                ]
+                request_offsets.append(offsets)
+
+                generation = timestamp // quota.window_seconds
+                for key in (
+                    self._get_filter_key(request.prefix, quota, generation),
+                    self._get_filter_key(request.prefix, quota, generation - 1),
+                ):
+                    args: list[str | int] = []
+                    for hash_offsets in offsets:
+                        for offset in hash_offsets:
+                            args.extend(("GET", "u1", offset))
+                    pipeline.execute_command("BITFIELD", key, *args)
+
+            results = iter(pipeline.execute())
+
+        grants = []
+        for request, offsets in zip(requests, request_offsets):
+            remaining_limit = max(0, request.quota.limit - int(next(results)))
+            current_bits = iter(next(results) or ())
+            previous_bits = iter(next(results) or ())
+
+            granted_hashes = []
+            reached_quota = None
+            for unit_hash, hash_offsets in zip(request.unit_hashes, offsets):
+                # Consume the bits of every hash from both filters, even if the
+                # result is already known.
+                in_current = all([next(current_bits) for _ in hash_offsets])
+                in_previous = all([next(previous_bits) for _ in hash_offsets])
+
+                if in_current or in_previous:
+                    granted_hashes.append(unit_hash)
+                elif remaining_limit > 0:
+                    granted_hashes.append(unit_hash)
+                    remaining_limit -= 1
+                else:
+                    reached_quota = request.quota
+
+            grants.append(
+                GrantedQuota(
+                    request=request,
+                    granted_unit_hashes=granted_hashes,
+                    reached_quota=reached_quota,
+                )
+            )
+
+        return timestamp, grants
+
+    def use_quotas(
+        self,
+        grants: Sequence[GrantedQuota],
+        timestamp: Timestamp,
+    ) -> None:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for grant in grants:
+                if not grant.granted_unit_hashes:
+                    continue
+
+                prefix = grant.request.prefix
+                quota = grant.request.quota
+
+                counter_key = self._get_counter_key(
+                    prefix, quota, next(quota.iter_window(timestamp))
+                )
+                pipeline.pfadd(counter_key, *grant.granted_unit_hashes)
+                pipeline.expire(counter_key, quota.window_seconds + quota.granularity_seconds)
+
+                num_bits, num_hashes = self._get_filter_size(quota)
+                filter_key = self._get_filter_key(
+                    prefix, quota, timestamp // quota.window_seconds
+                )
+                args: list[str | int] = []
+                for unit_hash in grant.granted_unit_hashes:
+                    for offset in self._get_bit_offsets(unit_hash, num_bits, num_hashes):
+                        args.extend(("SET", "u1", offset, 1))
+                pipeline.execute_command("BITFIELD", filter_key, *args)
+                # The filter of a generation is still read during the next one
+                pipeline.expire(filter_key, 2 * quota.window_seconds)
+
+            pipeline.execute()
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from datetime import datetime, timezone
-from typing import Any, Literal, NotRequired, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict, TypeVar
 
 import sentry_sdk
 from sentry_sdk import capture_exception
@@ -87,12 +87,56 @@ MIN_CLUSTERER_RUNS = 10
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class ConfigSectionCache:
+    """
+    Memoizes the sections of project configs that only depend on the
+    organization (its options, feature flags and quotas), while the configs of
+    many of its projects are computed at once, such as when all configs of an
+    organization are invalidated.
+
+    Sections are never invalidated, so an instance must only be used for a
+    single pass over the projects. Cached sections are shared between configs
+    and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._sections: dict[tuple[str, int], Any] = {}
+
+    def get(self, section: str, organization_id: int, compute: Callable[[], T]) -> T:
+        key = (section, organization_id)
+        try:
+            return self._sections[key]
+        except KeyError:
+            pass
+
+        value = self._sections[key] = compute()
+        return value
+
+
+def get_exposed_features(
+    project: Project, section_cache: ConfigSectionCache | None = None
+) -> Sequence[str]:
+    if section_cache is None:
+        section_cache = ConfigSectionCache()
+
+    organization_features = section_cache.get(
+        "organizationFeatures",
+        project.organization_id,
+        lambda: {
+            feature
+            for feature in EXPOSABLE_FEATURES
+            if feature.startswith("organizations:")
+            and features.has(feature, project.organization)
+        },
+    )
 
-def get_exposed_features(project: Project) -> Sequence[str]:
     active_features = []
     for feature in EXPOSABLE_FEATURES:
         if feature.startswith("organizations:"):
-            has_feature = features.has(feature, project.organization)
+            has_feature = feature in organization_features
         elif feature.startswith("projects:"):
             has_feature = features.has(feature, project)
         else:
@@ -329,7 +373,9 @@ def get_metrics_config(timeout: TimeChecker, project: Project) -> Mapping[str, A
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    section_cache: ConfigSectionCache | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -339,6 +385,8 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param section_cache: Shares the organization-wide sections of the config
+        with the configs of other projects computed in the same pass.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.push_scope() as scope:
@@ -347,7 +395,9 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, section_cache=section_cache
+            )
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -987,11 +1037,16 @@ def _get_mobile_performance_profiles(organization: Organization) -> list[dict[st
 
 
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    section_cache: ConfigSectionCache | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
+    if section_cache is None:
+        section_cache = ConfigSectionCache()
+
     public_keys = get_public_key_configs(project_keys=project_keys)
 
     with sentry_sdk.start_span(op="get_public_config"):
@@ -1005,11 +1060,15 @@ def _get_project_config(
             "publicKeys": public_keys,
             "config": {
                 "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "trustedRelays": section_cache.get(
+                    "trustedRelays",
+                    project.organization_id,
+                    lambda: [
+                        r["public_key"]
+                        for r in project.organization.get_option("sentry:trusted-relays", [])
+                        if r
+                    ],
+                ),
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
             },
@@ -1020,7 +1079,7 @@ def _get_project_config(
     config = cfg["config"]
 
     with sentry_sdk.start_span(op="get_exposed_features"):
-        if exposed_features := get_exposed_features(project):
+        if exposed_features := get_exposed_features(project, section_cache):
             config["features"] = exposed_features
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
@@ -1066,11 +1125,15 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_mobile_performance_profiles(project.organization),
-    ]
+    performance_score_profiles = section_cache.get(
+        "performanceScore",
+        project.organization_id,
+        lambda: [
+            *_get_desktop_browser_performance_profiles(project.organization),
+            *_get_mobile_browser_performance_profiles(project.organization),
+            *_get_mobile_performance_profiles(project.organization),
+        ],
+    )
     if performance_score_profiles:
         config["performanceScore"] = {"profiles": performance_score_profiles}
 
@@ -1082,7 +1145,11 @@ def _get_project_config(
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
     with sentry_sdk.start_span(op="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
+        event_retention = section_cache.get(
+            "eventRetention",
+            project.organization_id,
+            lambda: quotas.backend.get_event_retention(project.organization),
+        )
         if event_retention is not None:
             config["eventRetention"] = event_retention
     with sentry_sdk.start_span(op="get_all_quotas"):
@@ -1,7 +1,9 @@
+import hashlib
 import logging
 
 import zstandard
 
+from sentry import options
 from sentry.relay.projectconfig_cache.base import ProjectConfigCache
 from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
@@ -9,10 +11,36 @@ from sentry.utils.redis import validate_dynamic_cluster
 REDIS_CACHE_TIMEOUT = 3600  # 1 hr
 COMPRESSION_LEVEL = 3  # 3 is the default level of compression
 
+#: Field of a stored project config that maps the names of its sections stored
+#: separately to their redis keys.
+SECTIONS_FIELD = "_sections"
+
 logger = logging.getLogger(__name__)
 
 
+def _compress(serialized):
+    return zstandard.compress(serialized, level=COMPRESSION_LEVEL)
+
+
+def _decompress(value):
+    try:
+        value = zstandard.decompress(value)
+    except (TypeError, zstandard.ZstdError):
+        # assume raw json
+        pass
+    return json.loads(value.decode())
+
+
 class RedisProjectConfigCache(ProjectConfigCache):
+    """
+    Project configs are read from the ``relayconfig:<public_key>`` keys by
+    Relay itself, not only by `get`. Configs are therefore only split into
+    shared sections when the ``shared_sections`` option of the cache is set,
+    which requires all Relays reading from the cluster to resolve the
+    `SECTIONS_FIELD` references. Otherwise configs are always written in full,
+    regardless of ``relay.projectconfig-cache.shared-sections-min-size``.
+    """
+
     def __init__(self, **options):
         cluster_key = options.get("cluster", "default")
         self.cluster = redis.redis_clusters.get_binary(cluster_key)
@@ -20,6 +48,8 @@ class RedisProjectConfigCache(ProjectConfigCache):
         read_cluster_key = options.get("read_cluster", cluster_key)
         self.cluster_read = redis.redis_clusters.get_binary(read_cluster_key)
 
+        self.shared_sections = bool(options.get("shared_sections", False))
+
         super().__init__(**options)
 
     def validate(self):
@@ -28,14 +58,64 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def __get_redis_key(self, public_key):
         return f"relayconfig:{public_key}"
 
+    def __get_section_redis_key(self, organization_id, name, serialized):
+        digest = hashlib.blake2b(serialized, digest_size=16).hexdigest()
+        return f"relayconfig-section:{organization_id}:{name}:{digest}"
+
+    def __split_sections(self, config, min_size):
+        """
+        Moves the sections of a project config that are at least `min_size`
+        bytes large out of the config, to be stored once per organization and
+        content. Returns the config with references to the sections in their
+        place, and the serialized sections by their redis keys.
+        """
+        if (
+            not isinstance(config, dict)
+            or "organizationId" not in config
+            or not isinstance(config.get("config"), dict)
+        ):
+            return config, {}
+
+        inner_config = {}
+        references = {}
+        sections = {}
+        for name, value in config["config"].items():
+            serialized = json.dumps(value).encode()
+            if len(serialized) < min_size:
+                inner_config[name] = value
+                continue
+
+            key = self.__get_section_redis_key(config["organizationId"], name, serialized)
+            references[name] = key
+            sections[key] = serialized
+
+        if not references:
+            return config, {}
+
+        return {**config, "config": inner_config, SECTIONS_FIELD: references}, sections
+
     def set_many(self, configs):
         metrics.incr("relay.projectconfig_cache.write", amount=len(configs), tags={"action": "set"})
 
+        min_section_size = 0
+        if self.shared_sections:
+            min_section_size = options.get("relay.projectconfig-cache.shared-sections-min-size")
+        # Sections are usually shared by the configs of many keys of an
+        # organization, but only need to be written once.
+        written_sections = set()
+
         # Note: Those are multiple pipelines, one per cluster node
         p = self.cluster.pipeline()
         for public_key, config in configs.items():
+            if min_section_size > 0:
+                config, sections = self.__split_sections(config, min_section_size)
+                for key, serialized in sections.items():
+                    if key not in written_sections:
+                        written_sections.add(key)
+                        p.setex(key, REDIS_CACHE_TIMEOUT, _compress(serialized))
+
             serialized = json.dumps(config).encode()
-            compressed = zstandard.compress(serialized, level=COMPRESSION_LEVEL)
+            compressed = _compress(serialized)
             metrics.distribution(
                 "relay.projectconfig_cache.uncompressed_size", len(serialized), unit="byte"
             )
@@ -43,6 +123,13 @@ class RedisProjectConfigCache(ProjectConfigCache):
 
             p.setex(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT, compressed)
 
+        if written_sections:
+            metrics.incr(
+                "relay.projectconfig_cache.write",
+                amount=len(written_sections),
+                tags={"action": "set_section"},
+            )
+
         p.execute()
 
     def delete_many(self, public_keys):
@@ -58,11 +145,30 @@ class RedisProjectConfigCache(ProjectConfigCache):
 
     def get(self, public_key):
         rv_b = self.cluster_read.get(self.__get_redis_key(public_key))
-        if rv_b is not None:
-            try:
-                rv = zstandard.decompress(rv_b).decode()
-            except (TypeError, zstandard.ZstdError):
-                # assume raw json
-                pass
-            return json.loads(rv)
-        return None
+        if rv_b is None:
+            return None
+
+        rv = _decompress(rv_b)
+        if isinstance(rv, dict) and SECTIONS_FIELD in rv:
+            return self.__assemble_sections(rv)
+        return rv
+
+    def __assemble_sections(self, config):
+        references = config.pop(SECTIONS_FIELD)
+
+        # Note: Those are multiple pipelines, one per cluster node
+        with self.cluster_read.pipeline() as p:
+            for key in references.values():
+                p.get(key)
+            values = p.execute()
+
+        for name, value in zip(references, values):
+            if value is None:
+                # Sections expire together with the last config that was
+                # written with them, a config referring to a missing section
+                # is treated as missing as well.
+                metrics.incr("relay.projectconfig_cache.missing_section")
+                return None
+            config["config"][name] = _decompress(value)
+
+        return config
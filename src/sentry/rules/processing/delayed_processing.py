@@ -19,6 +19,7 @@ from sentry.rules.conditions.event_frequency import (
     BaseEventFrequencyCondition,
     ComparisonType,
     EventFrequencyConditionData,
+    percent_increase,
 )
 from sentry.rules.processing.processor import (
     PROJECT_ID_BUFFER_LIST_KEY,
@@ -43,9 +44,34 @@ class UniqueCondition(NamedTuple):
     cls_id: str
     interval: str
     environment_id: int
+    # Only set for conditions comparing against an earlier window (percent comparisons)
+    comparison_interval: str | None = None
 
     def __repr__(self):
-        return f"id: {self.cls_id},\ninterval: {self.interval},\nenv id: {self.environment_id}"
+        return (
+            f"id: {self.cls_id},\ninterval: {self.interval},\nenv id: {self.environment_id},"
+            f"\ncomparison interval: {self.comparison_interval}"
+        )
+
+
+class UniqueConditionQuery(NamedTuple):
+    """
+    A single Snuba query, which can serve multiple unique conditions: conditions of the same
+    class, interval and environment share the query for the current window, even when they
+    compare it against different earlier windows.
+    """
+
+    cls_id: str
+    interval: str
+    environment_id: int
+    # How far back the queried window ends, `None` for the current window
+    offset: str | None = None
+
+    def __repr__(self):
+        return (
+            f"id: {self.cls_id},\ninterval: {self.interval},\nenv id: {self.environment_id},"
+            f"\noffset: {self.offset}"
+        )
 
 
 class DataAndGroups(NamedTuple):
@@ -69,6 +95,22 @@ def get_slow_conditions(rule: Rule) -> list[EventFrequencyConditionData]:
     return slow_conditions  # type: ignore[return-value]
 
 
+def get_unique_condition(
+    condition_data: EventFrequencyConditionData, environment_id: int
+) -> UniqueCondition:
+    comparison_interval = None
+    if condition_data.get("comparisonType", ComparisonType.COUNT) == ComparisonType.PERCENT:
+        comparison_interval = condition_data.get(
+            "comparisonInterval", DEFAULT_COMPARISON_INTERVAL
+        )
+    return UniqueCondition(
+        str(condition_data["id"]),
+        str(condition_data["interval"]),
+        environment_id,
+        comparison_interval,
+    )
+
+
 def get_rules_to_groups(rulegroup_to_event_data: dict[str, str]) -> DefaultDict[int, set[int]]:
     rules_to_groups: DefaultDict[int, set[int]] = defaultdict(set)
     for rule_group in rulegroup_to_event_data:
@@ -107,9 +149,7 @@ def get_condition_groups(
         slow_conditions = get_slow_conditions(rule)
         for condition_data in slow_conditions:
             if condition_data:
-                unique_condition = UniqueCondition(
-                    condition_data["id"], condition_data["interval"], rule.environment_id
-                )
+                unique_condition = get_unique_condition(condition_data, rule.environment_id)
                 # Add to set of group_ids if there are already group_ids
                 # that apply to the unique condition
                 if data_and_groups := condition_groups.get(unique_condition):
@@ -123,16 +163,48 @@ def get_condition_groups(
     return condition_groups
 
 
-def get_condition_group_results(
+def get_condition_queries(unique_condition: UniqueCondition) -> list[UniqueConditionQuery]:
+    """
+    Returns the queries needed to evaluate a unique condition: the current window, and for
+    percent comparisons also the window it is compared against.
+    """
+    queries = [
+        UniqueConditionQuery(
+            unique_condition.cls_id, unique_condition.interval, unique_condition.environment_id
+        )
+    ]
+    if unique_condition.comparison_interval is not None:
+        queries.append(queries[0]._replace(offset=unique_condition.comparison_interval))
+    return queries
+
+
+def get_condition_query_groups(
     condition_groups: dict[UniqueCondition, DataAndGroups],
-    project: Project,
-) -> dict[UniqueCondition, dict[int, int]] | None:
-    condition_group_results: dict[UniqueCondition, dict[int, int]] = {}
+) -> dict[UniqueConditionQuery, DataAndGroups]:
+    """
+    Plans the Snuba queries for all unique conditions, merging the ones that query the same
+    window into a single query over the union of their groups.
+    """
+    condition_query_groups: dict[UniqueConditionQuery, DataAndGroups] = {}
     for unique_condition, (condition_data, group_ids) in condition_groups.items():
-        condition_cls = rules.get(unique_condition.cls_id)
+        for query in get_condition_queries(unique_condition):
+            if data_and_groups := condition_query_groups.get(query):
+                data_and_groups.group_ids.update(group_ids)
+            else:
+                condition_query_groups[query] = DataAndGroups(condition_data, set(group_ids))
+    return condition_query_groups
+
+
+def get_condition_query_results(
+    condition_query_groups: dict[UniqueConditionQuery, DataAndGroups],
+    project: Project,
+) -> dict[UniqueConditionQuery, dict[int, int]] | None:
+    condition_query_results: dict[UniqueConditionQuery, dict[int, int]] = {}
+    for query, (condition_data, group_ids) in condition_query_groups.items():
+        condition_cls = rules.get(query.cls_id)
 
         if condition_cls is None:
-            logger.warning("Unregistered condition %r", unique_condition.cls_id)
+            logger.warning("Unregistered condition %r", query.cls_id)
             return None
 
         # MyPy refuses to make TypedDict compatible with MutableMapping
@@ -142,24 +214,62 @@ def get_condition_group_results(
             logger.warning("Unregistered condition %r", condition_cls.id)
             return None
 
-        _, duration = condition_inst.intervals[unique_condition.interval]
-        comparison_interval = condition_inst.intervals[
-            condition_data.get("comparisonInterval", DEFAULT_COMPARISON_INTERVAL)
-        ][1]
-        comparison_type = (
-            condition_data.get("comparisonType", ComparisonType.COUNT)
-            if condition_data
-            else ComparisonType.COUNT
-        )
-        result = safe_execute(
-            condition_inst.get_rate_bulk,
-            duration,
-            comparison_interval,
-            group_ids,
-            unique_condition.environment_id,
-            comparison_type,
-        )
-        condition_group_results[unique_condition] = result or {}
+        _, duration = condition_inst.intervals[query.interval]
+        offset = timedelta()
+        if query.offset is not None:
+            offset = condition_inst.intervals[query.offset][1]
+        start, end = condition_inst.get_comparison_start_end(offset, duration)
+
+        with condition_inst.disable_consistent_snuba_mode(duration):
+            result = safe_execute(
+                condition_inst.batch_query,
+                group_ids=group_ids,
+                start=start,
+                end=end,
+                environment_id=query.environment_id,
+            )
+        if result is not None:
+            condition_query_results[query] = result
+    return condition_query_results
+
+
+def get_condition_group_results(
+    condition_groups: dict[UniqueCondition, DataAndGroups],
+    project: Project,
+) -> dict[UniqueCondition, dict[int, int]] | None:
+    condition_query_groups = get_condition_query_groups(condition_groups)
+    condition_query_results = get_condition_query_results(condition_query_groups, project)
+    if condition_query_results is None:
+        return None
+
+    queries_without_planning = sum(
+        len(get_condition_queries(unique_condition)) for unique_condition in condition_groups
+    )
+    metrics.incr("delayed_processing.condition_queries", amount=len(condition_query_groups))
+    metrics.incr(
+        "delayed_processing.condition_queries_saved",
+        amount=queries_without_planning - len(condition_query_groups),
+    )
+
+    condition_group_results: dict[UniqueCondition, dict[int, int]] = {}
+    for unique_condition, (_, group_ids) in condition_groups.items():
+        current_query, *comparison_queries = get_condition_queries(unique_condition)
+        current_result = condition_query_results.get(current_query)
+        if current_result is None:
+            condition_group_results[unique_condition] = {}
+            continue
+
+        result = {group_id: current_result.get(group_id, 0) for group_id in group_ids}
+        if comparison_queries:
+            comparison_result = condition_query_results.get(comparison_queries[0])
+            if comparison_result is None:
+                condition_group_results[unique_condition] = {}
+                continue
+            result = {
+                group_id: percent_increase(count, comparison_result.get(group_id, 0))
+                for group_id, count in result.items()
+            }
+        condition_group_results[unique_condition] = result
     return condition_group_results
 
 
@@ -174,11 +284,7 @@ def get_rules_to_fire(
         for group_id in rules_to_groups[alert_rule.id]:
             conditions_matched = 0
             for slow_condition in slow_conditions:
-                unique_condition = UniqueCondition(
-                    str(slow_condition.get("id")),
-                    str(slow_condition.get("interval")),
-                    alert_rule.environment_id,
-                )
+                unique_condition = get_unique_condition(slow_condition, alert_rule.environment_id)
                 results = condition_group_results.get(unique_condition, {})
                 if results:
                     target_value = float(str(slow_condition.get("value")))
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 import uuid
+from collections import defaultdict
 from collections.abc import Callable, Collection, Mapping, MutableMapping, Sequence
-from datetime import timedelta
+from datetime import datetime, timedelta
+from enum import Enum
 from random import randrange
 from typing import Any
 
 from django.core.cache import cache
+from django.db.models import Q
 from django.utils import timezone
 
 from sentry import analytics, buffer, features
@@ -143,6 +146,38 @@ def bulk_get_rule_status(
     return rule_statuses
 
 
+def bulk_activate_rule_status(
+    rule_statuses: Sequence[tuple[Rule, GroupRuleStatus]], now: datetime
+) -> list[Rule]:
+    """
+    Marks the statuses of the given rules as active with a single update, skipping statuses that
+    were activated within their rule's frequency. Returns the rules whose status got activated.
+    """
+    status_ids_by_frequency: MutableMapping[int, list[int]] = defaultdict(list)
+    for rule, status in rule_statuses:
+        frequency = rule.data.get("frequency") or Rule.DEFAULT_FREQUENCY
+        status_ids_by_frequency[frequency].append(status.id)
+
+    condition = Q()
+    for frequency, status_ids in status_ids_by_frequency.items():
+        condition |= Q(id__in=status_ids) & (
+            Q(last_active__isnull=True) | Q(last_active__lte=now - timedelta(minutes=frequency))
+        )
+
+    updated = GroupRuleStatus.objects.filter(condition).update(last_active=now)
+    if updated == len(rule_statuses):
+        return [rule for rule, _ in rule_statuses]
+
+    # Some of the statuses have been activated concurrently, e.g. while processing another event
+    # of the same group. Ours are the ones carrying our timestamp.
+    activated_ids = set(
+        GroupRuleStatus.objects.filter(
+            id__in=[status.id for _, status in rule_statuses], last_active=now
+        ).values_list("id", flat=True)
+    )
+    return [rule for rule, status in rule_statuses if status.id in activated_ids]
+
+
 def activate_downstream_actions(
     rule: Rule,
     event: GroupEvent,
@@ -181,6 +216,11 @@ def activate_downstream_actions(
     return grouped_futures
 
 
+class RuleOutcome(Enum):
+    FIRE = "fire"
+    ENQUEUE = "enqueue"
+
+
 class RuleProcessor:
     def __init__(
         self,
@@ -204,6 +244,7 @@ class RuleProcessor:
         self.grouped_futures: MutableMapping[
             str, tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]
         ] = {}
+        self._condition_results: MutableMapping[str, bool | None] = {}
 
     def get_rules(self) -> Sequence[Rule]:
         """Get all of the rules for this project from the DB (or cache)."""
@@ -216,6 +257,17 @@ class RuleProcessor:
         state: EventState,
         rule: Rule,
     ) -> bool | None:
+        # Projects often have many rules sharing the same conditions and filters. Their result
+        # only depends on the event and the rule's environment, so they are evaluated once per
+        # event.
+        try:
+            cache_key: str | None = hash_values([condition, rule.environment_id])
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in self._condition_results:
+            return self._condition_results[cache_key]
+
         condition_cls = rules.get(condition["id"])
         if condition_cls is None:
             logger.warning("Unregistered condition %r", condition["id"])
@@ -225,7 +277,11 @@ class RuleProcessor:
         if not isinstance(condition_inst, (EventCondition, EventFilter)):
             logger.warning("Unregistered condition %r", condition["id"])
             return None
-        return safe_execute(condition_inst.passes, self.event, state) or False
+        result = safe_execute(condition_inst.passes, self.event, state) or False
+
+        if cache_key is not None:
+            self._condition_results[cache_key] = result
+        return result
 
     def get_state(self) -> EventState:
         return EventState(
@@ -251,29 +307,46 @@ class RuleProcessor:
         return fast_conditions, slow_conditions
 
     def enqueue_rule(self, rule: Rule) -> None:
-        logger.info(
-            "rule_processor.rule_enqueued",
-            extra={"rule": rule.id, "group": self.group.id, "project": rule.project.id},
-        )
-        buffer.backend.push_to_sorted_set(PROJECT_ID_BUFFER_LIST_KEY, rule.project.id)
+        self.enqueue_rules([rule])
+
+    def enqueue_rules(self, rules: Sequence[Rule]) -> None:
+        """
+        Adds the rules to the buffer of rules whose slow conditions are evaluated later on, with a
+        single write for all of them.
+        """
+        if not rules:
+            return
+
+        for rule in rules:
+            logger.info(
+                "rule_processor.rule_enqueued",
+                extra={"rule": rule.id, "group": self.group.id, "project": rule.project.id},
+            )
+        buffer.backend.push_to_sorted_set(PROJECT_ID_BUFFER_LIST_KEY, self.project.id)
 
         value = json.dumps(
             {"event_id": self.event.event_id, "occurrence_id": self.event.occurrence_id}
         )
-        buffer.backend.push_to_hash(
+        buffer.backend.push_to_hash_bulk(
             model=Project,
-            filters={"project_id": rule.project.id},
-            field=f"{rule.id}:{self.group.id}",
-            value=value,
+            filters={"project_id": self.project.id},
+            data={f"{rule.id}:{self.group.id}": value for rule in rules},
         )
-        metrics.incr("delayed_rule.group_added")
+        metrics.incr("delayed_rule.group_added", amount=len(rules))
 
-    def apply_rule(self, rule: Rule, status: GroupRuleStatus) -> None:
+    def evaluate_rule(
+        self,
+        rule: Rule,
+        status: GroupRuleStatus,
+        environment: Environment,
+        now: datetime,
+        process_slow_conditions_later: bool,
+    ) -> RuleOutcome | None:
         """
-        If all conditions and filters pass, execute every action.
+        Evaluates the filters and conditions of the rule against the event.
 
-        :param rule: `Rule` object
-        :return: void
+        :return: whether the rule should fire, be enqueued to evaluate its slow
+            conditions later, or `None` if nothing should happen
         """
         logging_details = {
             "rule_id": rule.id,
@@ -290,25 +363,17 @@ class RuleProcessor:
         condition_match = rule.data.get("action_match") or Rule.DEFAULT_CONDITION_MATCH
         filter_match = rule.data.get("filter_match") or Rule.DEFAULT_FILTER_MATCH
         frequency = rule.data.get("frequency") or Rule.DEFAULT_FREQUENCY
-        try:
-            environment = self.event.get_environment()
-        except Environment.DoesNotExist:
-            return
 
         if rule.environment_id is not None and environment.id != rule.environment_id:
-            return
+            return None
 
-        now = timezone.now()
         freq_offset = now - timedelta(minutes=frequency)
         if status.last_active and status.last_active > freq_offset:
-            return
+            return None
 
         state = self.get_state()
         condition_list, filter_list = split_conditions_and_filters(rule.data.get("conditions", ()))
         fast_conditions, slow_conditions = self.group_conditions_by_speed(condition_list)
-        process_slow_conditions_later = features.has(
-            "organizations:process-slow-alerts", self.project.organization
-        )
         condition_list = fast_conditions
         if not process_slow_conditions_later:
             condition_list = fast_conditions + slow_conditions  # type: ignore[operator]
@@ -319,7 +384,7 @@ class RuleProcessor:
             predicate_func = get_match_function(filter_match)
             if predicate_func:
                 if not predicate_func(predicate_iter):
-                    return
+                    return None
             else:
                 log_string = f"Unsupported filter_match {filter_match} for rule {rule.id}"
                 logger.error(
@@ -328,7 +393,7 @@ class RuleProcessor:
                     rule.id,
                     extra={**logging_details},
                 )
-                return
+                return None
 
         predicate_func = get_match_function(condition_match)
         if not predicate_func and (slow_conditions or fast_conditions):
@@ -339,7 +404,7 @@ class RuleProcessor:
                 rule.id,
                 extra={**logging_details},
             )
-            return
+            return None
 
         if slow_conditions or fast_conditions:
             predicate_iter = (self.condition_matches(f, state, rule) for f in condition_list)
@@ -349,28 +414,23 @@ class RuleProcessor:
 
             if condition_match == "any":
                 if not result and slow_conditions and process_slow_conditions_later:
-                    self.enqueue_rule(rule)
-                    return
+                    return RuleOutcome.ENQUEUE
                 elif not result:
-                    return
+                    return None
 
             elif condition_match == "all":
                 if not result:
-                    return
+                    return None
 
                 if slow_conditions and process_slow_conditions_later:
-                    self.enqueue_rule(rule)
-                    return
+                    return RuleOutcome.ENQUEUE
 
-        updated = (
-            GroupRuleStatus.objects.filter(id=status.id)
-            .exclude(last_active__gt=freq_offset)
-            .update(last_active=now)
-        )
-
-        if not updated:
-            return
+        return RuleOutcome.FIRE
 
+    def fire_rule(self, rule: Rule) -> None:
+        """
+        Executes every action of a rule whose status has been activated.
+        """
         if randrange(10) == 0:
             analytics.record(
                 "issue_alert.fired",
@@ -390,6 +450,47 @@ class RuleProcessor:
         else:
             self.grouped_futures.update(grouped_futures)
 
+    def apply_rules(self, rule_statuses: Sequence[tuple[Rule, GroupRuleStatus]]) -> None:
+        """
+        Evaluates all rules against the event, then enqueues all rules with slow conditions at
+        once, activates the statuses of all passing rules at once and executes their actions.
+        """
+        try:
+            environment = self.event.get_environment()
+        except Environment.DoesNotExist:
+            return
+
+        now = timezone.now()
+        process_slow_conditions_later = features.has(
+            "organizations:process-slow-alerts", self.project.organization
+        )
+
+        to_enqueue = []
+        to_fire = []
+        for rule, status in rule_statuses:
+            outcome = self.evaluate_rule(
+                rule, status, environment, now, process_slow_conditions_later
+            )
+            if outcome is RuleOutcome.ENQUEUE:
+                to_enqueue.append(rule)
+            elif outcome is RuleOutcome.FIRE:
+                to_fire.append((rule, status))
+
+        self.enqueue_rules(to_enqueue)
+
+        if to_fire:
+            for rule in bulk_activate_rule_status(to_fire, now):
+                self.fire_rule(rule)
+
+    def apply_rule(self, rule: Rule, status: GroupRuleStatus) -> None:
+        """
+        If all conditions and filters pass, execute every action.
+
+        :param rule: `Rule` object
+        :return: void
+        """
+        self.apply_rules([(rule, status)])
+
     def apply(
         self,
     ) -> Collection[tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]]:
@@ -398,13 +499,14 @@ class RuleProcessor:
             return {}.values()
 
         self.grouped_futures.clear()
+        self._condition_results.clear()
         rules = self.get_rules()
-        snoozed_rules = RuleSnooze.objects.filter(rule__in=rules, user_id=None).values_list(
-            "rule", flat=True
+        snoozed_rules = set(
+            RuleSnooze.objects.filter(rule__in=rules, user_id=None).values_list("rule", flat=True)
         )
         rule_statuses = bulk_get_rule_status(rules, self.group, self.project)
-        for rule in rules:
-            if rule.id not in snoozed_rules:
-                self.apply_rule(rule, rule_statuses[rule.id])
+        self.apply_rules(
+            [(rule, rule_statuses[rule.id]) for rule in rules if rule.id not in snoozed_rules]
+        )
 
         return self.grouped_futures.values()
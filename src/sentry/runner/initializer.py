@@ -526,6 +526,9 @@ def bind_cache_to_option_store() -> None:
 
     default_store.set_cache_impl(default_cache)
 
+    if settings.SENTRY_OPTIONS_SNAPSHOT_INTERVAL:
+        default_store.start_snapshot_refresh(settings.SENTRY_OPTIONS_SNAPSHOT_INTERVAL)
+
 
 def apply_legacy_settings(settings: Any) -> None:
     from sentry import options
@@ -106,13 +106,18 @@ local function zrange_scored_iterator(result)
     end
 end
 
-local function zrange_move_slice(source, destination, threshold, callback)
+local function zrange_move_slice(source, destination, threshold, callback, limit)
     local callback = callback
     if callback == nil then
         callback = noop
     end
 
-    local keys = redis.call('ZRANGEBYSCORE', source, 0, threshold, 'WITHSCORES')
+    local keys = nil
+    if limit == nil then
+        keys = redis.call('ZRANGEBYSCORE', source, 0, threshold, 'WITHSCORES')
+    else
+        keys = redis.call('ZRANGEBYSCORE', source, 0, threshold, 'WITHSCORES', 'LIMIT', 0, limit)
+    end
     if #keys == 0 then
         return
     end
@@ -164,7 +169,7 @@ end
 
 -- Timeline and Schedule Operations
 
-local function schedule(configuration, deadline)
+local function schedule(configuration, deadline, limit)
     local response = {}
     local i = 0
     zrange_move_slice(
@@ -174,7 +179,8 @@ local function schedule(configuration, deadline)
         function (timeline_id, timestamp)
             i = i + 1
             response[i] = {timeline_id, timestamp}
-        end
+        end,
+        limit
     )
     return response
 end
@@ -266,7 +272,23 @@ local function add_record_to_timeline(configuration, timeline_id, record_id, val
     return ready
 end
 
-local function digest_timeline(configuration, timeline_id, timeline_capacity)
+local function get_digest_records(configuration, timeline_id, start, stop)
+    local results = {}
+    local records = redis.call('ZREVRANGE', configuration:get_timeline_digest_key(timeline_id), start, stop, 'WITHSCORES')
+    local i = 0
+    for key, score in zrange_scored_iterator(records) do
+        i = i + 1
+        results[i] = {
+            key,
+            redis.call('GET', configuration:get_timeline_record_key(timeline_id, key)),
+            score
+        }
+    end
+
+    return results
+end
+
+local function digest_timeline(configuration, timeline_id, timeline_capacity, limit)
     -- Check to ensure that the timeline is in the correct state.
     if redis.call('ZSCORE', configuration:get_schedule_ready_key(), timeline_id) == false then
         error('err(invalid_state): timeline is not in the ready state, cannot be digested')
@@ -294,19 +316,14 @@ local function digest_timeline(configuration, timeline_id, timeline_capacity)
         redis.call('EXPIRE', digest_key, configuration.ttl)
     end
 
-    local results = {}
-    local records = redis.call('ZREVRANGE', digest_key, 0, -1, 'WITHSCORES')
-    local i = 0
-    for key, score in zrange_scored_iterator(records) do
-        i = i + 1
-        results[i] = {
-            key,
-            redis.call('GET', configuration:get_timeline_record_key(timeline_id, key)),
-            score
-        }
+    -- If a limit is provided, only the first page of records is returned, the
+    -- remaining pages can be fetched with ``DIGEST_PAGE``.
+    local stop = -1
+    if limit ~= nil then
+        stop = limit - 1
     end
 
-    return results
+    return get_digest_records(configuration, timeline_id, 0, stop)
 end
 
 local function close_digest(configuration, timeline_id, delay_minimum, record_ids)
@@ -385,11 +402,12 @@ end)
 
 local commands = {
     SCHEDULE = function (cursor, arguments)
-        local cursor, configuration, deadline = multiple_argument_parser(
+        local cursor, configuration, deadline, limit = multiple_argument_parser(
             configuration_argument_parser,
+            argument_parser(tonumber),
             argument_parser(tonumber)
         )(cursor, arguments)
-        return schedule(configuration, deadline)
+        return schedule(configuration, deadline, limit)
     end,
     MAINTENANCE = function (cursor, arguments)
         local cursor, configuration, deadline = multiple_argument_parser(
@@ -432,12 +450,22 @@ local commands = {
         return delete_timeline(configuration, timeline_id)
     end,
     DIGEST_OPEN = function (cursor, arguments)
-        local cursor, configuration, timeline_id, timeline_capacity = multiple_argument_parser(
+        local cursor, configuration, timeline_id, timeline_capacity, limit = multiple_argument_parser(
             configuration_argument_parser,
             argument_parser(),
+            argument_parser(tonumber),
+            argument_parser(tonumber)
+        )(cursor, arguments)
+        return digest_timeline(configuration, timeline_id, timeline_capacity, limit)
+    end,
+    DIGEST_PAGE = function (cursor, arguments)
+        local cursor, configuration, timeline_id, offset, limit = multiple_argument_parser(
+            configuration_argument_parser,
+            argument_parser(),
+            argument_parser(tonumber),
             argument_parser(tonumber)
         )(cursor, arguments)
-        return digest_timeline(configuration, timeline_id, timeline_capacity)
+        return get_digest_records(configuration, timeline_id, offset, offset + limit - 1)
     end,
     DIGEST_CLOSE = function (cursor, arguments)
         local cursor, configuration, timeline_id, delay_minimum, record_ids = multiple_argument_parser(
@@ -0,0 +1,17 @@
+-- Pop the members of a sorted set whose score is at most a given value, up to a limit.
+-- Returns the popped members together with their scores, lowest score first.
+assert(#KEYS == 1, "provide exactly one sorted set key")
+assert(#ARGV == 2, "provide a max score and a limit")
+
+local key = KEYS[1]
+local max_score = ARGV[1]
+local limit = tonumber(ARGV[2])
+
+local members = redis.call("ZRANGEBYSCORE", key, "-inf", max_score, "WITHSCORES", "LIMIT", 0, limit)
+if #members > 0 then
+    -- The popped members are the ones with the lowest scores, so they can be removed by rank
+    -- without passing them back to Redis.
+    redis.call("ZREMRANGEBYRANK", key, 0, #members / 2 - 1)
+end
+
+return members
@@ -135,7 +135,9 @@ def get_ingest_config(
     return _METRICS_INGEST_CONFIG_BY_USE_CASE[(use_case_key, db_backend)]
 
 
-def initialize_subprocess_state(config: MetricsIngestConfiguration) -> None:
+def initialize_subprocess_state(
+    config: MetricsIngestConfiguration, shared_cache_name: str | None = None
+) -> None:
     """
     Initialization function for the subprocesses of the metrics indexer.
 
@@ -152,10 +154,18 @@ def initialize_subprocess_state(config: MetricsIngestConfiguration) -> None:
     We already rely on sentry.utils.arroyo.run_task_with_multiprocessing to copy
     statsd tags into the subprocess, eventually we should do the same for
     Sentry tags.
+
+    `shared_cache_name` is the name of the shared memory segment holding the
+    indexer cache shared by all processes of the consumer, if it is enabled.
     """
 
     sentry_sdk.set_tag("sentry_metrics.use_case_key", config.use_case_id.value)
 
+    if shared_cache_name is not None:
+        from sentry.sentry_metrics.indexer.shared_cache import attach_shared_cache
+
+        attach_shared_cache(shared_cache_name)
+
 
 def initialize_main_process_state(config: MetricsIngestConfiguration) -> None:
     """
@@ -2,7 +2,8 @@ import logging
 import random
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Mapping, MutableMapping, MutableSequence, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any, cast
 
 import orjson
@@ -88,6 +89,35 @@ class IndexerBatchMetrics:
         return self.total_value_len / self.message_count
 
 
+@dataclass
+class MessageColumns:
+    """
+    The fields of all valid messages of a batch that share a use case and org
+    which are needed to extract their strings, stored column by column.
+    """
+
+    broker_metas: list[BrokerMeta] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    tags: list[Mapping[str, str]] = field(default_factory=list)
+
+    def append(self, broker_meta: BrokerMeta, parsed_payload: ParsedMessage) -> None:
+        self.broker_metas.append(broker_meta)
+        self.names.append(parsed_payload["name"])
+        self.tags.append(parsed_payload.get("tags", {}))
+
+    def without(self, skipped: set[BrokerMeta]) -> "MessageColumns":
+        """Returns the columns without the rows of the given messages."""
+        if skipped.isdisjoint(self.broker_metas):
+            return self
+
+        rows = [i for i, broker_meta in enumerate(self.broker_metas) if broker_meta not in skipped]
+        return MessageColumns(
+            broker_metas=[self.broker_metas[i] for i in rows],
+            names=[self.names[i] for i in rows],
+            tags=[self.tags[i] for i in rows],
+        )
+
+
 class IndexerBatch:
     def __init__(
         self,
@@ -113,6 +143,9 @@ class IndexerBatch:
         self.invalid_msg_meta: set[BrokerMeta] = set()
         self.filtered_msg_meta: set[BrokerMeta] = set()
         self.parsed_payloads_by_meta: MutableMapping[BrokerMeta, ParsedMessage] = {}
+        self.columns_by_org: MutableMapping[tuple[UseCaseID, OrgId], MessageColumns] = (
+            defaultdict(MessageColumns)
+        )
 
         self._extract_messages()
 
@@ -123,6 +156,8 @@ class IndexerBatch:
         1. Check the header to see if the use case ID is disabled
         2. Parse the raw bytes into ParsedMessage (_extract_message)
         3. Semantically validate the content of ParsedMessage (_validate_message)
+        4. Add the fields strings are extracted from to the columns of the
+        message's use case and org
 
         We track the offset and partition of the message that are filtered or
         invalid so later we can:
@@ -148,6 +183,9 @@ class IndexerBatch:
                 parsed_payload = self._extract_message(msg)
                 self._validate_message(parsed_payload)
                 self.parsed_payloads_by_meta[broker_meta] = parsed_payload
+                self.columns_by_org[
+                    (parsed_payload["use_case_id"], parsed_payload["org_id"])
+                ].append(broker_meta, parsed_payload)
             except Exception as e:
                 self.invalid_msg_meta.add(broker_meta)
                 logger.exception(
@@ -275,24 +313,19 @@ class IndexerBatch:
             lambda: defaultdict(set)
         )
 
-        for broker_meta, message in self.parsed_payloads_by_meta.items():
-            if broker_meta in self.invalid_msg_meta or broker_meta in self.filtered_msg_meta:
-                continue
-
-            metric_name = message["name"]
-            use_case_id = message["use_case_id"]
-            org_id = message["org_id"]
-            tags = message.get("tags", {})
+        skipped_msg_meta = self.invalid_msg_meta | self.filtered_msg_meta
 
-            strings_in_message = {
-                metric_name,
-                *tags.keys(),
-            }
+        for (use_case_id, org_id), columns in self.columns_by_org.items():
+            columns = columns.without(skipped_msg_meta)
+            if not columns.broker_metas:
+                continue
 
+            org_strings = strings[use_case_id][org_id]
+            org_strings.update(columns.names)
+            # Iterating over the tags yields their keys
+            org_strings.update(chain.from_iterable(columns.tags))
             if self.__should_index_tag_values:
-                strings_in_message.update(tags.values())
-
-            strings[use_case_id][org_id].update(strings_in_message)
+                org_strings.update(chain.from_iterable(tags.values() for tags in columns.tags))
 
         for use_case_id, org_mapping in strings.items():
             metrics.gauge(
@@ -13,6 +13,7 @@ from arroyo.processing.strategies import ProcessingStrategy
 from arroyo.processing.strategies import ProcessingStrategy as ProcessingStep
 from arroyo.processing.strategies import ProcessingStrategyFactory
 from arroyo.types import Commit, FilteredPayload, Message, Partition
+from django.conf import settings
 
 from sentry import options
 from sentry.sentry_metrics.configuration import (
@@ -27,6 +28,7 @@ from sentry.sentry_metrics.consumers.indexer.routing_producer import (
     RoutingProducerStep,
 )
 from sentry.sentry_metrics.consumers.indexer.slicing_router import SlicingRouter
+from sentry.sentry_metrics.indexer.shared_cache import SharedIndexerCache, set_shared_cache
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 from sentry.utils.kafka import delay_kafka_rebalance
 
@@ -139,6 +141,16 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.__input_block_size = input_block_size
         self.__output_block_size = output_block_size
         self.__slicing_router = slicing_router
+
+        # Strings resolved by any of the processes are cached for all of them
+        # in shared memory, before going to the (remote) indexer cache.
+        self.__shared_cache: SharedIndexerCache | None = None
+        if settings.SENTRY_METRICS_INDEXER_SHARED_CACHE_SLOTS:
+            self.__shared_cache = SharedIndexerCache.create(
+                settings.SENTRY_METRICS_INDEXER_SHARED_CACHE_SLOTS
+            )
+            set_shared_cache(self.__shared_cache)
+
         self.__pool = MultiprocessingPool(
             num_processes=processes,
             # It is absolutely crucial that we pass a function reference here
@@ -148,7 +160,11 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
             # this module, and pass that function here, it would attempt to
             # pull in a bunch of modules that try to read django settings at
             # import time
-            initializer=functools.partial(initialize_subprocess_state, self.config),
+            initializer=functools.partial(
+                initialize_subprocess_state,
+                self.config,
+                self.__shared_cache.name if self.__shared_cache is not None else None,
+            ),
         )
 
         if use_case is UseCaseKey.PERFORMANCE and options.get(
@@ -190,6 +206,11 @@ class MetricsConsumerStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
     def shutdown(self) -> None:
         self.__pool.close()
 
+        if self.__shared_cache is not None:
+            set_shared_cache(None)
+            self.__shared_cache.close()
+            self.__shared_cache = None
+
 
 def get_metrics_producer_strategy(
     config: MetricsIngestConfiguration,
@@ -19,6 +19,7 @@ from sentry.sentry_metrics.indexer.base import (
     metric_path_key_compatible_resolve,
     metric_path_key_compatible_rev_resolve,
 )
+from sentry.sentry_metrics.indexer.shared_cache import get_shared_cache
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.utils import metrics
 from sentry.utils.hashlib import md5_text
@@ -33,6 +34,7 @@ _INDEXER_CACHE_RESOLVE_CACHE_REPLENISHMENT_METRIC = (
 _INDEXER_CACHE_DOUBLE_WRITE_METRIC = "sentry_metrics.indexer.memcache.double-write"
 _INDEXER_CACHE_DOUBLE_READ_METRIC = "sentry_metrics.indexer.memcache.new-schema-read"
 _INDEXER_CACHE_STALE_KEYS_METRIC = "sentry_metrics.indexer.memcache.stale-keys"
+_INDEXER_SHARED_CACHE_METRIC = "sentry_metrics.indexer.shared_cache"
 
 # only used to compare to the older version of the PGIndexer
 _INDEXER_CACHE_FETCH_METRIC = "sentry_metrics.indexer.memcache.fetch"
@@ -131,6 +133,12 @@ class StringIndexerCache:
         return int(result)
 
     def get(self, namespace: str, key: str) -> int | None:
+        if get_shared_cache() is not None:
+            # Read through the shared cache like `get_many`, which `set` writes to as well.
+            return self.get_many(namespace, [key])[key]
+        return self._get(namespace, key)
+
+    def _get(self, namespace: str, key: str) -> int | None:
         if options.get(NAMESPACED_READ_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_READ_METRIC)
             result = self.cache.get(
@@ -140,6 +148,12 @@ class StringIndexerCache:
         return self.cache.get(self._make_cache_key(key), version=self.version)
 
     def set(self, namespace: str, key: str, value: int) -> None:
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.set_many(
+                {key: value}, ttl=settings.SENTRY_METRICS_INDEXER_SHARED_CACHE_TTL
+            )
+
         self.cache.set(
             key=self._make_cache_key(key),
             value=value,
@@ -156,6 +170,35 @@ class StringIndexerCache:
             )
 
     def get_many(self, namespace: str, keys: Iterable[str]) -> MutableMapping[str, int | None]:
+        shared_cache = get_shared_cache()
+        if shared_cache is None:
+            return self._get_many(namespace, keys)
+
+        # Strings resolved by any process of this consumer are found in the
+        # shared cache, only the remaining ones are fetched from the cache backend.
+        keys = list(keys)
+        shared_results = shared_cache.get_many(keys)
+        metrics.incr(
+            _INDEXER_SHARED_CACHE_METRIC, tags={"cache_hit": "true"}, amount=len(shared_results)
+        )
+        metrics.incr(
+            _INDEXER_SHARED_CACHE_METRIC,
+            tags={"cache_hit": "false"},
+            amount=len(keys) - len(shared_results),
+        )
+
+        missing_keys = [key for key in keys if key not in shared_results]
+        results: MutableMapping[str, int | None] = {}
+        if missing_keys:
+            results = self._get_many(namespace, missing_keys)
+            shared_cache.set_many(
+                {key: value for key, value in results.items() if value is not None},
+                ttl=settings.SENTRY_METRICS_INDEXER_SHARED_CACHE_TTL,
+            )
+
+        return {key: shared_results.get(key, results.get(key)) for key in keys}
+
+    def _get_many(self, namespace: str, keys: Iterable[str]) -> MutableMapping[str, int | None]:
         if options.get(NAMESPACED_READ_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_READ_METRIC)
             cache_keys = {self._make_namespaced_cache_key(namespace, key): key for key in keys}
@@ -176,6 +219,10 @@ class StringIndexerCache:
             return self._format_results(keys, results)
 
     def set_many(self, namespace: str, key_values: Mapping[str, int]) -> None:
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.set_many(key_values, ttl=settings.SENTRY_METRICS_INDEXER_SHARED_CACHE_TTL)
+
         cache_key_values = {self._make_cache_key(k): v for k, v in key_values.items()}
         self.cache.set_many(cache_key_values, timeout=self.randomized_ttl, version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
@@ -190,12 +237,20 @@ class StringIndexerCache:
             )
 
     def delete(self, namespace: str, key: str) -> None:
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.delete_many([key])
+
         self.cache.delete(self._make_cache_key(key), version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_WRITE_METRIC)
             self.cache.delete(self._make_namespaced_cache_key(namespace, key), version=self.version)
 
     def delete_many(self, namespace: str, keys: Sequence[str]) -> None:
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.delete_many(keys)
+
         self.cache.delete_many([self._make_cache_key(key) for key in keys], version=self.version)
         if options.get(NAMESPACED_WRITE_FEAT_FLAG):
             metrics.incr(_INDEXER_CACHE_DOUBLE_WRITE_METRIC)
@@ -0,0 +1,158 @@
+"""
+A per-host cache of resolved strings, shared by all processes of an indexer consumer.
+
+The cache is a fixed size hash table living in a shared memory segment that is
+created by the consumer's main process and attached to by its subprocesses, so
+that a string resolved by one worker is a hit for all of them without another
+round trip to the indexer cache.
+
+Every slot is packed as
+
+    <digest of the key: 16 bytes> <id: int64> <expiry: uint32> <crc32 of the former>
+
+Slots are written without any locking. A slot is packed and checksummed in
+local memory and copied into the segment in one go, and readers copy the slot
+out before checking it. A reader that observes a slot while it is being written
+sees a checksum that does not match and treats the slot as a miss, so the worst
+outcome of a race is a lost write.
+
+Note: It must be possible to import this module without initializing Sentry,
+it is used from the initializer of the indexer's subprocesses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import time
+import zlib
+from collections.abc import Iterable, Mapping
+from multiprocessing.shared_memory import SharedMemory
+
+_HEADER = struct.Struct("<Q")
+_SLOT = struct.Struct("<16sqII")
+_SLOT_BODY_SIZE = _SLOT.size - 4
+
+# Number of consecutive slots a key may be stored in.
+PROBE_LENGTH = 8
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class SharedIndexerCache:
+    """
+    Bounded mapping of ``"use_case_id:org_id:string"`` keys to their ids with
+    a TTL per entry. When all slots a key can be stored in are taken, the
+    entry that expires first is evicted.
+    """
+
+    def __init__(self, shm: SharedMemory, owner: bool) -> None:
+        self.shm = shm
+        self.owner = owner
+        self.buf = shm.buf
+        (self.num_slots,) = _HEADER.unpack_from(self.buf, 0)
+
+    @classmethod
+    def create(cls, num_slots: int) -> SharedIndexerCache:
+        shm = SharedMemory(create=True, size=_HEADER.size + num_slots * _SLOT.size)
+        _HEADER.pack_into(shm.buf, 0, num_slots)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedIndexerCache:
+        return cls(SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def _offsets(self, digest: bytes) -> Iterable[int]:
+        start = int.from_bytes(digest[:8], "little") % self.num_slots
+        for i in range(min(PROBE_LENGTH, self.num_slots)):
+            yield _HEADER.size + ((start + i) % self.num_slots) * _SLOT.size
+
+    def _read(self, offset: int) -> tuple[bytes, int, int] | None:
+        slot = bytes(self.buf[offset : offset + _SLOT.size])
+        digest, value, expires_at, checksum = _SLOT.unpack(slot)
+        if zlib.crc32(slot[:_SLOT_BODY_SIZE]) != checksum:
+            return None
+        return digest, value, expires_at
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, int]:
+        """
+        Return the ids of the given keys that are cached and not expired,
+        missing keys are left out.
+        """
+        now = int(time.time())
+        rv = {}
+        for key in keys:
+            digest = _digest(key)
+            for offset in self._offsets(digest):
+                slot = self._read(offset)
+                if slot is not None and slot[0] == digest:
+                    if slot[2] > now:
+                        rv[key] = slot[1]
+                    break
+        return rv
+
+    def set_many(self, key_values: Mapping[str, int], ttl: int) -> None:
+        now = int(time.time())
+        expires_at = now + ttl
+        for key, value in key_values.items():
+            digest = _digest(key)
+
+            target = None
+            target_expires_at = None
+            for offset in self._offsets(digest):
+                slot = self._read(offset)
+                if slot is None or slot[0] == digest or slot[2] <= now:
+                    target = offset
+                    break
+                if target_expires_at is None or slot[2] < target_expires_at:
+                    target = offset
+                    target_expires_at = slot[2]
+
+            assert target is not None
+            slot = bytearray(_SLOT.size)
+            _SLOT.pack_into(slot, 0, digest, value, expires_at, 0)
+            checksum = zlib.crc32(slot[:_SLOT_BODY_SIZE])
+            struct.pack_into("<I", slot, _SLOT_BODY_SIZE, checksum)
+            self.buf[target : target + _SLOT.size] = slot
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            digest = _digest(key)
+            for offset in self._offsets(digest):
+                slot = self._read(offset)
+                if slot is not None and slot[0] == digest:
+                    self.buf[offset : offset + _SLOT.size] = bytes(_SLOT.size)
+                    break
+
+    def clear(self) -> None:
+        self.buf[_HEADER.size :] = bytes(self.num_slots * _SLOT.size)
+
+    def close(self) -> None:
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+_shared_cache: SharedIndexerCache | None = None
+
+
+def get_shared_cache() -> SharedIndexerCache | None:
+    """Returns the shared cache this process uses, if any."""
+    return _shared_cache
+
+
+def set_shared_cache(cache: SharedIndexerCache | None) -> None:
+    global _shared_cache
+    _shared_cache = cache
+
+
+def attach_shared_cache(name: str) -> None:
+    """Attaches the current process to the shared cache created by the main process."""
+    set_shared_cache(SharedIndexerCache.attach(name))
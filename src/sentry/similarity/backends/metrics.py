@@ -11,17 +11,21 @@ class MetricsWrapper(AbstractIndexBackend):
     def __getattr__(self, name):
         return getattr(self.backend, name)
 
-    def __instrumented_method_call(self, method, scope, *args, **kwargs):
+    def __instrumented_method_call(self, method, scope, *args, metric_name=None, **kwargs):
         tags = {}
         if self.scope_tag_name is not None:
             tags[self.scope_tag_name] = scope
 
-        with timer(self.template.format(method), tags=tags):
+        with timer(self.template.format(metric_name or method), tags=tags):
             return getattr(self.backend, method)(scope, *args, **kwargs)
 
     def record(self, *args, **kwargs):
         return self.__instrumented_method_call("record", *args, **kwargs)
 
+    def record_many(self, *args, **kwargs):
+        # Batched records are reported under the same metric as single ones.
+        return self.__instrumented_method_call("record_many", *args, metric_name="record", **kwargs)
+
     def classify(self, *args, **kwargs):
         return self.__instrumented_method_call("classify", *args, **kwargs)
 
@@ -12,7 +12,7 @@ index = load_redis_script("similarity/index.lua")
 
 def band(n, value):
     assert len(value) % n == 0
-    return list(chunked(value, len(value) / n))
+    return list(chunked(value, len(value) // n))
 
 
 def flatten(value):
@@ -31,14 +31,24 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
         self.retention = retention
         self.candidate_set_limit = candidate_set_limit
 
-    def _build_signature_arguments(self, features):
-        if not features:
-            return [0] * self.bands
-
-        arguments = []
-        for bucket in band(self.bands, self.signature_builder(features)):
-            arguments.extend([1, ",".join(str(b) for b in bucket), 1])
-        return arguments
+    def _build_signature_arguments(self, feature_sets):
+        """
+        Build the script arguments for the signatures of all feature sets at
+        once, so that features shared between the sets are hashed only once.
+        """
+        signatures = iter(self.signature_builder.build_many([fs for fs in feature_sets if fs]))
+
+        results = []
+        for features in feature_sets:
+            if not features:
+                results.append([0] * self.bands)
+                continue
+
+            arguments = []
+            for bucket in band(self.bands, next(signatures)):
+                arguments.extend([1, ",".join(str(b) for b in bucket), 1])
+            results.append(arguments)
+        return results
 
     def __index(self, scope, args):
         # scope must be passed into the script call as a key to allow the
@@ -89,9 +99,12 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
             limit if limit is not None else -1,
         ]
 
-        for idx, threshold, features in items:
+        signature_arguments = self._build_signature_arguments(
+            [features for _, _, features in items]
+        )
+        for (idx, threshold, _), signature in zip(items, signature_arguments):
             arguments.extend([idx, threshold])
-            arguments.extend(self._build_signature_arguments(features))
+            arguments.extend(signature)
 
         return self._as_search_result(self.__index(scope, arguments))
 
@@ -136,9 +149,46 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
             key,
         ]
 
-        for idx, features in items:
+        signature_arguments = self._build_signature_arguments([features for _, features in items])
+        for (idx, _), signature in zip(items, signature_arguments):
             arguments.append(idx)
-            arguments.extend(self._build_signature_arguments(features))
+            arguments.extend(signature)
+
+        return self.__index(scope, arguments)
+
+    def record_many(self, scope, records, timestamp=None):
+        records = [(key, items, ts) for key, items, ts in records if items]
+        if not records:
+            return []  # nothing to do
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        arguments = [
+            "RECORD_MANY",
+            timestamp,
+            self.namespace,
+            self.bands,
+            self.interval,
+            self.retention,
+            self.candidate_set_limit,
+            scope,
+        ]
+
+        # The signatures of all records are built together, as the records of
+        # a batch of events tend to share most of their features.
+        signature_arguments = iter(
+            self._build_signature_arguments(
+                [features for _, items, _ in records for _, features in items]
+            )
+        )
+        for key, items, record_timestamp in records:
+            arguments.extend(
+                [key, timestamp if record_timestamp is None else record_timestamp, len(items)]
+            )
+            for idx, _ in items:
+                arguments.append(idx)
+                arguments.extend(next(signature_arguments))
 
         return self.__index(scope, arguments)
 
@@ -93,13 +93,16 @@ class FeatureSet:
         return results
 
     def record(self, events):
+        """
+        Record the features of the given events, which must all be associated
+        with the same project but may belong to different groups. All groups
+        are indexed with a single call to the index.
+        """
         if not events:
             return []
 
         scope = None
-        key = None
-
-        items = []
+        records = {}
         for event in events:
             if not event.group_id:
                 continue
@@ -111,13 +114,6 @@ class FeatureSet:
                         self.__get_scope(event.project) == scope
                     ), "all events must be associated with the same project"
 
-                if key is None:
-                    key = self.__get_key(event.group)
-                else:
-                    assert (
-                        self.__get_key(event.group) == key
-                    ), "all events must be associated with the same group"
-
                 try:
                     features = [self.encoder.dumps(feature) for feature in features]
                 except Exception as error:
@@ -134,9 +130,16 @@ class FeatureSet:
                     )
                 else:
                     if features:
-                        items.append((self.aliases[label], features))
-
-        return self.index.record(scope, key, items, timestamp=int(event.datetime.timestamp()))
+                        # Features are recorded at the time of their event, so
+                        # events are only batched together with others of the
+                        # same group that share their timestamp.
+                        records.setdefault(
+                            (self.__get_key(event.group), int(event.datetime.timestamp())), []
+                        ).append((self.aliases[label], features))
+
+        return self.index.record_many(
+            scope, [(key, items, timestamp) for (key, timestamp), items in records.items()]
+        )
 
     def classify(self, events, limit=None, thresholds=None):
         if not events:
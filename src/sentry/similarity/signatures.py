@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 import mmh3
 
@@ -11,7 +11,31 @@ class MinHashSignatureBuilder:
         self.rows = rows
 
     def __call__(self, features: Iterable[str]) -> list[int]:
-        return [
-            min(mmh3.hash(feature, column) % self.rows for feature in features)
-            for column in range(self.columns)
-        ]
+        (signature,) = self.build_many([features])
+        return signature
+
+    def build_many(self, feature_sets: Sequence[Iterable[str]]) -> list[list[int]]:
+        """
+        Build the signatures of several feature sets (such as all feature sets
+        of an event) at once. Every distinct feature is hashed only once for
+        all columns, no matter how many sets it is part of.
+        """
+        columns = range(self.columns)
+        feature_hashes: dict[str, list[int]] = {}
+
+        signatures = []
+        for features in feature_sets:
+            signature: list[int] | None = None
+            for feature in features:
+                hashes = feature_hashes.get(feature)
+                if hashes is None:
+                    hashes = feature_hashes[feature] = [
+                        mmh3.hash(feature, column) % self.rows for column in columns
+                    ]
+                signature = hashes if signature is None else list(map(min, signature, hashes))
+
+            if signature is None:
+                raise ValueError("Cannot build the signature of an empty feature set")
+            signatures.append(signature)
+
+        return signatures
@@ -12,6 +12,8 @@ from sentry import options
 from sentry.utils import redis
 from sentry.utils.iterators import chunked
 
+pop_ready_segments = redis.load_redis_script("spans/pop_ready_segments.lua")
+
 
 @dataclasses.dataclass
 class ProcessSegmentsContext:
@@ -39,6 +41,12 @@ def get_last_processed_timestamp_key(partition_index: int) -> str:
 
 
 def get_unprocessed_segments_key(partition_index: int) -> str:
+    return f"performance-issues:unprocessed-segments:partition-3:{partition_index}"
+
+
+def get_legacy_unprocessed_segments_key(partition_index: int) -> str:
+    # Segments used to be queued in lists, which are still drained until the segments queued in
+    # them have expired.
     return f"performance-issues:unprocessed-segments:partition-2:{partition_index}"
 
 
@@ -56,8 +64,8 @@ class RedisSpansBuffer:
         1. Pushes batches of spans to redis
         2. Check if number of spans pushed == to the number of elements that exist on the key. This
             tells us if it was the first time we see the key. This works fine because RPUSH is atomic.
-        3. If it is the first time we see a particular segment, push the segment id and first seen
-            timestamp to a bucket so we know when it is ready to be processed.
+        3. If it is the first time we see a particular segment, add the segment key to a sorted set
+            scored by its first seen timestamp so we know when it is ready to be processed.
         3. Checks if 1 second has passed since the last time segments were processed for a partition.
         """
         keys = list(spans_map.keys())
@@ -96,7 +104,7 @@ class RedisSpansBuffer:
 
                     timestamp = segment_first_seen_ts[key]
                     p.expire(segment_key, ttl)
-                    p.rpush(bucket, timestamp, segment_key)
+                    p.zadd(bucket, {segment_key: timestamp}, nx=True)
 
             timestamp_results = p.execute()
 
@@ -130,30 +138,50 @@ class RedisSpansBuffer:
         return values
 
     def get_unprocessed_segments_and_prune_bucket(self, now: int, partition: int) -> list[str]:
+        """
+        Pops the keys of the segments of a partition which have been buffered for long enough,
+        oldest first. At most `standalone-spans.buffer-max-segments-per-poll` segments are popped
+        per call, the remaining ones are picked up by the next call.
+        """
         key = get_unprocessed_segments_key(partition)
-        results = self.client.lrange(key, 0, -1) or []
-
         buffer_window = options.get("standalone-spans.buffer-window.seconds")
+        max_segments = options.get("standalone-spans.buffer-max-segments-per-poll")
 
-        segment_keys = []
-        processed_segment_ts = None
-        for result in chunked(results, 2):
-            try:
-                segment_timestamp, segment_key = result
-                segment_timestamp = int(segment_timestamp)
-                if now - segment_timestamp < buffer_window:
-                    break
-
-                processed_segment_ts = segment_timestamp
-                segment_keys.append(segment_key.decode("utf-8"))
-            except Exception:
-                # Just in case something funky happens here
-                sentry_sdk.capture_exception()
-                break
+        segment_keys, processed_segment_ts = self._pop_legacy_ready_segments(
+            now - buffer_window, partition
+        )
+        results = pop_ready_segments([key], [now - buffer_window, max_segments], self.client)
 
-        self.client.ltrim(key, len(segment_keys) * 2, -1)
+        for segment_key, segment_timestamp in chunked(results, 2):
+            processed_segment_ts = int(float(segment_timestamp))
+            segment_keys.append(segment_key.decode("utf-8"))
 
         segment_context = {"current_timestamp": now, "segment_timestamp": processed_segment_ts}
         sentry_sdk.set_context("processed_segment", segment_context)
 
         return segment_keys
+
+    def _pop_legacy_ready_segments(
+        self, max_timestamp: int, partition: int
+    ) -> tuple[list[str], int | None]:
+        """
+        Pops the ready segments still queued in the list based bucket that was used before the
+        sorted set, so that segments buffered at deploy time are flushed as well. These don't count
+        towards the budget of a call.
+        """
+        key = get_legacy_unprocessed_segments_key(partition)
+        results = self.client.lrange(key, 0, -1) or []
+
+        segment_keys = []
+        processed_segment_ts = None
+        for segment_timestamp, segment_key in chunked(results, 2):
+            if int(segment_timestamp) > max_timestamp:
+                break
+
+            processed_segment_ts = int(segment_timestamp)
+            segment_keys.append(segment_key.decode("utf-8"))
+
+        if segment_keys:
+            self.client.ltrim(key, len(segment_keys) * 2, -1)
+
+        return segment_keys, processed_segment_ts
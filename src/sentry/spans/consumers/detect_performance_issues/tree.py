@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+NO_PARENT = -1
+
+
+class SegmentTree:
+    """
+    Compact representation of the spans of a segment and the tree they form.
+
+    Spans are addressed by their index, and the tree is stored as parallel
+    arrays of parent indices and start timestamps instead of nested dicts, so
+    that building and walking it neither copies nor mutates the span payloads.
+    When a span id occurs multiple times only its first occurrence is kept.
+    """
+
+    def __init__(self, spans: Sequence[Mapping[str, Any]]) -> None:
+        self.spans: list[Mapping[str, Any]] = []
+        self.start_timestamps = array("d")
+
+        index_by_id: dict[str, int] = {}
+        root_span_id = None
+        for span in spans:
+            span_id = span["span_id"]
+            if span["is_segment"]:
+                root_span_id = span_id
+            if span_id in index_by_id:
+                continue
+
+            index_by_id[span_id] = len(self.spans)
+            self.spans.append(span)
+            self.start_timestamps.append(span["start_timestamp_ms"])
+
+        self.parents = array("l", [NO_PARENT]) * len(self.spans)
+        for index, span in enumerate(self.spans):
+            parent_id = span.get("parent_span_id")
+            if parent_id is not None:
+                self.parents[index] = index_by_id.get(parent_id, NO_PARENT)
+
+        self.root = index_by_id[root_span_id] if root_span_id else NO_PARENT
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def children(self) -> list[list[int]]:
+        """Returns the indices of the children of every span, in span order."""
+        children: list[list[int]] = [[] for _ in self.spans]
+        for index, parent in enumerate(self.parents):
+            if parent != NO_PARENT:
+                children[parent].append(index)
+        return children
+
+    def depth_first_order(self) -> list[int]:
+        """
+        Returns the span indices ordered depth first, starting at the root span
+        and visiting children by their start timestamp. Spans that cannot be
+        reached from the root are visited afterwards in the same way, starting
+        with the earliest one.
+        """
+        children = self.children()
+        start_timestamps = self.start_timestamps
+        visited = bytearray(len(self.spans))
+        order: list[int] = []
+
+        def visit(index: int) -> None:
+            stack = [index]
+            while stack:
+                index = stack.pop()
+                if visited[index]:
+                    continue
+                visited[index] = 1
+                order.append(index)
+
+                # Push the latest child first, so that the earliest is visited first
+                for child in sorted(
+                    children[index], key=start_timestamps.__getitem__, reverse=True
+                ):
+                    if not visited[child]:
+                        stack.append(child)
+
+        if self.root != NO_PARENT:
+            visit(self.root)
+
+        if len(order) < len(self.spans):
+            for index in sorted(range(len(self.spans)), key=start_timestamps.__getitem__):
+                if not visited[index]:
+                    visit(index)
+
+        return order
+
+    def flatten(self) -> list[Mapping[str, Any]]:
+        """Returns the spans ordered depth first, see `depth_first_order`."""
+        spans = self.spans
+        return [spans[index] for index in self.depth_first_order()]
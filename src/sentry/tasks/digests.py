@@ -2,9 +2,10 @@ import logging
 import time
 from datetime import datetime
 
+from sentry import options
 from sentry.digests import Record, get_option_key
 from sentry.digests.backends.base import InvalidState
-from sentry.digests.notifications import build_digest, split_key
+from sentry.digests.notifications import DigestBuilder, build_digest, split_key
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.project import Project
 from sentry.silo.base import SiloMode
@@ -63,13 +64,27 @@ def deliver_digest(
         project, get_option_key("mail", "minimum_delay")
     )
 
+    page_size = options.get("digests.stream-page-size")
+
     with snuba.options_override({"consistent": True}):
         try:
-            with digests.backend.digest(key, minimum_delay=minimum_delay) as records:
-                digest, logs = build_digest(project, records)
-
-                if not notification_uuid:
-                    notification_uuid = get_notification_uuid_from_records(records)
+            if page_size > 0:
+                with digests.backend.digest_stream(
+                    key, minimum_delay=minimum_delay, page_size=page_size
+                ) as pages:
+                    builder = DigestBuilder(project)
+                    for records in pages:
+                        builder.add(records)
+                    digest, logs = builder.build()
+
+                    if not notification_uuid:
+                        notification_uuid = builder.notification_uuid
+            else:
+                with digests.backend.digest(key, minimum_delay=minimum_delay) as records:
+                    digest, logs = build_digest(project, records)
+
+                    if not notification_uuid:
+                        notification_uuid = get_notification_uuid_from_records(records)
         except InvalidState as error:
             logger.info("Skipped digest delivery: %s", error, exc_info=True)
             return
@@ -35,6 +35,7 @@ def merge_groups(
     **kwargs,
 ):
     # TODO(mattrobenolt): Write tests for all of this
+    from sentry.grouping.ingest.hashing import invalidate_grouphash_cache
     from sentry.models.activity import Activity
     from sentry.models.environment import Environment
     from sentry.models.eventattachment import EventAttachment
@@ -106,6 +107,7 @@ def merge_groups(
         has_more = merge_objects(
             model_list, group, new_group, logger=logger, transaction_id=transaction_id
         )
+        invalidate_grouphash_cache(group.project_id)
 
         if not has_more:
             # There are no more objects to merge for *this* "from" group, remove it
@@ -713,41 +713,50 @@ def run_post_process_job(job: PostProcessJob) -> None:
         # specific pipelines for issue types
         pipeline = GROUP_CATEGORY_POST_PROCESS_PIPELINE[issue_category]
 
-    for pipeline_step in pipeline:
+    # The pipeline steps check many of the same features for the event's
+    # organization and project.
+    with features.evaluation_scope():
         try:
-            with (
-                metrics.timer(
-                    "tasks.post_process.run_post_process_job.pipeline.duration",
+            project = group_event.project
+            features.prefetch(POST_PROCESS_FEATURES, project.organization, [project])
+        except Exception:
+            logger.exception("Failed to prefetch post process features")
+
+        for pipeline_step in pipeline:
+            try:
+                with (
+                    metrics.timer(
+                        "tasks.post_process.run_post_process_job.pipeline.duration",
+                        tags={
+                            "pipeline": pipeline_step.__name__,
+                            "issue_category": issue_category_metric,
+                            "is_reprocessed": job["is_reprocessed"],
+                        },
+                    ),
+                    sentry_sdk.start_span(op=f"tasks.post_process_group.{pipeline_step.__name__}"),
+                ):
+                    pipeline_step(job)
+            except Exception:
+                metrics.incr(
+                    "sentry.tasks.post_process.post_process_group.exception",
                     tags={
+                        "issue_category": issue_category_metric,
                         "pipeline": pipeline_step.__name__,
+                    },
+                )
+                logger.exception(
+                    "Failed to process pipeline step %s",
+                    pipeline_step.__name__,
+                    extra={"event": group_event, "group": group_event.group},
+                )
+            else:
+                metrics.incr(
+                    "sentry.tasks.post_process.post_process_group.completed",
+                    tags={
                         "issue_category": issue_category_metric,
-                        "is_reprocessed": job["is_reprocessed"],
+                        "pipeline": pipeline_step.__name__,
                     },
-                ),
-                sentry_sdk.start_span(op=f"tasks.post_process_group.{pipeline_step.__name__}"),
-            ):
-                pipeline_step(job)
-        except Exception:
-            metrics.incr(
-                "sentry.tasks.post_process.post_process_group.exception",
-                tags={
-                    "issue_category": issue_category_metric,
-                    "pipeline": pipeline_step.__name__,
-                },
-            )
-            logger.exception(
-                "Failed to process pipeline step %s",
-                pipeline_step.__name__,
-                extra={"event": group_event, "group": group_event.group},
-            )
-        else:
-            metrics.incr(
-                "sentry.tasks.post_process.post_process_group.completed",
-                tags={
-                    "issue_category": issue_category_metric,
-                    "pipeline": pipeline_step.__name__,
-                },
-            )
+                )
 
 
 def process_event(data: MutableMapping[str, Any], group_id: int | None) -> Event:
@@ -1553,3 +1562,17 @@ GENERIC_POST_PROCESS_PIPELINE = [
     process_inbox_adds,
     process_rules,
 ]
+
+# Features the pipeline steps check for the event's organization and project, which are
+# evaluated together before the steps run.
+POST_PROCESS_FEATURES = [
+    "organizations:derive-code-mappings",
+    "organizations:escalating-metrics-backend",
+    "organizations:increased-issue-owners-rate-limit",
+    "organizations:integrations-event-hooks",
+    "organizations:sdk-crash-detection",
+    "organizations:user-feedback-event-link-ingestion-changes",
+    "organizations:user-feedback-spam-filter-actions",
+    "projects:first-event-severity-new-escalation",
+    "projects:servicehooks",
+]
@@ -113,6 +113,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     """
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import ConfigSectionCache
 
     validate_args(organization_id, project_id, public_key)
     configs = {}
@@ -125,6 +126,9 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
         # it could be possible that refrequent invalidations cause the task to take excessive time
         # to complete.
         for organization in Organization.objects.filter(id=organization_id):
+            # Sections that are the same for all projects of the organization
+            # are only computed once.
+            section_cache = ConfigSectionCache()
             for project in Project.objects.filter(organization_id=organization_id):
                 project.set_cached_field_value("organization", organization)
                 for key in ProjectKey.objects.filter(project_id=project.id):
@@ -133,7 +137,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                     # recalculate it.  If the config was not there at all, we leave it and avoid the
                     # cost of re-computation.
                     if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
+                        configs[key.public_key] = compute_projectkey_config(key, section_cache)
                         action = "recompute"
                     else:
                         action = "not-cached"
@@ -143,13 +147,14 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                     )
     elif project_id:
         for project in Project.objects.filter(id=project_id):
+            section_cache = ConfigSectionCache()
             for key in ProjectKey.objects.filter(project_id=project_id):
                 key.set_cached_field_value("project", project)
                 # If we find the config in the cache it means it was active.  As such we want to
                 # recalculate it.  If the config was not there at all, we leave it and avoid the
                 # cost of re-computation.
                 if projectconfig_cache.backend.get(key.public_key) is not None:
-                    configs[key.public_key] = compute_projectkey_config(key)
+                    configs[key.public_key] = compute_projectkey_config(key, section_cache)
                     action = "recompute"
                 else:
                     action = "not-cached"
@@ -179,9 +184,11 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_projectkey_config(key, section_cache=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param section_cache: A :class:`ConfigSectionCache` shared by all configs
+        computed in the same pass.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
@@ -190,7 +197,9 @@ def compute_projectkey_config(key):
     if key.status != ProjectKeyStatus.ACTIVE:
         return {"disabled": True}
     else:
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+        return get_project_config(
+            key.project, project_keys=[key], section_cache=section_cache
+        ).to_dict()
 
 
 @instrumented_task(
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from django.utils import timezone
+
+from sentry.tsdb.base import TSDBKey, TSDBModel
+from sentry.tsdb.inmemory import InMemoryTSDB
+
+# Marks a slot that has never been written to.
+EMPTY_BUCKET = -1
+
+
+class RollupBuffer:
+    """
+    Fixed size ring buffer holding the counters of a single series for a
+    single rollup.
+
+    Every slot stores the rollup bucket it was last written for next to its
+    count. A slot whose bucket does not match the requested one holds data
+    that has already aged out of the rollup and is read as zero.
+    """
+
+    __slots__ = ("buckets", "counts", "samples")
+
+    def __init__(self, samples: int) -> None:
+        self.samples = samples
+        self.buckets = array("q", [EMPTY_BUCKET]) * samples
+        self.counts = array("q", [0]) * samples
+
+    def incr(self, bucket: int, count: int) -> None:
+        index = bucket % self.samples
+        if self.buckets[index] != bucket:
+            self.buckets[index] = bucket
+            self.counts[index] = 0
+        self.counts[index] += count
+
+    def get_many(self, buckets: Sequence[int]) -> list[int]:
+        slots = self.buckets
+        counts = self.counts
+        samples = self.samples
+        return [
+            counts[bucket % samples] if slots[bucket % samples] == bucket else 0
+            for bucket in buckets
+        ]
+
+    def delete(self, bucket: int) -> None:
+        index = bucket % self.samples
+        if self.buckets[index] == bucket:
+            self.buckets[index] = EMPTY_BUCKET
+            self.counts[index] = 0
+
+    def merge(self, other: RollupBuffer) -> None:
+        for index, bucket in enumerate(other.buckets):
+            if bucket == EMPTY_BUCKET:
+                continue
+            if self.buckets[index] == bucket:
+                self.counts[index] += other.counts[index]
+            elif self.buckets[index] < bucket:
+                # Our slot holds older data than the source, which would have
+                # been overwritten by now had both been recorded here.
+                self.buckets[index] = bucket
+                self.counts[index] = other.counts[index]
+
+
+class RingBufferTSDB(InMemoryTSDB):
+    """
+    An in-process time-series storage that keeps counters in fixed size,
+    array-backed ring buffers (one per series and rollup).
+
+    Unlike ``InMemoryTSDB`` memory use is bounded by the configured rollups,
+    as old buckets are overwritten instead of accumulating, which makes this
+    usable for single-node deployments. Distinct counters and frequencies are
+    still stored like in ``InMemoryTSDB``.
+    """
+
+    def incr(self, model, key: TSDBKey, timestamp=None, count=1, environment_id=None):
+        self.validate_arguments([model], [environment_id])
+
+        if timestamp is None:
+            timestamp = timezone.now()
+
+        for environment_id in {environment_id, None}:
+            buffers = self._get_buffers(model, key, environment_id)
+            for rollup, buffer in buffers.items():
+                buffer.incr(self.normalize_to_rollup(timestamp, rollup), count)
+
+    def merge(self, model, destination, sources, timestamp=None, environment_ids=None):
+        environment_ids = (set(environment_ids) if environment_ids is not None else set()).union(
+            [None]
+        )
+
+        self.validate_arguments([model], environment_ids)
+
+        counters = self.counters[model]
+        for environment_id in environment_ids:
+            destination_buffers = self._get_buffers(model, destination, environment_id)
+            for source in sources:
+                source_buffers = counters.pop((source, environment_id), None)
+                if source_buffers is None:
+                    continue
+                for rollup, buffer in source_buffers.items():
+                    destination_buffers[rollup].merge(buffer)
+
+    def delete(self, models, keys, start=None, end=None, timestamp=None, environment_ids=None):
+        environment_ids = (set(environment_ids) if environment_ids is not None else set()).union(
+            [None]
+        )
+
+        self.validate_arguments(models, environment_ids)
+
+        rollups = self.get_active_series(start, end, timestamp)
+
+        for model in models:
+            counters = self.counters[model]
+            for key in keys:
+                for environment_id in environment_ids:
+                    buffers = counters.get((key, environment_id))
+                    if buffers is None:
+                        continue
+                    for rollup, series in rollups.items():
+                        for timestamp in series:
+                            buffers[rollup].delete(self.normalize_to_rollup(timestamp, rollup))
+
+    def get_range(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_ids: list[int] | None = None,
+        conditions=None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> dict[TSDBKey, list[tuple[int, int]]]:
+        self.validate_arguments([model], environment_ids if environment_ids is not None else [None])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+
+        return {
+            key: list(zip(series, self._get_counts(model, key, rollup, series, environment_ids)))
+            for key in keys
+        }
+
+    def get_sums(
+        self,
+        model: TSDBModel,
+        keys: list[int],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        use_cache: bool = False,
+        jitter_value: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> dict[int, int]:
+        self.validate_arguments([model], [environment_id])
+
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+        environment_ids = [environment_id] if environment_id is not None else None
+
+        return {
+            key: sum(self._get_counts(model, key, rollup, series, environment_ids))
+            for key in keys
+        }
+
+    def flush(self):
+        super().flush()
+
+        # self.counters[model][(key, environment_id)][rollup] = RollupBuffer
+        self.counters: dict[TSDBModel, dict[tuple[TSDBKey, int | None], dict[int, RollupBuffer]]]
+        self.counters = {model: {} for model in TSDBModel}
+
+    def _get_buffers(
+        self, model: TSDBModel, key: TSDBKey, environment_id: int | None
+    ) -> dict[int, RollupBuffer]:
+        counters = self.counters[model]
+        buffers = counters.get((key, environment_id))
+        if buffers is None:
+            buffers = counters[(key, environment_id)] = {
+                rollup: RollupBuffer(samples) for rollup, samples in self.rollups.items()
+            }
+        return buffers
+
+    def _get_counts(
+        self,
+        model: TSDBModel,
+        key: TSDBKey,
+        rollup: int,
+        series: list[int],
+        environment_ids: Iterable[int] | None,
+    ) -> list[int]:
+        buckets = [self.normalize_ts_to_rollup(timestamp, rollup) for timestamp in series]
+        counters = self.counters[model]
+
+        totals = [0] * len(buckets)
+        for environment_id in environment_ids or [None]:
+            buffers = counters.get((key, environment_id))
+            if buffers is None or rollup not in buffers:
+                continue
+            for index, count in enumerate(buffers[rollup].get_many(buckets)):
+                totals[index] += count
+        return totals
@@ -115,10 +115,13 @@ class PrimaryHashUnmergeReplacement(UnmergeReplacement):
     def run_postgres_replacement(
         self, project: Project, destination_id: int, locked_primary_hashes: Collection[str]
     ) -> None:
+        from sentry.grouping.ingest.hashing import invalidate_grouphash_cache
+
         # Move the group hashes to the destination.
         GroupHash.objects.filter(project_id=project.id, hash__in=locked_primary_hashes).update(
             group=destination_id
         )
+        invalidate_grouphash_cache(project.id)
 
     def get_activity_args(self) -> Mapping[str, Any]:
         return {"fingerprints": self.fingerprints}
@@ -1,5 +1,6 @@
 import zlib
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from typing import Any, Generic, TypeVar
 
 import zstandard
@@ -91,3 +92,69 @@ class ZstdCodec(Codec[bytes, bytes]):
 
     def decode(self, value: bytes) -> bytes:
         return zstandard.ZstdDecompressor().decompress(value)
+
+
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class OptionalZstdCodec(ZstdCodec):
+    """
+    Zstandard compression that passes through values which are not zstd
+    frames on decoding, so that compression can be enabled for a store that
+    still holds uncompressed values.
+    """
+
+    def decode(self, value: bytes) -> bytes:
+        if not value.startswith(ZSTD_FRAME_MAGIC):
+            return value
+        return super().decode(value)
+
+
+class ZstdDictCodec(Codec[bytes, bytes]):
+    """
+    Zstandard compression using pre-trained dictionaries.
+
+    Values are compressed with ``dictionary`` (if any). The ID of the
+    dictionary is part of the zstd frame header, which allows decoding values
+    that were compressed with any of the dictionaries passed to the
+    constructor, without having to store which one was used elsewhere.
+    """
+
+    def __init__(
+        self,
+        dictionary: zstandard.ZstdCompressionDict | None = None,
+        dictionaries: Iterable[zstandard.ZstdCompressionDict] = (),
+        level: int = 3,
+    ) -> None:
+        self.dictionary = dictionary
+        self.level = level
+        self.dictionaries = {d.dict_id(): d for d in dictionaries}
+        if dictionary is not None:
+            self.dictionaries[dictionary.dict_id()] = dictionary
+
+    @classmethod
+    def train(cls, samples: Sequence[bytes], dict_size: int = 110 * 1024) -> bytes:
+        """
+        Train a dictionary from sample values. The returned bytes can be
+        stored and later loaded with ``zstandard.ZstdCompressionDict``.
+        """
+        return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+    def encode(self, value: bytes) -> bytes:
+        if self.dictionary is None:
+            return zstandard.ZstdCompressor(level=self.level).compress(value)
+        return zstandard.ZstdCompressor(level=self.level, dict_data=self.dictionary).compress(
+            value
+        )
+
+    def decode(self, value: bytes) -> bytes:
+        dict_id = zstandard.get_frame_parameters(value).dict_id
+        if not dict_id:
+            return zstandard.ZstdDecompressor().decompress(value)
+
+        try:
+            dictionary = self.dictionaries[dict_id]
+        except KeyError:
+            raise ValueError(f"unknown zstd dictionary: {dict_id}")
+
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(value)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from datetime import timedelta
 from typing import TypeVar
 
@@ -23,12 +24,36 @@ class RedisKVStorage(KVStorage[str, T]):
     def get(self, key: str) -> T | None:
         return self.client.get(key.encode("utf8"))
 
+    def get_many(self, keys: Sequence[str]) -> Iterator[tuple[str, T]]:
+        # Keys may map to different nodes of a cluster, so they are fetched
+        # with a pipeline rather than a single MGET.
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.get(key.encode("utf8"))
+            values = pipeline.execute()
+
+        for key, value in zip(keys, values):
+            if value is not None:
+                yield key, value
+
     def set(self, key: str, value: T, ttl: timedelta | None = None) -> None:
         self.client.set(key.encode("utf8"), value, ex=ttl)
 
+    def set_many(self, items: Sequence[tuple[str, T]], ttl: timedelta | None = None) -> None:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in items:
+                pipeline.set(key.encode("utf8"), value, ex=ttl)
+            pipeline.execute()
+
     def delete(self, key: str) -> None:
         self.client.delete(key.encode("utf8"))
 
+    def delete_many(self, keys: Sequence[str]) -> None:
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key in keys:
+                pipeline.delete(key.encode("utf8"))
+            pipeline.execute()
+
     def bootstrap(self) -> None:
         pass  # nothing to do
 
@@ -24,6 +24,15 @@ class LockBackend:
         """
         raise NotImplementedError
 
+    def extend(self, key: str, duration: int, routing_key: str | None = None) -> None:
+        """
+        Extend a lock held by this backend so that it expires in the given
+        duration (in seconds) from now. The return value is not used. If the
+        lock is not held by this backend anymore, an exception should be
+        raised.
+        """
+        raise NotImplementedError
+
     def locked(self, key: str, routing_key: str | None = None) -> bool:
         """
         Check if a lock has been taken.
@@ -91,6 +91,10 @@ class MigrationLockBackend(LockBackend):
             pass
         backend.release(key=key, routing_key=routing_key)
 
+    def extend(self, key: str, duration: int, routing_key: str | None = None) -> None:
+        backend = self._get_backend(key=key, routing_key=routing_key)
+        return backend.extend(key=key, duration=duration, routing_key=routing_key)
+
     def locked(self, key: str, routing_key: str | None = None) -> bool:
         return self.backend_old.locked(key=key, routing_key=routing_key) or self.backend_new.locked(
             key=key, routing_key=routing_key
@@ -11,6 +11,7 @@ from sentry.utils import redis
 from sentry.utils.locking.backends import LockBackend
 
 delete_lock = redis.load_redis_script("utils/locking/delete_lock.lua")
+extend_lock = redis.load_redis_script("utils/locking/extend_lock.lua")
 
 
 class BaseRedisLockBackend(LockBackend):
@@ -42,6 +43,10 @@ class BaseRedisLockBackend(LockBackend):
         client = self.get_client(key, routing_key)
         delete_lock((self.prefix_key(key),), (self.uuid,), client)
 
+    def extend(self, key: str, duration: int, routing_key: str | None = None) -> None:
+        client = self.get_client(key, routing_key)
+        extend_lock((self.prefix_key(key),), (self.uuid, duration), client)
+
     def locked(self, key: str, routing_key: str | None = None) -> bool:
         client = self.get_client(key, routing_key)
         return client.get(self.prefix_key(key)) is not None
@@ -79,6 +79,19 @@ class Lock:
 
         raise UnableToAcquireLock(f"Unable to acquire {self!r} because of timeout")
 
+    def extend(self) -> None:
+        """
+        Extend a lock held by this process so that it expires after its full
+        duration from now, for long running work that proceeds in steps.
+
+        If the lock is not held anymore, an ``UnableToAcquireLock`` error will
+        be raised.
+        """
+        try:
+            self.backend.extend(self.key, self.duration, self.routing_key)
+        except Exception as error:
+            raise UnableToAcquireLock(f"Unable to extend {self!r} due to error: {error}") from error
+
     def release(self) -> None:
         """
         Attempt to release the lock.
@@ -116,6 +116,50 @@ class TestRedisBuffer:
         self.buf.process("foo")
         process.assert_called_once_with(Group, columns, filters, extra, signal_only)
 
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_process_batch_keys(self, process):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        for key, pk in (("foo", 1), ("bar", 2)):
+            client.hmset(
+                key,
+                {"f": '{"pk": ["i","%d"]}' % pk, "i+times_seen": "2", "m": "sentry.models.Group"},
+            )
+            client.zadd("b:p", {key: 1})
+
+        # A key that is locked by another worker is left alone
+        client.hmset(
+            "baz", {"f": '{"pk": ["i","3"]}', "i+times_seen": "2", "m": "sentry.models.Group"}
+        )
+        client.set("l:baz", "1")
+
+        self.buf.process(batch_keys=["foo", "bar", "baz"])
+
+        assert process.call_count == 2
+        process.assert_any_call(Group, {"times_seen": 2}, {"pk": 1}, {}, None)
+        process.assert_any_call(Group, {"times_seen": 2}, {"pk": 2}, {}, None)
+        assert not client.exists("foo")
+        assert not client.exists("bar")
+        assert client.exists("baz")
+        assert not client.exists("l:foo")
+        assert not client.exists("l:bar")
+        assert client.zrange("b:p", 0, -1) == []
+
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_process_batch_keys_continues_after_error(self, process):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        for key, pk in (("foo", 1), ("bar", 2)):
+            client.hmset(
+                key,
+                {"f": '{"pk": ["i","%d"]}' % pk, "i+times_seen": "1", "m": "sentry.models.Group"},
+            )
+
+        process.side_effect = [Exception("boom"), None]
+        self.buf.process(batch_keys=["foo", "bar"])
+
+        assert process.call_count == 2
+        assert not client.exists("l:foo")
+        assert not client.exists("l:bar")
+
     @django_db_all
     @freeze_time()
     def test_group_cache_updated(self, default_group, task_runner):
@@ -269,6 +313,19 @@ class TestRedisBuffer:
         result = json.loads(project_ids_to_rule_data[project_id2][0].get(f"{rule2_id}:{group3_id}"))
         assert result.get("event_id") == event4_id
 
+    def test_push_to_hash_bulk(self):
+        self.buf.push_to_hash(
+            model=Project, filters={"project_id": 1}, field="1:1", value="existing"
+        )
+        self.buf.push_to_hash_bulk(
+            model=Project, filters={"project_id": 1}, data={"1:2": "foo", "2:2": "bar"}
+        )
+        assert self.buf.get_hash(model=Project, field={"project_id": 1}) == {
+            "1:1": "existing",
+            "1:2": "foo",
+            "2:2": "bar",
+        }
+
     def test_buffer_hook_registry(self):
         """Test that we can add an event to the registry and that the callback is invoked"""
         mock = Mock()
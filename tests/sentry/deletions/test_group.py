@@ -4,6 +4,7 @@ from uuid import uuid4
 from sentry import nodestore
 from sentry.deletions.defaults.group import EventDataDeletionTask
 from sentry.eventstore.models import Event
+from sentry.grouping.ingest.hashing import get_or_create_grouphashes
 from sentry.models.eventattachment import EventAttachment
 from sentry.models.files.file import File
 from sentry.models.group import Group
@@ -101,6 +102,20 @@ class DeleteGroupTest(TestCase, SnubaTestCase):
         assert nodestore.backend.get(self.node_id3), "Does not remove from second group"
         assert Group.objects.filter(id=self.keep_event.group_id).exists()
 
+    def test_invalidates_grouphash_cache(self):
+        group = self.event.group
+        hashes = list(GroupHash.objects.filter(group=group).values_list("hash", flat=True))
+
+        with self.options({"grouping.grouphash-cache-ttl": 60}):
+            get_or_create_grouphashes(self.project, hashes)
+
+            with self.tasks():
+                delete_groups(object_ids=[group.id])
+
+            grouphashes = get_or_create_grouphashes(self.project, hashes)
+
+        assert all(grouphash.group_id is None for grouphash in grouphashes)
+
     def test_simple_multiple_groups(self):
         other_event = self.store_event(
             data={
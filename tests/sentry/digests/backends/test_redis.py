@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 import pytest
 
@@ -151,3 +152,86 @@ class RedisBackendTestCase(TestCase):
 
         with backend.digest("timeline", 0) as records:
             assert len(set(records)) == n
+
+    def test_schedule_batches(self):
+        backend = RedisBackend(schedule_batch_size=2)
+
+        timelines = [f"timeline:{i}" for i in range(5)]
+        for timeline in timelines:
+            backend.add(timeline, Record("record:1", "value", time.time()))
+            with backend.digest(timeline, 0):
+                pass
+
+        # All timelines are claimed, even though each script call only moves
+        # up to two of them.
+        assert {entry.key for entry in backend.schedule(time.time())} == set(timelines)
+        assert set(backend.schedule(time.time())) == set()
+
+    def test_schedule_batch_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            RedisBackend(schedule_batch_size=0)
+
+    def test_digest_stream(self):
+        backend = RedisBackend()
+
+        t = time.time()
+        records = [Record(f"record:{i}", f"{i}", t + i) for i in range(5)]
+        for record in records:
+            backend.add("timeline", record)
+
+        with backend.digest_stream("timeline", 0, page_size=2) as pages:
+            # Pages are returned in reverse chronological order.
+            assert [[record.key for record in page] for page in pages] == [
+                ["record:4", "record:3"],
+                ["record:2", "record:1"],
+                ["record:0"],
+            ]
+
+        assert {entry.key for entry in backend.schedule(time.time())} == {"timeline"}
+        with backend.digest("timeline", 0) as digested:
+            assert digested == []
+
+    def test_digest_stream_partially_consumed(self):
+        backend = RedisBackend()
+
+        t = time.time()
+        for i in range(5):
+            backend.add("timeline", Record(f"record:{i}", f"{i}", t + i))
+
+        with backend.digest_stream("timeline", 0, page_size=2) as pages:
+            assert [record.key for record in next(pages)] == ["record:4", "record:3"]
+
+        # Records that were not fetched remain in the digest.
+        assert {entry.key for entry in backend.schedule(time.time())} == {"timeline"}
+        with backend.digest("timeline", 0) as digested:
+            assert [record.key for record in digested] == ["record:2", "record:1", "record:0"]
+
+    def test_digest_stream_extends_lock_per_page(self):
+        backend = RedisBackend()
+
+        t = time.time()
+        for i in range(5):
+            backend.add("timeline", Record(f"record:{i}", f"{i}", t + i))
+
+        with mock.patch("sentry.utils.locking.lock.Lock.extend") as extend:
+            with backend.digest_stream("timeline", 0, page_size=2) as pages:
+                for _ in pages:
+                    pass
+
+        # Before fetching the second and third page
+        assert extend.call_count == 2
+
+    def test_large_digest_stream(self):
+        backend = RedisBackend()
+
+        n = 10000
+        t = time.time()
+        for i in range(n):
+            backend.add("timeline", Record(f"record:{i}", f"{i}", t))
+
+        with backend.digest_stream("timeline", 0, page_size=1000) as pages:
+            sizes = [len(page) for page in pages]
+
+        assert sizes == [1000] * 10
+        with backend.digest("timeline", 0) as records:
+            assert records == []
@@ -0,0 +1,62 @@
+"""
+Benchmarks for digesting large timelines with the Redis digest backend.
+
+Every round digests a freshly filled timeline of ``RECORD_COUNT`` records, either all at once with
+``digest`` or in pages with ``digest_stream``. Next to the timings, the peak memory allocated by a
+single (untimed) run is recorded as ``peak_allocated_bytes`` in the benchmark's ``extra_info``::
+
+    pytest tests/sentry/digests/test_benchmark.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+import uuid
+
+import pytest
+
+from sentry.digests import Record
+from sentry.digests.backends.redis import RedisBackend
+from sentry.testutils.skips import requires_benchmark
+
+RECORD_COUNT = 10000
+
+PAGE_SIZE = 1000
+
+ROUNDS = 5
+
+
+def fill_timeline(backend: RedisBackend) -> tuple[tuple, dict]:
+    key = f"timeline:{uuid.uuid4().hex}"
+    t = time.time()
+    for i in range(RECORD_COUNT):
+        backend.add(key, Record(f"record:{i}", {"id": i, "message": "x" * 256}, t + i))
+    return (backend, key), {}
+
+
+def digest(backend: RedisBackend, key: str) -> int:
+    with backend.digest(key, 0) as records:
+        return len(records)
+
+
+def digest_stream(backend: RedisBackend, key: str) -> int:
+    with backend.digest_stream(key, 0, page_size=PAGE_SIZE) as pages:
+        return sum(len(records) for records in pages)
+
+
+@requires_benchmark
+@pytest.mark.parametrize("function", [digest, digest_stream], ids=lambda x: x.__name__)
+def test_benchmark_digest(function, benchmark):
+    backend = RedisBackend()
+
+    args, kwargs = fill_timeline(backend)
+    tracemalloc.start()
+    try:
+        assert function(*args, **kwargs) == RECORD_COUNT
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_allocated_bytes"] = peak
+
+    benchmark.pedantic(function, setup=lambda: fill_timeline(backend), rounds=ROUNDS)
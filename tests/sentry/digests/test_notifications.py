@@ -7,7 +7,9 @@ from functools import cached_property, reduce
 
 from sentry.digests import Record
 from sentry.digests.notifications import (
+    DigestBuilder,
     Notification,
+    build_digest,
     event_to_record,
     group_records,
     rewrite_record,
@@ -139,6 +141,30 @@ class SortRecordsTestCase(TestCase):
         }
 
 
+class DigestBuilderTestCase(TestCase):
+    def test_matches_build_digest(self):
+        rule = self.project.rule_set.all()[0]
+        notification_uuid = str(uuid.uuid4())
+        events = [
+            self.store_event(data={"fingerprint": [f"group-{i % 2}"]}, project_id=self.project.id)
+            for i in range(5)
+        ]
+        records = [
+            event_to_record(event, (rule,), notification_uuid) for event in reversed(events)
+        ]
+
+        builder = DigestBuilder(self.project)
+        for i in range(0, len(records), 2):
+            builder.add(records[i : i + 2])
+        digest, _ = builder.build()
+
+        assert digest == build_digest(self.project, records)[0]
+        assert builder.notification_uuid == notification_uuid
+
+    def test_empty(self):
+        assert DigestBuilder(self.project).build() == (None, [])
+
+
 class SplitKeyTestCase(TestCase):
     def test_old_style_key(self):
         assert split_key(f"mail:p:{self.project.id}") == (
@@ -1,5 +1,8 @@
 from datetime import datetime
 
+import pytest
+
+from sentry.eventstore.processing.redis import RedisClusterEventProcessingStore
 from sentry.eventstore.reprocessing.redis import RedisReprocessingStore
 from sentry.testutils.helpers.redis import use_redis_cluster
 
@@ -20,3 +23,32 @@ def test_mark_event_reprocessed():
     assert progress is not None
     assert progress.get("syncCount") == 10
     assert progress.get("totalEvents") == 20
+
+
+@use_redis_cluster()
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_processing_store_many(compression):
+    store = RedisClusterEventProcessingStore(cluster="cluster", compression=compression)
+    events = [{"project": 1, "event_id": f"{i:032x}", "message": "hello"} for i in range(5)]
+
+    keys = store.store_many(events)
+    assert keys == [store.store(event) for event in events]
+    unprocessed_keys = store.store_many(events[:2], unprocessed=True)
+    assert unprocessed_keys == [f"{key}:u" for key in keys[:2]]
+
+    assert store.get_many(keys + ["e:missing:1"]) == dict(zip(keys, events))
+    assert store.get_many(keys, unprocessed=True) == dict(zip(keys[:2], events[:2]))
+    assert store.get(keys[0]) == events[0]
+
+    store.delete_many(events[:3])
+    assert store.get_many(keys) == dict(zip(keys[3:], events[3:]))
+    assert store.get_many(keys, unprocessed=True) == {}
+
+
+@use_redis_cluster()
+def test_processing_store_enable_compression():
+    event = {"project": 1, "event_id": "a" * 32}
+    key = RedisClusterEventProcessingStore(cluster="cluster").store(event)
+
+    # Events stored before compression was enabled remain readable.
+    assert RedisClusterEventProcessingStore(cluster="cluster", compression="zstd").get(key) == event
@@ -52,3 +52,44 @@ def test_basic():
             }
         },
     )
+
+
+def test_modules():
+    modules = {"django": "5.0", "celery": "5.3", "sentry-sdk": "2.0"}
+    new_data, extra_keys = deduplicate({"modules": dict(modules), "platform": "python"})
+
+    assert "modules" not in new_data
+    assert list(extra_keys.values()) == [dict(sorted(modules.items()))]
+
+    _assert_roundtrip({"modules": modules, "platform": "python"})
+    _assert_roundtrip({"modules": {}})
+    _assert_roundtrip({"modules": None})
+
+    # Nothing is pulled out if there is nothing to deduplicate
+    assert deduplicate({"modules": {}, "debug_meta": {}}) == (
+        {"modules": {}, "debug_meta": {}},
+        {},
+    )
+
+
+def test_input_not_modified():
+    image = {"image_addr": "0xdeadbeef", "debug_id": "1234abcdef"}
+    debug_meta = {"images": [image, None]}
+
+    deduplicate({"debug_meta": debug_meta})
+
+    assert debug_meta == {"images": [{"image_addr": "0xdeadbeef", "debug_id": "1234abcdef"}, None]}
+
+
+def test_assemble_missing():
+    new_data, extra_keys = deduplicate(
+        {"modules": {"django": "5.0"}, "debug_meta": {"images": [{"debug_id": "1234"}]}}
+    )
+
+    # Only the interfaces whose data is missing are left out
+    modules_checksums = {k: v for k, v in extra_keys.items() if v == {"django": "5.0"}}
+    assert len(modules_checksums) == 1
+    assert assemble(dict(new_data), lambda checksums: modules_checksums) == {
+        "modules": {"django": "5.0"}
+    }
+    assert assemble(dict(new_data), lambda checksums: {}) == {}
@@ -293,6 +293,78 @@ class FeatureManagerTest(TestCase):
         assert manager.has("projects:feature", actor=self.user, project=self.project)
         assert manager.has("auth:register", actor=self.user)
 
+    def test_evaluation_scope(self):
+        manager = features.FeatureManager()
+        manager.add("organizations:feature", OrganizationFeature)
+        handler = mock.Mock(features=["organizations:feature"], return_value=True)
+        manager.add_handler(handler)
+
+        # Outside of a scope, every check is evaluated
+        assert manager.has("organizations:feature", self.organization)
+        assert manager.has("organizations:feature", self.organization)
+        assert handler.call_count == 2
+
+        with manager.evaluation_scope():
+            assert manager.has("organizations:feature", self.organization)
+            with manager.evaluation_scope():
+                assert manager.has("organizations:feature", self.organization)
+            assert manager.has("organizations:feature", self.organization)
+            assert handler.call_count == 3
+
+            # Checks for another actor or organization are memoized separately
+            assert manager.has("organizations:feature", self.organization, actor=self.user)
+            assert manager.has("organizations:feature", self.create_organization())
+            assert handler.call_count == 5
+
+            handler.return_value = False
+            manager.invalidate("organizations:feature")
+            assert not manager.has("organizations:feature", self.organization)
+            assert handler.call_count == 6
+
+        assert not manager.has("organizations:feature", self.organization)
+        assert handler.call_count == 7
+
+    def test_prefetch(self):
+        manager = features.FeatureManager()
+        manager.add("organizations:feature", OrganizationFeature)
+        manager.add("projects:feature", ProjectFeature)
+        manager.add("projects:unhandled", ProjectFeature)
+        manager.add_entity_handler(MockBatchHandler())
+        projects = [self.project, self.create_project()]
+
+        # Outside of a scope, there is nothing to prefetch into
+        manager.prefetch(["projects:feature"], self.organization, projects)
+
+        with manager.evaluation_scope(), mock.patch.object(
+            manager, "_evaluate", wraps=manager._evaluate
+        ) as evaluate:
+            manager.prefetch(
+                ["organizations:feature", "projects:feature", "projects:unhandled"],
+                self.organization,
+                projects,
+            )
+            prefetched = evaluate.call_count
+
+            assert manager.has("organizations:feature", self.organization)
+            for project in projects:
+                assert manager.has("projects:feature", project)
+                assert manager.has("projects:unhandled", project)
+            assert evaluate.call_count == prefetched
+
+    def test_prefetch_has_for_batch(self):
+        manager = features.FeatureManager()
+        manager.add("projects:feature", ProjectFeature)
+        manager.add_handler(MockBatchHandler())
+        projects = [self.project, self.create_project()]
+
+        with manager.evaluation_scope(), mock.patch.object(
+            manager, "_evaluate", wraps=manager._evaluate
+        ) as evaluate:
+            manager.prefetch(["projects:feature"], self.organization, projects, actor=self.user)
+            for project in projects:
+                assert manager.has("projects:feature", project, actor=self.user)
+            assert evaluate.call_count == 0
+
     def test_user_flag(self):
         manager = features.FeatureManager()
         manager.add("users:feature", UserFeature)
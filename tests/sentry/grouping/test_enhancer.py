@@ -67,6 +67,43 @@ def test_parse_empty_with_base():
     assert enhancement
 
 
+def test_loads_shares_instances():
+    dumped = Enhancements.from_config_string(
+        "function:foo -app", bases=["newstyle:2023-01-11"]
+    ).dumps()
+
+    assert Enhancements.loads(dumped) is Enhancements.loads(dumped)
+    assert Enhancements.loads(dumped) is Enhancements.loads(dumped.encode("ascii"))
+
+    other = Enhancements.from_config_string("function:bar -app").dumps()
+    assert Enhancements.loads(other) is not Enhancements.loads(dumped)
+
+
+def test_create_match_frame():
+    match_frame = create_match_frame(
+        {
+            "function": "Foo",
+            "module": "foo.bar",
+            "package": "C:\\Windows\\System32\\Kernel32.DLL",
+            "filename": "Foo.java",
+            "in_app": True,
+            "data": {"category": "system", "orig_in_app": -1},
+        },
+        "java",
+    )
+
+    assert match_frame == {
+        "category": b"system",
+        "family": b"other",
+        "function": b"Foo",
+        "in_app": True,
+        "orig_in_app": -1,
+        "module": b"foo.bar",
+        "package": b"c:/windows/system32/kernel32.dll",
+        "path": b"foo.java",
+    }
+
+
 def test_parsing_errors():
     with pytest.raises(InvalidEnhancerConfig):
         Enhancements.from_config_string("invalid.message:foo -> bar")
@@ -8,8 +8,12 @@ from sentry.grouping.ingest.hashing import (
     _calculate_background_grouping,
     _calculate_event_grouping,
     _calculate_secondary_hash,
+    get_or_create_grouphashes,
+    get_or_create_grouphashes_many,
+    invalidate_grouphash_cache,
 )
 from sentry.models.group import Group
+from sentry.models.grouphash import GroupHash
 from sentry.testutils.cases import TestCase
 from sentry.testutils.skips import requires_snuba
 
@@ -167,3 +171,52 @@ class SecondaryGroupingTest(TestCase):
             mock_capture_exception.assert_called_with(secondary_grouping_error)
             # This proves the secondary grouping crash didn't crash the overall grouping process
             assert event.group
+
+
+class GetOrCreateGroupHashesTest(TestCase):
+    def test_creates_missing_grouphashes(self) -> None:
+        existing = GroupHash.objects.create(project=self.project, hash="a" * 32)
+
+        grouphashes = get_or_create_grouphashes(self.project, ["b" * 32, "a" * 32, "b" * 32])
+
+        assert [grouphash.hash for grouphash in grouphashes] == ["b" * 32, "a" * 32, "b" * 32]
+        assert grouphashes[1].id == existing.id
+        assert grouphashes[0].id == grouphashes[2].id
+        assert GroupHash.objects.filter(project=self.project).count() == 2
+
+    def test_many_projects(self) -> None:
+        other_project = self.create_project()
+        GroupHash.objects.create(project=other_project, hash="a" * 32)
+
+        grouphashes = get_or_create_grouphashes_many(
+            [(self.project, ["a" * 32]), (other_project, ["a" * 32, "b" * 32])]
+        )
+
+        assert set(grouphashes) == {
+            (self.project.id, "a" * 32),
+            (other_project.id, "a" * 32),
+            (other_project.id, "b" * 32),
+        }
+        assert grouphashes[(self.project.id, "a" * 32)].project_id == self.project.id
+        assert grouphashes[(other_project.id, "a" * 32)].project_id == other_project.id
+
+    def test_cache(self) -> None:
+        group = self.create_group(project=self.project)
+        GroupHash.objects.create(project=self.project, hash="a" * 32, group=group)
+        GroupHash.objects.create(project=self.project, hash="b" * 32)
+
+        with self.options({"grouping.grouphash-cache-ttl": 60}):
+            get_or_create_grouphashes(self.project, ["a" * 32, "b" * 32])
+
+            # Only the grouphash assigned to a group is served from the cache
+            with self.assertNumQueries(1):
+                grouphashes = get_or_create_grouphashes(self.project, ["a" * 32, "b" * 32])
+            assert grouphashes[0].group_id == group.id
+            assert grouphashes[1].group_id is None
+
+            other_group = self.create_group(project=self.project)
+            GroupHash.objects.filter(hash="a" * 32).update(group=other_group)
+            invalidate_grouphash_cache(self.project.id)
+
+            (grouphash,) = get_or_create_grouphashes(self.project, ["a" * 32])
+            assert grouphash.group_id == other_group.id
@@ -0,0 +1,223 @@
+"""
+Benchmarks for the stages an error event passes through from ingestion until its alerts fire.
+
+Every stage is benchmarked separately, against recorded events, using the same Postgres, Redis and
+Snuba instances as the rest of the test suite. Next to the timings, the peak memory allocated by a
+single (untimed) run of the stage is recorded as ``peak_allocated_bytes`` in the benchmark's
+``extra_info``.
+
+To compare two releases, run the suite on both and diff the reports::
+
+    pytest tests/sentry/ingest/test_benchmark.py --benchmark-only --benchmark-autosave
+    pytest tests/sentry/ingest/test_benchmark.py --benchmark-only --benchmark-compare
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from time import time
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from sentry.event_manager import EventManager
+from sentry.eventstore.processing import event_processing_store
+from sentry.models.rule import Rule
+from sentry.rules.processing.processor import RuleProcessor
+from sentry.tasks.post_process import post_process_group
+from sentry.tasks.store import _do_preprocess_event, _do_save_event, do_process_event
+from sentry.testutils.helpers.eventprocessing import write_event_to_cache
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.performance_issues.event_generators import get_event
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.testutils.skips import requires_benchmark, requires_snuba
+from sentry.utils.performance_issues.performance_detection import detect_performance_problems
+from tests.sentry.grouping import grouping_input as grouping_inputs
+
+pytestmark = [requires_snuba]
+
+# A fixed selection of recorded events, so that results stay comparable between runs.
+ERROR_EVENTS = sorted(grouping_inputs, key=lambda x: x.filename)[:20]
+
+PERFORMANCE_EVENTS = [
+    "n-plus-one-in-django-index-view",
+    "n-plus-one-in-rails-index-view",
+    "query-waterfall-in-django-random-view",
+    "slow-db-spans",
+    "file-io-on-main-thread",
+    "no-issue-in-django-detail-view",
+]
+
+ROUNDS = 20
+
+
+def run_benchmark(
+    benchmark, function: Callable[..., Any], setup: Callable[[], tuple[tuple, dict]]
+) -> None:
+    """
+    Benchmarks ``function`` with fresh arguments from ``setup`` for every round, and records the
+    peak memory allocated by a single call.
+    """
+    args, kwargs = setup()
+    tracemalloc.start()
+    try:
+        function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_allocated_bytes"] = peak
+
+    benchmark.pedantic(function, setup=setup, rounds=ROUNDS)
+
+
+def make_event_data(grouping_input, project) -> dict[str, Any]:
+    data = dict(grouping_input.data)
+    data.pop("_grouping", None)
+    data["event_id"] = uuid.uuid4().hex
+    data["timestamp"] = time()
+
+    manager = EventManager(data)
+    manager.normalize()
+    data = dict(manager.get_data())
+    data["project"] = project.id
+    return data
+
+
+def save_event(grouping_input, project):
+    return EventManager(make_event_data(grouping_input, project)).save(project.id)
+
+
+with_error_event = pytest.mark.parametrize(
+    "grouping_input", ERROR_EVENTS, ids=lambda x: x.filename[:-5].replace("-", "_")
+)
+
+
+@pytest.fixture
+def no_task_dispatch():
+    """Stops stages from handing the event on to the next one."""
+    with (
+        mock.patch("sentry.tasks.store.process_event"),
+        mock.patch("sentry.tasks.store.save_event"),
+        mock.patch("sentry.tasks.symbolication.symbolicate_event"),
+    ):
+        yield
+
+
+@requires_benchmark
+@django_db_all
+@with_error_event
+def test_benchmark_preprocess_event(benchmark, default_project, grouping_input, no_task_dispatch):
+    def setup():
+        data = make_event_data(grouping_input, default_project)
+        return (), {
+            "cache_key": event_processing_store.store(data),
+            "data": data,
+            "start_time": time(),
+            "event_id": data["event_id"],
+            "from_reprocessing": False,
+            "project": default_project,
+        }
+
+    run_benchmark(benchmark, _do_preprocess_event, setup)
+
+
+@requires_benchmark
+@django_db_all
+@with_error_event
+def test_benchmark_process_event(benchmark, default_project, grouping_input, no_task_dispatch):
+    def setup():
+        data = make_event_data(grouping_input, default_project)
+        return (), {
+            "cache_key": event_processing_store.store(data),
+            "data": data,
+            "start_time": time(),
+            "event_id": data["event_id"],
+            "from_reprocessing": False,
+        }
+
+    run_benchmark(benchmark, do_process_event, setup)
+
+
+@requires_benchmark
+@django_db_all
+@with_error_event
+def test_benchmark_save_event(benchmark, default_project, grouping_input):
+    def setup():
+        data = make_event_data(grouping_input, default_project)
+        return (), {
+            "cache_key": event_processing_store.store(data),
+            "start_time": time(),
+            "event_id": data["event_id"],
+            "project_id": default_project.id,
+        }
+
+    run_benchmark(benchmark, _do_save_event, setup)
+
+
+@requires_benchmark
+@django_db_all
+@with_error_event
+def test_benchmark_post_process_group(benchmark, default_project, grouping_input):
+    def setup():
+        event = save_event(grouping_input, default_project)
+        return (), {
+            "is_new": False,
+            "is_regression": False,
+            "is_new_group_environment": False,
+            "cache_key": write_event_to_cache(event),
+            "group_id": event.group_id,
+            "project_id": default_project.id,
+        }
+
+    run_benchmark(benchmark, post_process_group, setup)
+
+
+@requires_benchmark
+@django_db_all
+@with_error_event
+def test_benchmark_rule_processor(benchmark, default_project, grouping_input):
+    for frequency in (5, 30, 60):
+        Rule.objects.create(
+            project=default_project,
+            data={
+                "conditions": [
+                    {"id": "sentry.rules.conditions.every_event.EveryEventCondition"},
+                    {
+                        "id": "sentry.rules.conditions.event_frequency.EventFrequencyCondition",
+                        "interval": "1h",
+                        "value": 1000,
+                    },
+                ],
+                "actions": [{"id": "sentry.rules.actions.notify_event.NotifyEventAction"}],
+                "frequency": frequency,
+            },
+        )
+
+    event = save_event(grouping_input, default_project)
+    group_event = event.for_group(event.group)
+
+    def setup():
+        processor = RuleProcessor(
+            group_event,
+            is_new=False,
+            is_regression=False,
+            is_new_group_environment=False,
+            has_reappeared=False,
+        )
+        return (processor,), {}
+
+    run_benchmark(benchmark, lambda processor: list(processor.apply()), setup)
+
+
+@requires_benchmark
+@django_db_all
+@pytest.mark.parametrize("event_name", PERFORMANCE_EVENTS, ids=lambda x: x.replace("-", "_"))
+def test_benchmark_detect_performance_problems(benchmark, default_project, event_name):
+    def setup():
+        return (get_event(event_name), default_project), {}
+
+    with override_options({"performance.issues.all.problem-detection": 1.0}):
+        run_benchmark(benchmark, detect_performance_problems, setup)
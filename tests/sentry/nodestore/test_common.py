@@ -3,11 +3,16 @@ Testsuite of backend-independent nodestore tests. Add your backend to the
 `ns` fixture to have it tested.
 """
 from contextlib import nullcontext
+from datetime import timedelta
+from unittest import mock
 
 import pytest
+from django.test import override_settings
 
 from sentry.nodestore.django.backend import DjangoNodeStorage
 from sentry.testutils.helpers import override_options
+from sentry.utils import json
+from sentry.utils.codecs import ZSTD_FRAME_MAGIC, ZstdDictCodec
 from tests.sentry.nodestore.bigtable.test_backend import (
     MockedBigtableNodeStorage,
     get_temporary_bigtable_nodestorage,
@@ -97,3 +102,153 @@ def test_set_subkeys(ns):
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 1024 * 1024,
+    }
+)
+def test_local_cache(ns):
+    ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+
+    with mock.patch.object(ns, "_get_bytes", side_effect=AssertionError("not cached")):
+        with mock.patch.object(ns, "_get_bytes_multi", side_effect=AssertionError("not cached")):
+            assert ns.get("node_1") == {"foo": "a"}
+            assert ns.get("node_1", subkey="other") == {"foo": "b"}
+            assert ns.get_multi(["node_1"]) == {"node_1": {"foo": "a"}}
+
+    # Callers must not be able to mutate the cached payload
+    ns.get("node_1")["foo"] = "mutated"
+    assert ns.get("node_1") == {"foo": "a"}
+
+    ns.delete("node_1")
+    assert ns.get("node_1") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 1024 * 1024,
+    }
+)
+def test_local_cache_negative(ns):
+    assert ns.get("node_1") is None
+
+    with mock.patch.object(ns, "_get_bytes", side_effect=AssertionError("not cached")):
+        assert ns.get("node_1") is None
+
+    # Writing the node replaces the cached miss
+    ns.set("node_1", {"foo": "a"})
+    assert ns.get("node_1") == {"foo": "a"}
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_compression_dictionaries(ns, tmp_path):
+    samples = [
+        json.dumps({"platform": "python", "id": i, "modules": {"django": "5.0"}}).encode()
+        for i in range(1000)
+    ]
+    dictionary_path = tmp_path / "python.dict"
+    dictionary_path.write_bytes(ZstdDictCodec.train(samples, dict_size=4096))
+
+    # Written without compression dictionaries
+    ns.set("node_1", {"platform": "python", "foo": "a"})
+
+    with override_settings(SENTRY_NODESTORE_COMPRESSION_DICTIONARIES={"python": dictionary_path}):
+        ns.__dict__.pop("_compression_codecs", None)
+        ns.__dict__.pop("_decompression_codec", None)
+
+        ns.set_subkeys("node_2", {None: {"platform": "python", "foo": "b"}, "other": {"foo": "c"}})
+        assert ns.get_bytes("node_2").startswith(ZSTD_FRAME_MAGIC)
+
+        assert ns.get("node_1") == {"platform": "python", "foo": "a"}
+        assert ns.get("node_2") == {"platform": "python", "foo": "b"}
+        assert ns.get("node_2", subkey="other") == {"foo": "c"}
+        assert ns.get_multi(["node_1", "node_2"]) == {
+            "node_1": {"platform": "python", "foo": "a"},
+            "node_2": {"platform": "python", "foo": "b"},
+        }
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.compressor.sample-rate": 1.0}
+)
+def test_deduplication(ns):
+    modules = {f"module-{i}": "1.0" for i in range(500)}
+    nodes = {
+        "node_1": {"project": 1, "platform": "python", "modules": modules, "foo": "a"},
+        "node_2": {"project": 1, "platform": "python", "modules": modules, "foo": "b"},
+    }
+
+    ns.set("node_1", nodes["node_1"])
+    ns.set_subkeys("node_2", {None: nodes["node_2"], "other": {"foo": "c"}})
+
+    # The modules are stored once, outside of the nodes
+    for node_id in nodes:
+        assert b"module-1" not in ns._decompress(ns.get_bytes(node_id))
+    patchsets = json.loads(ns._decompress(ns.get_bytes("node_1")).decode())["__nodestore_patchsets"]
+    ((key, checksum, _),) = patchsets
+    assert key == "modules"
+    assert ns.get_bytes(ns._get_deduplicated_id(1, checksum)) is not None
+
+    assert ns.get("node_1") == nodes["node_1"]
+    assert ns.get("node_2", subkey="other") == {"foo": "c"}
+
+    result = ns.get_multi(["node_1", "node_2"])
+    assert result == nodes
+    # Nodes sharing data do not share the objects holding it
+    assert result["node_1"]["modules"] is not result["node_2"]["modules"]
+
+    # Nodes written before deduplication was enabled are still read
+    with override_options({"nodestore.compressor.sample-rate": 0.0}):
+        ns.set("node_3", {"project": 1, "platform": "python", "modules": modules})
+    assert ns.get("node_3") == {"project": 1, "platform": "python", "modules": modules}
+
+    # Separate data is stored per project
+    ns.set("node_4", {"project": 2, "platform": "python", "modules": modules})
+    assert ns.get_bytes(ns._get_deduplicated_id(2, checksum)) is not None
+
+    # Nodes whose separate data is missing are read without it
+    ns.delete(ns._get_deduplicated_id(2, checksum))
+    assert ns.get("node_4") == {"project": 2, "platform": "python"}
+    assert ns.get_multi(["node_1", "node_4"]) == {
+        "node_1": nodes["node_1"],
+        "node_4": {"project": 2, "platform": "python"},
+    }
+    assert ns.get("node_1") == nodes["node_1"]
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.compressor.sample-rate": 1.0}
+)
+def test_deduplication_large_project_id(ns):
+    project_id = 4506712345678901
+    modules = {f"module-{i}": "1.0" for i in range(500)}
+    node = {"project": project_id, "platform": "python", "modules": modules}
+
+    ns.set("node_1", node)
+
+    patchsets = json.loads(ns._decompress(ns.get_bytes("node_1")).decode())["__nodestore_patchsets"]
+    ((_, checksum, _),) = patchsets
+    # Node ids of the Django backend are limited to 40 characters
+    assert len(ns._get_deduplicated_id(project_id, checksum)) <= 40
+    assert ns.get("node_1") == node
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.compressor.sample-rate": 1.0}
+)
+def test_deduplication_skipped(ns):
+    modules = {f"module-{i}": "1.0" for i in range(500)}
+
+    # Nodes with their own TTL could shorten how long the separate data lives
+    ns.set("node_1", {"project": 1, "modules": modules}, ttl=timedelta(days=1))
+    # Nodes without a project cannot be scoped
+    ns.set("node_2", {"modules": modules})
+
+    for node_id in ("node_1", "node_2"):
+        assert b"module-1" in ns._decompress(ns.get_bytes(node_id))
+    assert ns.get("node_1") == {"project": 1, "modules": modules}
+    assert ns.get("node_2") == {"modules": modules}
@@ -0,0 +1,55 @@
+from unittest import mock
+
+from sentry.nodestore.lru import LocalNodeCache
+
+
+def test_evicts_least_recently_used_by_size():
+    cache = LocalNodeCache(max_bytes=10, negative_ttl=5)
+    cache.set("a", b"12345")
+    cache.set("b", b"1234")
+    assert cache.size == 9
+
+    # Touch "a" so that "b" is the least recently used entry
+    assert cache.get_many(["a"]) == {"a": b"12345"}
+
+    cache.set("c", b"12")
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"12345", "c": b"12"}
+    assert cache.size == 7
+
+
+def test_does_not_cache_oversized_values():
+    cache = LocalNodeCache(max_bytes=10, negative_ttl=5)
+    cache.set("a", b"12345")
+    cache.set("a", b"x" * 11)
+    assert cache.get_many(["a"]) == {}
+    assert cache.size == 0
+
+
+def test_negative_entries_expire():
+    cache = LocalNodeCache(max_bytes=10, negative_ttl=5)
+
+    with mock.patch("sentry.nodestore.lru.monotonic", return_value=100):
+        cache.set("a", None)
+        assert cache.get_many(["a", "b"]) == {"a": None}
+        assert cache.size == 1
+
+    with mock.patch("sentry.nodestore.lru.monotonic", return_value=105):
+        assert cache.get_many(["a"]) == {}
+        assert cache.size == 0
+
+
+def test_resize_and_clear():
+    cache = LocalNodeCache(max_bytes=10, negative_ttl=5)
+    cache.set("a", b"12345")
+    cache.set("b", b"1234")
+
+    cache.resize(max_bytes=5, negative_ttl=5)
+    assert cache.get_many(["a", "b"]) == {"b": b"1234"}
+
+    cache.delete_many(["b"])
+    assert cache.size == 0
+
+    cache.set("a", b"12345")
+    cache.clear()
+    assert cache.get_many(["a"]) == {}
+    assert cache.size == 0
@@ -164,3 +164,62 @@ class OptionsStoreTest(TestCase):
         mocked_time.return_value = 26
         store.clean_local_cache()
         assert not store._local_cache
+
+    def test_snapshot(self):
+        store, key = self.store, self.key
+        other_store = OptionsStore(cache=store.cache)
+
+        store.set(key, "bar", UpdateChannel.CLI)
+        store.refresh_snapshot()
+        other_store.refresh_snapshot()
+
+        snapshot = store.get_snapshot()
+        assert snapshot is not None
+        assert snapshot.values[key.name] == "bar"
+
+        # Reads are served from the snapshot only
+        with patch.object(Option.objects, "get_queryset", side_effect=RuntimeError()):
+            with patch.object(store.cache, "get", side_effect=RuntimeError()):
+                assert store.get(key) == "bar"
+                assert store.get(self.make_key()) is None
+
+        # Changes apply to the snapshot of the writing process right away
+        store.set(key, "baz", UpdateChannel.CLI)
+        assert store.get(key) == "baz"
+        assert other_store.get(key) == "bar"
+
+        # Other processes fetch a new snapshot once the version changed
+        other_snapshot = other_store.get_snapshot()
+        other_store.refresh_snapshot()
+        assert other_store.get_snapshot() is not other_snapshot
+        assert other_store.get(key) == "baz"
+
+        other_snapshot = other_store.get_snapshot()
+        other_store.refresh_snapshot()
+        assert other_store.get_snapshot() is other_snapshot
+
+        store.delete(key)
+        assert store.get(key) is None
+        other_store.refresh_snapshot()
+        assert other_store.get(key) is None
+
+        store.stop_snapshot_refresh()
+        assert store.get_snapshot() is None
+
+    def test_snapshot_updated_by_store_without_snapshot(self):
+        store, key = self.store, self.key
+        other_store = OptionsStore(cache=store.cache)
+
+        store.set(key, "bar", UpdateChannel.CLI)
+        other_store.refresh_snapshot()
+        assert other_store.get(key) == "bar"
+
+        # A process that never took a snapshot still notifies the others
+        assert store.get_snapshot() is None
+        store.set(key, "baz", UpdateChannel.CLI)
+        other_store.refresh_snapshot()
+        assert other_store.get(key) == "baz"
+
+        store.delete(key)
+        other_store.refresh_snapshot()
+        assert other_store.get(key) is None
@@ -6,6 +6,7 @@ from sentry.ratelimits.cardinality import (
     GrantedQuota,
     Quota,
     RedisCardinalityLimiter,
+    RedisSketchCardinalityLimiter,
     RequestedQuota,
 )
 
@@ -227,3 +228,68 @@ def test_regression_mixed_order(limiter: RedisCardinalityLimiter):
     # there used to be a bug where anything after 10 (i.e. 5) was dropped as
     # well (due to a wrong `break` somewhere in a loop)
     assert helper.add_values([0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 5]) == [0, 1, 2, 3, 4, 6, 7, 8, 9, 5]
+
+
+@pytest.fixture
+def sketch_limiter():
+    return RedisSketchCardinalityLimiter()
+
+
+def test_sketch_basic(sketch_limiter: RedisSketchCardinalityLimiter):
+    helper = LimiterHelper(sketch_limiter)
+
+    for _ in range(20):
+        assert helper.add_value(1) == 1
+
+    for _ in range(20):
+        assert helper.add_value(2) == 2
+
+    assert [helper.add_value(10 + i) for i in range(100)] == list(range(10, 18)) + [None] * 92
+
+    # Hashes that have been admitted before are still admitted
+    assert helper.add_values([1, 2, 10, 17, 18]) == [1, 2, 10, 17]
+
+    # After two windows the hashes have been forgotten and we admit 10 new ones
+    helper.timestamp += 7200
+    assert [helper.add_value(20 + i) for i in range(100)] == list(range(20, 30)) + [None] * 90
+
+
+def test_sketch_multiple_prefixes(sketch_limiter: RedisSketchCardinalityLimiter):
+    quota = Quota(window_seconds=3600, granularity_seconds=60, limit=10)
+    requests = [
+        RequestedQuota(prefix="a", unit_hashes=[1, 2, 3, 4, 5], quota=quota),
+        RequestedQuota(prefix="b", unit_hashes=list(range(1, 12)), quota=quota),
+    ]
+    new_timestamp, grants = sketch_limiter.check_within_quotas(requests)
+
+    assert grants == [
+        GrantedQuota(request=requests[0], granted_unit_hashes=[1, 2, 3, 4, 5], reached_quota=None),
+        GrantedQuota(
+            request=requests[1], granted_unit_hashes=list(range(1, 11)), reached_quota=quota
+        ),
+    ]
+    sketch_limiter.use_quotas(grants, new_timestamp)
+
+    requests = [
+        RequestedQuota(prefix="a", unit_hashes=[6, 7, 8, 9, 10, 11], quota=quota),
+        RequestedQuota(prefix="b", unit_hashes=list(range(1, 12)), quota=quota),
+    ]
+    new_timestamp, grants = sketch_limiter.check_within_quotas(requests)
+
+    assert grants == [
+        GrantedQuota(
+            request=requests[0], granted_unit_hashes=[6, 7, 8, 9, 10], reached_quota=quota
+        ),
+        GrantedQuota(
+            request=requests[1], granted_unit_hashes=list(range(1, 11)), reached_quota=quota
+        ),
+    ]
+
+
+def test_sketch_filter_size():
+    limiter = RedisSketchCardinalityLimiter(false_positive_rate=0.01)
+    # ~9.6 bits and 7 hash functions per item, for twice the limit
+    assert limiter._get_filter_size(Quota(3600, 60, 1000)) == (19171, 7)
+
+    with pytest.raises(ValueError):
+        RedisSketchCardinalityLimiter(false_positive_rate=0)
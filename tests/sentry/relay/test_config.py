@@ -20,7 +20,7 @@ from sentry.dynamic_sampling.rules.base import NEW_MODEL_THRESHOLD_IN_MINUTES
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import ProjectConfig, get_project_config
+from sentry.relay.config import ConfigSectionCache, ProjectConfig, get_project_config
 from sentry.sentry_metrics.visibility import block_metric, block_tags_of_metric
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
@@ -270,6 +270,38 @@ def test_project_config_exposed_features_raise_exc(default_project):
         )
 
 
+@django_db_all
+@region_silo_test
+@mock.patch("sentry.relay.config.EXPOSABLE_FEATURES", ["organizations:profiling"])
+def test_project_config_section_cache(default_project):
+    other_project = Factories.create_project(organization=default_project.organization)
+    section_cache = ConfigSectionCache()
+
+    with (
+        Feature({"organizations:profiling": True}),
+        mock.patch(
+            "sentry.relay.config.quotas.backend.get_event_retention", return_value=90
+        ) as get_event_retention,
+    ):
+        cfg = get_project_config(default_project, section_cache=section_cache).to_dict()
+        other_cfg = get_project_config(other_project, section_cache=section_cache).to_dict()
+
+    # Organization-wide sections are computed once and shared by both configs
+    assert get_event_retention.call_count == 1
+    for config in (cfg["config"], other_cfg["config"]):
+        assert config["features"] == ["organizations:profiling"]
+        assert config["eventRetention"] == 90
+        assert config["performanceScore"] == cfg["config"]["performanceScore"]
+
+    # Without a shared cache, sections are computed for every config
+    with mock.patch(
+        "sentry.relay.config.quotas.backend.get_event_retention", return_value=90
+    ) as get_event_retention:
+        get_project_config(default_project)
+        get_project_config(other_project)
+    assert get_event_retention.call_count == 2
+
+
 @django_db_all
 @region_silo_test
 @patch("sentry.dynamic_sampling.rules.biases.boost_latest_releases_bias.apply_dynamic_factor")
@@ -1,8 +1,11 @@
 from unittest import mock
 
+import zstandard
+
 from sentry.relay.projectconfig_cache import redis
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
-from sentry.utils import metrics
+from sentry.utils import json, metrics
 
 
 def test_delete_count(monkeypatch):
@@ -24,3 +27,54 @@ def test_read_write():
     my_key = "fake-dsn-1"
     cache.set_many({my_key: "my-value"})
     assert cache.get(my_key) == "my-value"
+
+
+def make_config(public_key):
+    return {
+        "organizationId": 1,
+        "publicKeys": [{"publicKey": public_key}],
+        "config": {
+            "trustedRelays": [],
+            "performanceScore": {"profiles": [{"name": "Chrome", "weight": 0.15}] * 20},
+        },
+    }
+
+
+@django_db_all
+def test_read_write_shared_sections():
+    cache = redis.RedisProjectConfigCache(shared_sections=True)
+
+    configs = {public_key: make_config(public_key) for public_key in ("dsn-1", "dsn-2")}
+
+    with override_options({"relay.projectconfig-cache.shared-sections-min-size": 100}):
+        cache.set_many(configs)
+
+    stored = json.loads(zstandard.decompress(cache.cluster.get("relayconfig:dsn-1")).decode())
+    assert "performanceScore" not in stored["config"]
+    assert stored["config"]["trustedRelays"] == []
+    (section_key,) = stored[redis.SECTIONS_FIELD].values()
+    assert cache.cluster.exists(section_key)
+
+    # Both keys refer to the same section
+    assert cache.get("dsn-1") == configs["dsn-1"]
+    assert cache.get("dsn-2") == configs["dsn-2"]
+
+    # A config with a missing section is missing as well
+    cache.cluster.delete(section_key)
+    assert cache.get("dsn-1") is None
+
+    # Configs that are not split up are still read
+    cache.set_many({"dsn-3": make_config("dsn-3")})
+    assert cache.get("dsn-3") == make_config("dsn-3")
+
+
+@django_db_all
+def test_shared_sections_require_opt_in():
+    cache = redis.RedisProjectConfigCache()
+
+    with override_options({"relay.projectconfig-cache.shared-sections-min-size": 100}):
+        cache.set_many({"dsn-4": make_config("dsn-4")})
+
+    # Relay reads the stored config directly, so it is kept in full
+    stored = json.loads(zstandard.decompress(cache.cluster.get("relayconfig:dsn-4")).decode())
+    assert stored == make_config("dsn-4")
@@ -16,8 +16,11 @@ from sentry.rules.conditions.event_frequency import (
     EventFrequencyConditionData,
 )
 from sentry.rules.processing.delayed_processing import (  # build_group_to_groupevent,; bulk_fetch_events,; get_condition_group_results,; get_group_to_groupevent,; get_rules_to_fire,; ; ; parse_rulegroup_to_event_data,
+    UniqueCondition,
+    UniqueConditionQuery,
     apply_delayed,
     get_condition_groups,
+    get_condition_query_groups,
     get_rules_to_groups,
     get_rules_to_slow_conditions,
     get_slow_conditions,
@@ -340,6 +343,37 @@ class ProcessDelayedAlertConditionsTest(
         get_condition_groups([rule_1, rule_2], rules_to_groups)  # type: ignore[arg-type]
         assert orig_rules_to_groups == rules_to_groups
 
+    def test_get_condition_query_groups(self):
+        count_condition = self.create_event_frequency_condition(interval="5m")
+        percent_condition = self.create_event_frequency_condition(
+            interval="5m", comparison_type=ComparisonType.PERCENT, comparison_interval="1h"
+        )
+        count_rule = self.create_project_rule(
+            project=self.project, condition_match=[count_condition]
+        )
+        percent_rule = self.create_project_rule(
+            project=self.project, condition_match=[percent_condition]
+        )
+        rules_to_groups = {count_rule.id: {1, 2}, percent_rule.id: {2, 3}}
+
+        condition_groups = get_condition_groups([count_rule, percent_rule], rules_to_groups)  # type: ignore[arg-type]
+        assert {
+            unique_condition: group_ids
+            for unique_condition, (_, group_ids) in condition_groups.items()
+        } == {
+            UniqueCondition(count_condition["id"], "5m", None): {1, 2},  # type: ignore[arg-type]
+            UniqueCondition(percent_condition["id"], "5m", None, "1h"): {2, 3},  # type: ignore[arg-type]
+        }
+
+        # Both conditions share the query for the current window
+        condition_query_groups = get_condition_query_groups(condition_groups)
+        assert {
+            query: group_ids for query, (_, group_ids) in condition_query_groups.items()
+        } == {
+            UniqueConditionQuery(count_condition["id"], "5m", None): {1, 2, 3},  # type: ignore[arg-type]
+            UniqueConditionQuery(percent_condition["id"], "5m", None, "1h"): {2, 3},  # type: ignore[arg-type]
+        }
+
     @patch("sentry.rules.conditions.event_frequency.MIN_SESSIONS_TO_FIRE", 1)
     def test_apply_delayed_rules_to_fire(self):
         """
@@ -521,6 +521,77 @@ class RuleProcessorTest(TestCase, PerformanceIssueTestCase):
             # creates no rows.
             self.run_query_test(rp, 2)
 
+    def test_multiple_rules_single_status_update(self):
+        rule_2 = Rule.objects.create(
+            project=self.group_event.project,
+            data={
+                "conditions": [EVERY_EVENT_COND_DATA],
+                "actions": [EMAIL_ACTION_DATA],
+                "frequency": 60,
+            },
+        )
+        rp = RuleProcessor(
+            self.group_event,
+            is_new=True,
+            is_regression=True,
+            is_new_group_environment=True,
+            has_reappeared=True,
+        )
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as queries:
+            results = list(rp.apply())
+        assert len(results) == 2
+
+        status_updates = [
+            q
+            for q in queries.captured_queries
+            if "grouprulestatus" in str(q) and "UPDATE" in str(q)
+        ]
+        assert len(status_updates) == 1
+        for rule in (self.rule, rule_2):
+            assert RuleFireHistory.objects.filter(rule=rule, group=self.group_event.group).exists()
+
+        # Only the rule with the lower frequency fires again
+        GroupRuleStatus.objects.filter(rule__in=[self.rule, rule_2]).update(
+            last_active=timezone.now() - timedelta(minutes=Rule.DEFAULT_FREQUENCY + 1)
+        )
+        results = list(rp.apply())
+        assert len(results) == 1
+        assert RuleFireHistory.objects.filter(rule=self.rule).count() == 2
+        assert RuleFireHistory.objects.filter(rule=rule_2).count() == 1
+
+    @with_feature("organizations:process-slow-alerts")
+    def test_delayed_rules_enqueued_together(self):
+        self.rule.update(
+            data={
+                "conditions": [EVERY_EVENT_COND_DATA, self.event_frequency_condition],
+                "action_match": "all",
+                "actions": [EMAIL_ACTION_DATA],
+            },
+        )
+        rule_2 = Rule.objects.create(
+            project=self.group_event.project,
+            data={
+                "conditions": [EVERY_EVENT_COND_DATA, self.user_count_condition],
+                "action_match": "all",
+                "actions": [EMAIL_ACTION_DATA],
+            },
+        )
+        rp = RuleProcessor(
+            self.group_event,
+            is_new=True,
+            is_regression=True,
+            is_new_group_environment=True,
+            has_reappeared=True,
+        )
+        results = list(rp.apply())
+        assert len(results) == 0
+
+        value = json.dumps({"event_id": self.group_event.event_id, "occurrence_id": None})
+        assert buffer.backend.get_hash(model=Project, field={"project_id": self.project.id}) == {
+            f"{self.rule.id}:{self.group_event.group.id}": value,
+            f"{rule_2.id}:{self.group_event.group.id}": value,
+        }
+
     @patch(
         "sentry.constants._SENTRY_RULES",
         [
@@ -2170,3 +2170,56 @@ def test_aggregation_options():
         assert get_aggregation_options("c:spans/count@none") == {
             AggregationOption.DISABLE_PERCENTILES: TimeWindow.NINETY_DAYS
         }
+
+
+def test_columns_by_org():
+    other_org_payload = {**counter_payload, "org_id": 2, "tags": {"environment": "staging"}}
+    invalid_payload = {**counter_payload, "type": "x"}
+
+    outer_message = _construct_outer_message(
+        [
+            (counter_payload, counter_headers),
+            (other_org_payload, counter_headers),
+            (invalid_payload, counter_headers),
+            (set_payload, set_headers),
+        ]
+    )
+    batch = IndexerBatch(
+        outer_message,
+        True,
+        False,
+        tags_validator=ReleaseHealthTagsValidator().is_allowed,
+        schema_validator=MetricsSchemaValidator(
+            INGEST_CODEC, RELEASE_HEALTH_SCHEMA_VALIDATION_RULES_OPTION_NAME
+        ).validate,
+    )
+
+    partition = Partition(Topic("topic"), 0)
+    assert batch.invalid_msg_meta == {BrokerMeta(partition, 2)}
+    assert set(batch.columns_by_org) == {(UseCaseID.SESSIONS, 1), (UseCaseID.SESSIONS, 2)}
+
+    columns = batch.columns_by_org[(UseCaseID.SESSIONS, 1)]
+    assert columns.broker_metas == [BrokerMeta(partition, 0), BrokerMeta(partition, 3)]
+    assert columns.names == [counter_payload["name"], set_payload["name"]]
+    assert columns.tags == [counter_payload["tags"], set_payload["tags"]]
+
+    remaining = columns.without({BrokerMeta(partition, 0)})
+    assert remaining.broker_metas == [BrokerMeta(partition, 3)]
+    assert remaining.names == [set_payload["name"]]
+    assert columns.without(set()) is columns
+
+    # Orgs whose messages are all filtered are left out
+    batch.filter_messages([BrokerMeta(partition, 1)])
+    assert batch.extract_strings() == {
+        UseCaseID.SESSIONS: {
+            1: {
+                "c:sessions/session@none",
+                "environment",
+                "errored",
+                "init",
+                "production",
+                "s:sessions/error@none",
+                "session.status",
+            }
+        }
+    }
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.utils import timezone
 
 from sentry.sentry_metrics.indexer.cache import StringIndexerCache
+from sentry.sentry_metrics.indexer.shared_cache import SharedIndexerCache, set_shared_cache
 from sentry.sentry_metrics.use_case_id_registry import UseCaseID
 from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
@@ -240,3 +241,41 @@ def test_is_valid_timestamp() -> None:
 
     assert not indexer_cache._is_valid_timestamp(str(stale_ts))
     assert indexer_cache._is_valid_timestamp(str(new_ts))
+
+
+def test_shared_cache() -> None:
+    shared_cache = SharedIndexerCache.create(64)
+    set_shared_cache(shared_cache)
+    try:
+        cache.clear()
+        namespace = "test"
+        indexer_cache.set_many(namespace, {"spans:1:a": 1})
+        assert shared_cache.get_many(["spans:1:a"]) == {"spans:1:a": 1}
+
+        # Hits in the shared cache do not go to the cache backend
+        cache.clear()
+        assert indexer_cache.get_many(namespace, ["spans:1:a", "spans:1:b"]) == {
+            "spans:1:a": 1,
+            "spans:1:b": None,
+        }
+
+        # Hits in the cache backend are written to the shared cache
+        shared_cache.clear()
+        indexer_cache.set_many(namespace, {"spans:1:b": 2})
+        shared_cache.clear()
+        assert indexer_cache.get_many(namespace, ["spans:1:b"]) == {"spans:1:b": 2}
+        assert shared_cache.get_many(["spans:1:b"]) == {"spans:1:b": 2}
+
+        # Single keys are read through the shared cache as well
+        indexer_cache.set(namespace, "spans:1:c", 3)
+        cache.clear()
+        assert indexer_cache.get(namespace, "spans:1:c") == 3
+        shared_cache.clear()
+        assert indexer_cache.get(namespace, "spans:1:c") is None
+
+        indexer_cache.delete_many(namespace, ["spans:1:b"])
+        assert shared_cache.get_many(["spans:1:b"]) == {}
+        assert indexer_cache.get_many(namespace, ["spans:1:b"]) == {"spans:1:b": None}
+    finally:
+        set_shared_cache(None)
+        shared_cache.close()
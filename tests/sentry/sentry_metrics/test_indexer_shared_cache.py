@@ -0,0 +1,114 @@
+import struct
+import time
+import zlib
+from unittest import mock
+
+import pytest
+
+from sentry.sentry_metrics.indexer.shared_cache import PROBE_LENGTH, SharedIndexerCache
+
+
+@pytest.fixture
+def shared_cache():
+    cache = SharedIndexerCache.create(64)
+    yield cache
+    cache.close()
+
+
+def test_get_set_delete(shared_cache: SharedIndexerCache) -> None:
+    assert shared_cache.get_many(["spans:1:a", "spans:1:b"]) == {}
+
+    shared_cache.set_many({"spans:1:a": 1, "spans:1:b": 2}, ttl=60)
+    assert shared_cache.get_many(["spans:1:a", "spans:1:b", "spans:2:a"]) == {
+        "spans:1:a": 1,
+        "spans:1:b": 2,
+    }
+
+    shared_cache.delete_many(["spans:1:a"])
+    assert shared_cache.get_many(["spans:1:a", "spans:1:b"]) == {"spans:1:b": 2}
+
+    shared_cache.clear()
+    assert shared_cache.get_many(["spans:1:b"]) == {}
+
+
+def test_attach(shared_cache: SharedIndexerCache) -> None:
+    other = SharedIndexerCache.attach(shared_cache.name)
+    try:
+        assert other.num_slots == 64
+
+        shared_cache.set_many({"spans:1:a": 1}, ttl=60)
+        assert other.get_many(["spans:1:a"]) == {"spans:1:a": 1}
+
+        other.set_many({"spans:1:b": 2}, ttl=60)
+        assert shared_cache.get_many(["spans:1:b"]) == {"spans:1:b": 2}
+    finally:
+        other.close()
+
+
+def test_expiry(shared_cache: SharedIndexerCache) -> None:
+    now = time.time()
+    shared_cache.set_many({"spans:1:a": 1}, ttl=10)
+
+    with mock.patch("time.time", return_value=now + 11):
+        assert shared_cache.get_many(["spans:1:a"]) == {}
+
+
+def test_bounded_size() -> None:
+    cache = SharedIndexerCache.create(4)
+    try:
+        cache.set_many({f"spans:1:{i}": i for i in range(100)}, ttl=60)
+        assert len(cache.get_many([f"spans:1:{i}" for i in range(100)])) <= min(4, PROBE_LENGTH)
+    finally:
+        cache.close()
+
+
+def test_torn_slot_is_a_miss(shared_cache: SharedIndexerCache) -> None:
+    shared_cache.set_many({"spans:1:a": 1}, ttl=60)
+    for offset in range(8, len(shared_cache.buf), 32):
+        if any(shared_cache.buf[offset : offset + 32]):
+            # Corrupt the id of the only used slot
+            shared_cache.buf[offset + 16] ^= 0xFF
+
+    assert shared_cache.get_many(["spans:1:a"]) == {}
+
+
+def test_interleaved_writes_are_a_miss() -> None:
+    cache = SharedIndexerCache.create(1)
+    try:
+        cache.set_many({"spans:1:a": 1}, ttl=60)
+        slot_a = bytes(cache.buf[8:])
+        cache.set_many({"spans:1:b": 2}, ttl=60)
+        slot_b = bytes(cache.buf[8:])
+        assert slot_a != slot_b
+
+        # A write of one key that is interrupted by a write of the other
+        # leaves a slot with bytes of both.
+        for split in range(1, len(slot_a)):
+            for first, second in ((slot_a, slot_b), (slot_b, slot_a)):
+                torn = first[:split] + second[split:]
+                if torn in (slot_a, slot_b):
+                    continue
+                cache.buf[8:] = torn
+                assert cache.get_many(["spans:1:a", "spans:1:b"]) == {}
+    finally:
+        cache.close()
+
+
+def test_write_interleaved_with_set_many() -> None:
+    cache = SharedIndexerCache.create(1)
+    crc32 = zlib.crc32
+
+    def interleaved_crc32(data: bytes) -> int:
+        # Another process starts writing the slot while this one checksums it.
+        struct.pack_into("<q", cache.buf, 8 + 16, 2)
+        return crc32(data)
+
+    try:
+        with mock.patch("zlib.crc32", side_effect=interleaved_crc32):
+            cache.set_many({"spans:1:a": 1}, ttl=60)
+        assert cache.get_many(["spans:1:a"]) == {"spans:1:a": 1}
+
+        with mock.patch("zlib.crc32", side_effect=interleaved_crc32):
+            assert cache.get_many(["spans:1:a"]) == {"spans:1:a": 1}
+    finally:
+        cache.close()
@@ -197,6 +197,49 @@ class RedisScriptMinHashIndexBackendTestCase(TestCase):
             == [("4", [1.0, None]), ("1", [1.0, 0.0]), ("2", [1.0, 0.0]), ("3", [1.0, 0.0])]
         )
 
+    def test_record_many(self):
+        timestamp = int(time.time())
+        records = [
+            ("1", [("index:a", "hello world"), ("index:b", "hello world")], None),
+            ("2", [("index:a", "hello world")], None),
+            ("3", [("index:a", "jello world"), ("index:b", "")], None),
+            ("4", [], None),
+        ]
+        self.index.record_many("many", records, timestamp=timestamp)
+        for key, items, _ in records:
+            self.index.record("single", key, items, timestamp=timestamp)
+
+        for index in ("index:a", "index:b"):
+            items = [(index, key) for key in ("1", "2", "3")]
+            many = self.index.export("many", items, timestamp=timestamp)
+            single = self.index.export("single", items, timestamp=timestamp)
+            assert [msgpack.unpackb(data)[:1] for data in many] == [
+                msgpack.unpackb(data)[:1] for data in single
+            ]
+
+        results = self.index.compare("many", "1", [("index:a", 0), ("index:b", 0)])
+        assert results[:2] == [("1", [1.0, 1.0]), ("2", [1.0, 0.0])]
+        assert results[2][0] == "3"
+
+        assert self.index.record_many("many", [("4", [], None)]) == []
+
+    def test_record_many_timestamps(self):
+        timestamp = int(time.time())
+        self.index.record_many(
+            "example",
+            [
+                ("1", [("index", "hello world")], None),
+                ("2", [("index", "hello world")], timestamp - self.index.interval * 24),
+            ],
+            timestamp=timestamp,
+        )
+
+        # The second record is older than the retention period, so it should
+        # not have been written to the current time buckets.
+        assert self.index.compare("example", "1", [("index", 0)], timestamp=timestamp) == [
+            ("1", [1.0])
+        ]
+
     def test_merge(self):
         self.index.record("example", "1", [("index", ["foo", "bar"])])
         self.index.record("example", "2", [("index", ["baz"])])
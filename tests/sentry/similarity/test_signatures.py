@@ -1,5 +1,6 @@
 from collections import Counter
 
+import mmh3
 import pytest
 
 from sentry.similarity.signatures import MinHashSignatureBuilder
@@ -24,3 +25,20 @@ def test_signatures() -> None:
     estimation = results[True] / float(sum(results.values()))
 
     assert similarity == pytest.approx(estimation, 0.1)
+
+
+def test_build_many() -> None:
+    get_signature = MinHashSignatureBuilder(32, 0xFFFF)
+    feature_sets = [
+        ["foo", "bar", "baz"],
+        ["bar"],
+        ["baz", "qux", "foo"],
+    ]
+
+    assert get_signature.build_many(feature_sets) == [
+        [min(mmh3.hash(f, column) % 0xFFFF for f in features) for column in range(32)]
+        for features in feature_sets
+    ]
+
+    with pytest.raises(ValueError):
+        get_signature.build_many([["foo"], []])
@@ -1,4 +1,5 @@
 from sentry.spans.buffer.redis import ProcessSegmentsContext, RedisSpansBuffer, SegmentKey
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 
 
@@ -26,13 +27,11 @@ class TestRedisSpansBuffer:
             ProcessSegmentsContext(timestamp=1710280889, partition=1, should_process_segments=True)
         ]
         assert buffer.client.ttl("segment:segment_1:1:process-segment") == 300
-        assert buffer.client.lrange(
-            "performance-issues:unprocessed-segments:partition-2:1", 0, -1
+        assert buffer.client.zrange(
+            "performance-issues:unprocessed-segments:partition-3:1", 0, -1, withscores=True
         ) == [
-            b"1710280889",
-            b"segment:segment_1:1:process-segment",
-            b"1710280889",
-            b"segment:segment_2:1:process-segment",
+            (b"segment:segment_1:1:process-segment", 1710280889),
+            (b"segment:segment_2:1:process-segment", 1710280889),
         ]
 
         assert buffer.read_and_expire_many_segments(
@@ -89,13 +88,11 @@ class TestRedisSpansBuffer:
         ]
 
         assert buffer.client.ttl("segment:segment_1:1:process-segment") == 300
-        assert buffer.client.lrange(
-            "performance-issues:unprocessed-segments:partition-2:1", 0, -1
+        assert buffer.client.zrange(
+            "performance-issues:unprocessed-segments:partition-3:1", 0, -1, withscores=True
         ) == [
-            b"1710280889",
-            b"segment:segment_1:1:process-segment",
-            b"1710280891",
-            b"segment:segment_3:1:process-segment",
+            (b"segment:segment_1:1:process-segment", 1710280889),
+            (b"segment:segment_3:1:process-segment", 1710280891),
         ]
         assert buffer.read_and_expire_many_segments(["segment:segment_1:1:process-segment"]) == [
             [b"span data", b"span data 2", b"span data 3", b"span data 4", b"span data 5"]
@@ -125,15 +122,12 @@ class TestRedisSpansBuffer:
             latest_ts_by_partition=last_seen_map,
         )
 
-        assert buffer.client.lrange(
-            "performance-issues:unprocessed-segments:partition-2:1", 0, -1
+        assert buffer.client.zrange(
+            "performance-issues:unprocessed-segments:partition-3:1", 0, -1, withscores=True
         ) == [
-            b"1710280890",
-            b"segment:segment_1:1:process-segment",
-            b"1710280891",
-            b"segment:segment_2:1:process-segment",
-            b"1710280892",
-            b"segment:segment_3:1:process-segment",
+            (b"segment:segment_1:1:process-segment", 1710280890),
+            (b"segment:segment_2:1:process-segment", 1710280891),
+            (b"segment:segment_3:1:process-segment", 1710280892),
         ]
 
         segment_keys = buffer.get_unprocessed_segments_and_prune_bucket(1710281011, 1)
@@ -142,9 +136,63 @@ class TestRedisSpansBuffer:
             "segment:segment_2:1:process-segment",
         ]
 
+        assert buffer.client.zrange(
+            "performance-issues:unprocessed-segments:partition-3:1", 0, -1, withscores=True
+        ) == [
+            (b"segment:segment_3:1:process-segment", 1710280892),
+        ]
+
+    @django_db_all
+    def test_get_unprocessed_segments_budget(self):
+        buffer = RedisSpansBuffer()
+        spans_map = {SegmentKey(f"segment_{i}", 1, 1): [b"span data"] for i in range(5)}
+        timestamp_map = {SegmentKey(f"segment_{i}", 1, 1): 1710280890 + i for i in range(5)}
+        buffer.batch_write_and_check_processing(
+            spans_map=spans_map,
+            segment_first_seen_ts=timestamp_map,
+            latest_ts_by_partition={1: 1710280894},
+        )
+
+        with override_options({"standalone-spans.buffer-max-segments-per-poll": 2}):
+            assert buffer.get_unprocessed_segments_and_prune_bucket(1710281013, 1) == [
+                "segment:segment_0:1:process-segment",
+                "segment:segment_1:1:process-segment",
+            ]
+            assert buffer.get_unprocessed_segments_and_prune_bucket(1710281013, 1) == [
+                "segment:segment_2:1:process-segment",
+                "segment:segment_3:1:process-segment",
+            ]
+            assert buffer.get_unprocessed_segments_and_prune_bucket(1710281013, 1) == []
+
+        assert buffer.get_unprocessed_segments_and_prune_bucket(1710281014, 1) == [
+            "segment:segment_4:1:process-segment",
+        ]
+
+    @django_db_all
+    def test_get_unprocessed_segments_drains_legacy_bucket(self):
+        buffer = RedisSpansBuffer()
+        buffer.client.rpush(
+            "performance-issues:unprocessed-segments:partition-2:1",
+            1710280890,
+            "segment:segment_1:1:process-segment",
+            1710280892,
+            "segment:segment_2:1:process-segment",
+        )
+        buffer.batch_write_and_check_processing(
+            spans_map={SegmentKey("segment_3", 1, 1): [b"span data"]},
+            segment_first_seen_ts={SegmentKey("segment_3", 1, 1): 1710280891},
+            latest_ts_by_partition={1: 1710280891},
+        )
+
+        assert buffer.get_unprocessed_segments_and_prune_bucket(1710281011, 1) == [
+            "segment:segment_1:1:process-segment",
+            "segment:segment_3:1:process-segment",
+        ]
         assert buffer.client.lrange(
             "performance-issues:unprocessed-segments:partition-2:1", 0, -1
-        ) == [
-            b"1710280892",
-            b"segment:segment_3:1:process-segment",
+        ) == [b"1710280892", b"segment:segment_2:1:process-segment"]
+
+        assert buffer.get_unprocessed_segments_and_prune_bucket(1710281012, 1) == [
+            "segment:segment_2:1:process-segment",
         ]
+        assert not buffer.client.exists("performance-issues:unprocessed-segments:partition-2:1")
@@ -0,0 +1,59 @@
+from sentry.spans.consumers.detect_performance_issues.tree import NO_PARENT, SegmentTree
+
+
+def span(span_id, parent_span_id=None, start_timestamp_ms=0, is_segment=False, **kwargs):
+    return {
+        "span_id": span_id,
+        "parent_span_id": parent_span_id,
+        "start_timestamp_ms": start_timestamp_ms,
+        "duration_ms": 10,
+        "is_segment": is_segment,
+        **kwargs,
+    }
+
+
+def test_segment_tree():
+    spans = [
+        span("a", is_segment=True, start_timestamp_ms=1000, sentry_tags={"op": "http.server"}),
+        span("b", "a", start_timestamp_ms=1020, sentry_tags={"op": "db"}, description="SELECT 1"),
+        span("c", "a", start_timestamp_ms=1010, sentry_tags={"op": "db"}, description="SELECT 1"),
+        span("d", "missing", start_timestamp_ms=1005),
+        span("b", "c", start_timestamp_ms=1030),
+    ]
+    tree = SegmentTree(spans)
+
+    # The first occurrence of a span id wins
+    assert len(tree) == 4
+    assert [span["span_id"] for span in tree.spans] == ["a", "b", "c", "d"]
+    assert list(tree.parents) == [NO_PARENT, 0, 0, NO_PARENT]
+    assert tree.root == 0
+    assert list(tree.start_timestamps) == [1000, 1020, 1010, 1005]
+
+
+def test_flatten():
+    spans = [
+        span("c", "b", start_timestamp_ms=1020),
+        span("orphan-2", "missing", start_timestamp_ms=1040),
+        span("b", "a", start_timestamp_ms=1010),
+        span("d", "a", start_timestamp_ms=1005),
+        span("orphan-1", "missing", start_timestamp_ms=1030),
+        span("e", "orphan-1", start_timestamp_ms=1035),
+        span("a", is_segment=True, start_timestamp_ms=1000),
+    ]
+
+    flattened = SegmentTree(spans).flatten()
+
+    assert [s["span_id"] for s in flattened] == ["a", "d", "b", "c", "orphan-1", "e", "orphan-2"]
+    # Spans are neither copied nor modified
+    assert flattened[0] is spans[-1]
+    assert "children" not in flattened[0]
+
+
+def test_flatten_without_segment():
+    spans = [
+        span("b", "a", start_timestamp_ms=1010),
+        span("a", "b", start_timestamp_ms=1000),
+        span("c", start_timestamp_ms=990),
+    ]
+
+    assert [s["span_id"] for s in SegmentTree(spans).flatten()] == ["c", "a", "b"]
@@ -59,6 +59,7 @@ from sentry.tasks.merge import merge_groups
 from sentry.tasks.post_process import (
     HIGHER_ISSUE_OWNERS_PER_PROJECT_PER_MIN_RATELIMIT,
     ISSUE_OWNERS_PER_PROJECT_PER_MIN_RATELIMIT,
+    POST_PROCESS_FEATURES,
     feedback_filter_decorator,
     locks,
     post_process_group,
@@ -114,6 +115,20 @@ class BasePostProgressGroupMixin(BaseTestCase, metaclass=abc.ABCMeta):
 
 
 class CorePostProcessGroupTestMixin(BasePostProgressGroupMixin):
+    @patch("sentry.features.prefetch")
+    def test_prefetches_features(self, mock_prefetch):
+        event = self.create_event(data={}, project_id=self.project.id)
+        self.call_post_process_group(
+            is_new=True,
+            is_regression=False,
+            is_new_group_environment=True,
+            event=event,
+        )
+
+        mock_prefetch.assert_called_with(
+            POST_PROCESS_FEATURES, self.project.organization, [self.project]
+        )
+
     @patch("sentry.rules.processing.processor.RuleProcessor")
     @patch("sentry.tasks.servicehooks.process_service_hook")
     @patch("sentry.tasks.sentry_apps.process_resource_change_bound.delay")
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+
+from sentry.testutils.cases import TestCase
+from sentry.tsdb.base import ONE_DAY, ONE_HOUR, ONE_MINUTE, TSDBModel
+from sentry.tsdb.ringbuffer import RingBufferTSDB, RollupBuffer
+
+
+def test_rollup_buffer():
+    buffer = RollupBuffer(3)
+    buffer.incr(10, 2)
+    buffer.incr(10, 1)
+    buffer.incr(11, 5)
+    assert buffer.get_many([10, 11, 12]) == [3, 5, 0]
+
+    # Bucket 13 reuses the slot of bucket 10, which is evicted
+    buffer.incr(13, 4)
+    assert buffer.get_many([10, 11, 12, 13]) == [0, 5, 0, 4]
+
+    buffer.delete(11)
+    assert buffer.get_many([11, 13]) == [0, 4]
+
+
+def test_rollup_buffer_merge():
+    destination = RollupBuffer(3)
+    destination.incr(10, 1)
+    destination.incr(11, 1)
+
+    source = RollupBuffer(3)
+    source.incr(11, 2)
+    source.incr(12, 3)
+    source.incr(13, 4)
+
+    destination.merge(source)
+    assert destination.get_many([10, 11, 12, 13]) == [0, 3, 3, 4]
+
+
+class RingBufferTSDBTest(TestCase):
+    def setUp(self):
+        self.db = RingBufferTSDB(
+            rollups=(
+                # time in seconds, samples to keep
+                (10, 30),  # 5 minutes at 10 seconds
+                (ONE_MINUTE, 120),  # 2 hours at 1 minute
+                (ONE_HOUR, 24),  # 1 days at 1 hour
+                (ONE_DAY, 30),  # 30 days at 1 day
+            ),
+        )
+
+    def test_simple(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+
+        def timestamp(d):
+            t = int(d.timestamp())
+            return t - (t % 3600)
+
+        self.db.incr(TSDBModel.project, 1, dts[0])
+        self.db.incr(TSDBModel.project, 1, dts[1], count=2)
+        self.db.incr(TSDBModel.project, 1, dts[1], environment_id=1)
+        self.db.incr(TSDBModel.project, 1, dts[2])
+        self.db.incr_multi(
+            [(TSDBModel.project, 1), (TSDBModel.project, 2)], dts[3], count=3, environment_id=1
+        )
+        self.db.incr_multi(
+            [(TSDBModel.project, 1), (TSDBModel.project, 2)], dts[3], count=1, environment_id=2
+        )
+
+        results = self.db.get_range(TSDBModel.project, [1], dts[0], dts[-1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 1),
+                (timestamp(dts[1]), 3),
+                (timestamp(dts[2]), 1),
+                (timestamp(dts[3]), 4),
+            ]
+        }
+
+        results = self.db.get_range(TSDBModel.project, [1, 2], dts[0], dts[-1], environment_ids=[1])
+        assert results == {
+            1: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 1),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 3),
+            ],
+            2: [
+                (timestamp(dts[0]), 0),
+                (timestamp(dts[1]), 0),
+                (timestamp(dts[2]), 0),
+                (timestamp(dts[3]), 3),
+            ],
+        }
+
+        results = self.db.get_range(
+            TSDBModel.project, [1, 2], dts[0], dts[-1], environment_ids=[1, 2]
+        )
+        assert results[1][-1] == (timestamp(dts[3]), 4)
+        assert results[2][-1] == (timestamp(dts[3]), 4)
+
+        assert self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1]) == {1: 9, 2: 4}
+        assert self.db.get_sums(
+            TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=1
+        ) == {1: 4, 2: 3}
+
+        self.db.merge(TSDBModel.project, 1, [2], now, environment_ids=[1, 2])
+        assert self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1]) == {1: 13, 2: 0}
+        assert self.db.get_sums(
+            TSDBModel.project, [1, 2], dts[0], dts[-1], environment_id=1
+        ) == {1: 7, 2: 0}
+
+        self.db.delete([TSDBModel.project], [1, 2], dts[0], dts[-1], environment_ids=[1, 2])
+        assert self.db.get_sums(TSDBModel.project, [1, 2], dts[0], dts[-1]) == {1: 0, 2: 0}
+
+    def test_old_buckets_are_evicted(self):
+        now = datetime.now(timezone.utc)
+        old = now - timedelta(days=31)
+
+        self.db.incr(TSDBModel.project, 1, old, count=5)
+        self.db.incr(TSDBModel.project, 1, now)
+
+        assert self.db.get_sums(TSDBModel.project, [1], old, old, rollup=ONE_DAY) == {1: 5}
+
+        # Recording a value 30 days later reuses the daily slot of ``old``
+        self.db.incr(TSDBModel.project, 1, old + timedelta(days=30))
+        assert self.db.get_sums(TSDBModel.project, [1], old, old, rollup=ONE_DAY) == {1: 0}
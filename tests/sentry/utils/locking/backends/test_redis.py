@@ -64,6 +64,27 @@ class RedisBackendTestCaseBase:
         with pytest.raises(Exception):
             self.backend.acquire(key, duration)
 
+    def test_extend(self):
+        key = "lock"
+        full_key = self.backend.prefix_key(key)
+        client = self.backend.get_client(key)
+
+        self.backend.acquire(key, 10)
+        self.backend.extend(key, 60)
+        assert 58 < float(client.ttl(full_key)) <= 60
+        self.backend.release(key)
+
+    def test_extend_fail_on_missing(self):
+        with pytest.raises(Exception):
+            self.backend.extend("missing-key", 60)
+
+    def test_extend_fail_on_conflict(self):
+        key = "lock"
+        self.backend.get_client(key).set(self.backend.prefix_key(key), "someone-elses-uuid")
+
+        with pytest.raises(Exception):
+            self.backend.extend(key, 60)
+
     def test_locked(self):
         key = "lock:testkey"
         duration = 60
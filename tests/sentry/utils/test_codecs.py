@@ -1,6 +1,14 @@
 import pytest
+import zstandard
 
-from sentry.utils.codecs import BytesCodec, JSONCodec, ZlibCodec, ZstdCodec
+from sentry.utils.codecs import (
+    BytesCodec,
+    JSONCodec,
+    OptionalZstdCodec,
+    ZlibCodec,
+    ZstdCodec,
+    ZstdDictCodec,
+)
 
 
 @pytest.mark.parametrize(
@@ -10,6 +18,7 @@ from sentry.utils.codecs import BytesCodec, JSONCodec, ZlibCodec, ZstdCodec
         (BytesCodec("utf8"), "\N{SNOWMAN}", b"\xe2\x98\x83"),
         (ZlibCodec(), b"hello", b"x\x9c\xcbH\xcd\xc9\xc9\x07\x00\x06,\x02\x15"),
         (ZstdCodec(), b"hello", b"(\xb5/\xfd \x05)\x00\x00hello"),
+        (OptionalZstdCodec(), b"hello", b"(\xb5/\xfd \x05)\x00\x00hello"),
     ],
 )
 def test_codec(codec, encoded, decoded):
@@ -22,3 +31,34 @@ def test_codec_chaining() -> None:
 
     assert codec.encode([1, 2, 3]) == b"[1,2,3]"
     assert codec.decode(b"[1,2,3]") == [1, 2, 3]
+
+
+def test_zstd_dict_codec() -> None:
+    samples = [
+        b'{"platform":"python","id":%d,"modules":{"django":"5.0","sentry":"24.1"}}' % i
+        for i in range(1000)
+    ]
+    dictionary = zstandard.ZstdCompressionDict(ZstdDictCodec.train(samples, dict_size=4096))
+    codec = ZstdDictCodec(dictionary)
+
+    encoded = codec.encode(samples[0])
+    assert len(encoded) < len(ZstdCodec().encode(samples[0]))
+    assert zstandard.get_frame_parameters(encoded).dict_id == dictionary.dict_id()
+    assert codec.decode(encoded) == samples[0]
+
+    # Decoding only needs to know about the dictionary, and also handles
+    # frames that were compressed without one.
+    decoder = ZstdDictCodec(dictionaries=[dictionary])
+    assert decoder.decode(encoded) == samples[0]
+    assert decoder.decode(ZstdCodec().encode(b"hello")) == b"hello"
+
+    with pytest.raises(ValueError):
+        ZstdDictCodec().decode(encoded)
+
+
+def test_optional_zstd_codec() -> None:
+    codec = JSONCodec() | BytesCodec() | OptionalZstdCodec()
+
+    assert codec.decode(codec.encode({"foo": "bar"})) == {"foo": "bar"}
+    # Values that were stored without compression are passed through.
+    assert codec.decode(b'{"foo":"bar"}') == {"foo": "bar"}